@@ -1,63 +1,157 @@
 """
 Main application entry point for the Raspberry Pi hardware appliance.
 """
+import functools
 import os
 import sys
 import signal
-from flask import Flask, send_from_directory
+from flask import Flask
 from flask_socketio import SocketIO
 from flask import request
-from flask_socketio import emit
-from app.hardware.coordinator import get_coordinator
+from flask_socketio import emit, join_room, leave_room, rooms
+from app.config import Config
+from app.hardware.coordinator import DEFAULT_TERMINAL, get_coordinator
+from app.hardware.emit_bridge import GREEN_MODES, async_mode_of
+from app.hardware.events import TAIL_BACKLOG
+from app.hardware.notifier import LOG_TAIL_ROOM, terminal_room
+from app.hardware.remote import HardwareUnavailable
+from app.metrics import registry
+from app.models.database import db
+from app.models.ledger import check_idempotency_key, ledger, parse_withdrawal
+
+SOCKETIO_HANDLER_SECONDS = registry.histogram(
+    'appliance_socketio_handler_seconds', 'Time spent in Socket.IO event handlers', labels=('event',))
 
 # Add project root to Python path
 sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
 
-def create_app():
-    app = Flask(__name__, static_folder='static', static_url_path='/static')
+def create_app(async_mode=None, client_manager=None):
+    """
+    Args:
+        async_mode (str): threading, eventlet or gevent (defaults to
+            Config.SOCKETIO_ASYNC_MODE); green modes expect the standard
+            library to be patched already (see run.py)
+        client_manager: Socket.IO client manager shared with other
+            processes; web workers default to the broker's UnixSocketManager
+    """
+    # The React build is served by the API blueprint (app/api/assets.py)
+    app = Flask(__name__, static_folder=None)
     app.config['SECRET_KEY'] = 'change-this-in-production'
 
-    socketio = SocketIO(app, cors_allowed_origins="*", async_mode="threading")
+    options = {}
+    if client_manager is None and Config.PROCESS_ROLE == 'web':
+        from app.broker import UnixSocketManager
+        client_manager = UnixSocketManager(Config.BROKER_SOCKET)
+    if client_manager is not None:
+        # Workers share one port without sticky sessions, so a client has to
+        # stay on a single connection: WebSocket only
+        options['client_manager'] = client_manager
+        options['transports'] = ['websocket']
+
+    socketio = SocketIO(app, cors_allowed_origins="*", async_mode=async_mode or Config.SOCKETIO_ASYNC_MODE, **options)
+
+    if client_manager is not None:
+        # Receive broker messages before the first client connects
+        socketio.server.manager_initialized = True
+        client_manager.initialize()
+
+    # Adding users waits for the KDF pool inside request handlers
+    db.hasher.sleep = socketio.sleep if async_mode_of(socketio) in GREEN_MODES else None
 
     # Register API routes
     from app.api.routes import api_bp
     app.register_blueprint(api_bp)
 
-    # Serve React frontend
-    @app.route('/')
-    def index():
-        return send_from_directory(app.static_folder, 'index.html')
+    def _subscribe(terminal_id):
+        # A client follows exactly one terminal's session events
+        room = terminal_room(terminal_id)
+        for joined in rooms():
+            if joined != room and joined.startswith(terminal_room('')):
+                leave_room(joined)
+        join_room(room)
+
+    def measured(event):
+        # Handlers must accept every argument Flask-SocketIO passes (connect
+        # gets auth): on a TypeError it calls again without, timing it twice
+        seconds = SOCKETIO_HANDLER_SECONDS.labels(event)
+
+        def decorator(handler):
+            @functools.wraps(handler)
+            def timed_handler(*args):
+                with seconds.time():
+                    return handler(*args)
+            return timed_handler
+        return decorator
 
     @socketio.on('connect')
-    def handle_connect():
+    @measured('connect')
+    def handle_connect(auth=None):
+        # Kiosks pick their terminal with ?terminal=<id> on the Socket.IO URL
+        _subscribe(request.args.get('terminal') or DEFAULT_TERMINAL)
         print('UI connected')
 
+    @socketio.on('join_terminal')
+    @measured('join_terminal')
+    def handle_join_terminal(data):
+        # expected payload: { 'terminal_id': 'kiosk-2' }
+        terminal_id = data.get('terminal_id') if data else None
+        if not terminal_id:
+            emit('terminal_joined', {'error': 'Missing terminal_id'}, room=request.sid)
+            return
+        _subscribe(str(terminal_id))
+        emit('terminal_joined', {'terminal_id': str(terminal_id)}, room=request.sid)
+
+    # Live log of auth and transaction events
+    @socketio.on('log_tail')
+    @measured('log_tail')
+    def handle_log_tail(data=None):
+        # expected payload: { 'since': <seq of the last event seen> } to resume,
+        # or { 'limit': 20 } for the newest events (oldest first) to start with
+        data = data if isinstance(data, dict) else {}
+        since = data.get('since')
+        limit = data.get('limit', TAIL_BACKLOG)
+        if (since is not None and type(since) is not int) or type(limit) is not int or limit < 0:
+            emit('log_tail_backlog', {'error': 'since and limit must be integers'}, room=request.sid)
+            return
+        coordinator = get_coordinator(socketio)
+
+        # Join before reading the backlog: an event recorded in between is
+        # sent twice (clients drop seq they have seen) instead of never
+        join_room(LOG_TAIL_ROOM)
+        try:
+            if since is not None:
+                backlog = coordinator.events_since(since)
+            else:
+                events = coordinator.recent_events(limit)[::-1]
+                backlog = {'events': events, 'last_seq': coordinator.events.last_seq, 'missed': False}
+        except HardwareUnavailable:
+            emit('log_tail_backlog', {'error': 'Hardware unavailable'}, room=request.sid)
+            return
+        emit('log_tail_backlog', backlog, room=request.sid)
+
+    @socketio.on('log_untail')
+    @measured('log_untail')
+    def handle_log_untail(data=None):
+        leave_room(LOG_TAIL_ROOM)
+
     @socketio.on('disconnect')
+    @measured('disconnect')
     def handle_disconnect():
         print('UI disconnected')
 
     # Handle balance inquiries from the frontend
     @socketio.on('balance_request')
+    @measured('balance_request')
     def handle_balance_request(data):
         # expected payload: { 'account_id': '1234' }
         account_id = data.get('account_id') if data else None
         coordinator = get_coordinator(socketio)
 
-        # Simulated accounts (mirror of api routes)
-        accounts = {
-            '1234': {
-                'name': 'John Doe',
-                'accountNumber': '**** **** **** 1234',
-                'balance': 1250.75,
-                'cardUid': '1234'
-            }
-        }
-
-        if not account_id or account_id not in accounts:
+        balance = ledger.get_balance(account_id) if account_id else None
+        if balance is None:
             emit('balance_response', {'error': 'Account not found'}, room=request.sid)
             return
 
-        balance = accounts[account_id]['balance']
         # Print receipt for balance inquiry via hardware printer
         try:
             coordinator.printer.print_transaction_receipt(account_id, 'Balance Inquiry', 0.0, balance)
@@ -68,46 +162,44 @@ def create_app():
 
     # Handle withdrawal requests from the frontend
     @socketio.on('withdraw')
+    @measured('withdraw')
     def handle_withdraw(data):
-        # expected payload: { 'account_id': '1234', 'amount': 20.0 }
-        account_id = data.get('account_id') if data else None
-        amount = float(data.get('amount') or 0)
+        # expected payload: { 'account_id': '1234', 'amount': 20.0, 'idempotency_key': optional }
+        data = data if isinstance(data, dict) else {}
+        account_id = data.get('account_id')
         coordinator = get_coordinator(socketio)
 
-        # Simulated accounts (no persistence)
-        accounts = {
-            '1234': {
-                'name': 'John Doe',
-                'accountNumber': '**** **** **** 1234',
-                'balance': 1250.75,
-                'cardUid': '1234'
-            }
-        }
-
-        if not account_id or account_id not in accounts:
+        if not account_id or ledger.get_account(account_id) is None:
             emit('transaction_result', {'success': False, 'message': 'Account not found'}, room=request.sid)
             return
 
-        if amount <= 0:
-            emit('transaction_result', {'success': False, 'message': 'Invalid amount'}, room=request.sid)
+        _, amount, error = parse_withdrawal(data)
+        if error is None and amount <= 0:
+            error = 'Invalid amount'
+        if error is None:
+            key, error = check_idempotency_key(data.get('idempotency_key'))
+        if error:
+            emit('transaction_result', {'success': False, 'message': error}, room=request.sid)
             return
 
-        acct = accounts[account_id]
-        new_balance = acct['balance'] - amount
-        success = new_balance >= 0
-        message = 'Transaction successful' if success else 'Insufficient funds'
+        result = ledger.withdraw(account_id, amount, key)
+        coordinator.record_transaction(account_id, amount, result)
+        success = result['success']
+        message = result['message']
 
-        # Print transaction receipt
-        try:
-            coordinator.printer.print_transaction_receipt(account_id, 'Withdrawal', amount, new_balance if success else acct['balance'])
-        except Exception:
-            pass
+        # Print transaction receipt (a replayed retry was printed the first
+        # time; without a balance nothing was debited or declined)
+        if not result['replayed'] and result['balance'] is not None:
+            try:
+                coordinator.printer.print_transaction_receipt(account_id, 'Withdrawal', amount, result['balance'])
+            except Exception:
+                pass
 
         emit('transaction_result', {
             'success': success,
             'account_id': account_id,
             'amount': amount,
-            'balance': new_balance if success else acct['balance'],
+            'balance': result['balance'],
             'message': message
         }, room=request.sid)
 
@@ -123,6 +215,7 @@ if __name__ == '__main__':
     from app.hardware.rfid_reader import RFIDReader
     from app.hardware.keypad import Keypad
     from app.hardware.coordinator import get_coordinator
+    from app.models.database import db
 
     # Coordinator controls authentication flow
     coordinator = get_coordinator(socketio)
@@ -137,12 +230,16 @@ if __name__ == '__main__':
     # Start hardware threads
     rfid_reader.start()
     keypad.start()
+    coordinator.printer.start()
+    db.retention.start()
 
     # Graceful shutdown
     def shutdown(sig, frame):
         print("Shutting down...")
         rfid_reader.stop()
         keypad.stop()
+        coordinator.shutdown()
+        db.close()
         sys.exit(0)
 
     signal.signal(signal.SIGINT, shutdown)
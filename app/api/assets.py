@@ -0,0 +1,210 @@
+"""
+Static asset serving for the React build.
+
+- Precompressed variants (file.js.br, file.js.gz, written at build time by
+  tools/compress_static.py) are chosen from the request's Accept-Encoding
+- Hashed bundle names (main.051b301b.js) never change content, so they are
+  cached by browsers for a year; everything else is revalidated
+- Every representation has a strong ETag (a hash of its bytes) and
+  If-None-Match is answered with 304
+- Small, frequently requested files are kept in an in-memory LRU
+"""
+import gzip
+import hashlib
+import mimetypes
+import os
+import re
+import threading
+from collections import OrderedDict
+from flask import Response, request, send_file
+from werkzeug.security import safe_join
+
+try:
+    import brotli
+except ImportError:
+    brotli = None
+
+# Variants in order of preference, with the suffix of their file
+ENCODINGS = (('br', '.br'), ('gzip', '.gz'))
+COMPRESSIBLE = ('.js', '.css', '.html', '.json', '.map', '.txt', '.svg', '.ico')
+# CRA content hashes: main.051b301b.js, 453.411c268b.chunk.js, main.c77f90d8.css.map
+HASHED_NAME = re.compile(r'\.[0-9a-f]{8,}\.(chunk\.)?(js|css)(\.map)?$')
+IMMUTABLE = 'public, max-age=31536000, immutable'
+REVALIDATE = 'no-cache'
+
+
+class _Representation:
+    __slots__ = ('path', 'encoding', 'size', 'mtime_ns', 'etag')
+
+    def __init__(self, path, encoding, stat, etag):
+        self.path = path
+        self.encoding = encoding
+        self.size = stat.st_size
+        self.mtime_ns = stat.st_mtime_ns
+        self.etag = etag
+
+
+class StaticAssets:
+    def __init__(self, root, cache_bytes=8 * 1024 * 1024, max_cached_file=None):
+        """
+        Args:
+            root (str): Build directory (index.html, static/js, ...)
+            cache_bytes (int): Memory for cached file contents (0 disables)
+            max_cached_file (int): Larger files are streamed from disk
+                (defaults to a quarter of cache_bytes)
+        """
+        self.root = os.path.abspath(root)
+        self.cache_bytes = cache_bytes
+        self.max_cached_file = max_cached_file if max_cached_file is not None else cache_bytes // 4
+        self._lock = threading.Lock()
+        self._meta = {}  # file path -> _Representation (revalidated by mtime and size)
+        self._cache = OrderedDict()  # file path -> bytes, least recently used first
+        self._cached_bytes = 0
+        self.counters = {
+            'requests': 0,
+            'not_modified': 0,
+            'cache_hits': 0,
+            'cache_misses': 0,
+            'br': 0,
+            'gzip': 0,
+            'identity': 0
+        }
+
+    def response(self, path):
+        """
+        Build the response for a file below the root.
+
+        Returns:
+            Response or None if there is no such file
+        """
+        full_path = safe_join(self.root, path)
+        if full_path is None or not os.path.isfile(full_path):
+            return None
+
+        representation = self._negotiate(full_path)
+        headers = {
+            'ETag': f'"{representation.etag}"',
+            'Cache-Control': IMMUTABLE if HASHED_NAME.search(path) else REVALIDATE
+        }
+        if path.endswith(COMPRESSIBLE):
+            headers['Vary'] = 'Accept-Encoding'
+
+        self._count('requests')
+        if representation.etag in request.if_none_match:
+            self._count('not_modified')
+            return Response(status=304, headers=headers)
+
+        self._count(representation.encoding)
+        mimetype = mimetypes.guess_type(full_path)[0] or 'application/octet-stream'
+        body = self._cached_body(representation)
+        if body is not None:
+            response = Response(body, mimetype=mimetype)
+        else:
+            response = send_file(representation.path, mimetype=mimetype, conditional=False, etag=False)
+        response.headers.update(headers)
+        if representation.encoding != 'identity':
+            response.headers['Content-Encoding'] = representation.encoding
+        return response
+
+    def _negotiate(self, full_path):
+        accepted = request.accept_encodings
+        for encoding, suffix in ENCODINGS:
+            if accepted[encoding] and os.path.isfile(full_path + suffix):
+                return self._representation(full_path + suffix, encoding)
+        return self._representation(full_path, 'identity')
+
+    def _representation(self, path, encoding):
+        stat = os.stat(path)
+        with self._lock:
+            known = self._meta.get(path)
+        if known is not None and known.mtime_ns == stat.st_mtime_ns and known.size == stat.st_size:
+            return known
+
+        # New or rebuilt file: hash its bytes once for the strong ETag
+        digest = hashlib.sha256()
+        with open(path, 'rb') as f:
+            for chunk in iter(lambda: f.read(65536), b''):
+                digest.update(chunk)
+        representation = _Representation(path, encoding, stat, digest.hexdigest()[:32])
+        with self._lock:
+            self._meta[path] = representation
+            self._evict(path)
+        return representation
+
+    def _cached_body(self, representation):
+        if representation.size > self.max_cached_file:
+            return None
+        path = representation.path
+        with self._lock:
+            body = self._cache.get(path)
+            if body is not None:
+                self._cache.move_to_end(path)
+                self.counters['cache_hits'] += 1
+                return body
+            self.counters['cache_misses'] += 1
+
+        with open(path, 'rb') as f:
+            body = f.read()
+        with self._lock:
+            self._evict(path)
+            self._cache[path] = body
+            self._cached_bytes += len(body)
+            while self._cached_bytes > self.cache_bytes:
+                _, dropped = self._cache.popitem(last=False)
+                self._cached_bytes -= len(dropped)
+        return body
+
+    def _evict(self, path):
+        # Called with self._lock held
+        body = self._cache.pop(path, None)
+        if body is not None:
+            self._cached_bytes -= len(body)
+
+    def _count(self, name):
+        with self._lock:
+            self.counters[name] += 1
+
+    def stats(self):
+        with self._lock:
+            stats = dict(self.counters)
+            stats['cached_files'] = len(self._cache)
+            stats['cached_bytes'] = self._cached_bytes
+            stats['cache_limit_bytes'] = self.cache_bytes
+        return stats
+
+
+def precompress(root, min_size=1024):
+    """
+    Write .gz (and .br, if the brotli package is installed) next to every
+    compressible file below root that is worth compressing.
+
+    Variants that would not be smaller than the original are skipped, and
+    stale variants are rewritten.
+
+    Returns:
+        list: (path, encoding, original size, compressed size) per variant written
+    """
+    written = []
+    for directory, _, files in os.walk(root):
+        for name in files:
+            if not name.endswith(COMPRESSIBLE):
+                continue
+            path = os.path.join(directory, name)
+            if os.path.getsize(path) < min_size:
+                continue
+            with open(path, 'rb') as f:
+                data = f.read()
+            variants = [('gzip', '.gz', lambda raw: gzip.compress(raw, compresslevel=9, mtime=0))]
+            if brotli is not None:
+                variants.insert(0, ('br', '.br', lambda raw: brotli.compress(raw, quality=11)))
+            for encoding, suffix, compress in variants:
+                target = path + suffix
+                if os.path.exists(target) and os.path.getmtime(target) >= os.path.getmtime(path):
+                    continue
+                compressed = compress(data)
+                if len(compressed) >= len(data):
+                    continue
+                with open(target, 'wb') as f:
+                    f.write(compressed)
+                written.append((path, encoding, len(data), len(compressed)))
+    return written
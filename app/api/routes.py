@@ -1,15 +1,47 @@
 """
 API routes for the Raspberry Pi hardware appliance.
 """
-import time
-from flask import Blueprint, jsonify, request, send_from_directory
+import base64
+import csv
+import io
+import json
+from datetime import datetime, timezone
+from flask import Blueprint, Response, current_app, jsonify, request
 from flask_socketio import emit
 from app.models.database import db
+from app.models.ledger import check_idempotency_key, ledger, parse_withdrawal
+from app.models.pinhash import PinHasherBusy
+from app.models.provisioning import CONFLICT_POLICIES, parse_csv, parse_ndjson
 from app.hardware.coordinator import get_coordinator
+from app.hardware.emit_bridge import GREEN_MODES, async_mode_of
+from app.hardware.events import EVENT_TYPES, TAIL_BACKLOG
+from app.hardware.remote import HardwareUnavailable
+from app.api.assets import StaticAssets
+from app.config import Config
+from app.metrics import CONTENT_TYPE, registry, render, with_labels
+from app.startup import timeline
 import os
 
 api_bp = Blueprint('api', __name__)
 
+# React build (frontend/build.sh copies it here and precompresses it)
+static_assets = StaticAssets(
+    os.path.join(os.path.dirname(__file__), '..', 'static'),
+    cache_bytes=Config.STATIC_CACHE_BYTES
+)
+
+@api_bp.errorhandler(HardwareUnavailable)
+def hardware_unavailable(e):
+    """A web worker could not reach the hardware process."""
+    return jsonify({'error': f'Hardware process unavailable: {e}'}), 503
+
+@api_bp.errorhandler(PinHasherBusy)
+def pin_hasher_busy(e):
+    """Too many PIN hashes in flight (adding a user or changing a PIN)."""
+    response = jsonify({'error': 'System busy, please try again'})
+    response.headers['Retry-After'] = '1'
+    return response, 503
+
 @api_bp.route('/api/status', methods=['GET'])
 def get_status():
     """Get system status."""
@@ -18,6 +50,87 @@ def get_status():
         'message': 'System is running'
     })
 
+@api_bp.route('/api/metrics', methods=['GET'])
+def get_metrics():
+    """Counters, gauges and latency histograms in the Prometheus text format."""
+    families = registry.collect()
+    if Config.PROCESS_ROLE == 'web':
+        # The auth pipeline and hardware run in the hardware process; label
+        # each process's series so workers answering in turn do not clash
+        coordinator = get_coordinator(current_app.extensions['socketio'])
+        families = (with_labels(coordinator.get_metrics(), process='hardware')
+                    + with_labels(families, process=f'web-{os.getpid()}'))
+    return Response(render(families), content_type=CONTENT_TYPE)
+
+@api_bp.route('/api/db/stats', methods=['GET'])
+def get_db_stats():
+    """Get database connection counts and per-query timings."""
+    return jsonify(db.get_stats())
+
+@api_bp.route('/api/auth/pipeline', methods=['GET'])
+def get_auth_pipeline_stats():
+    """Get per-stage latency and queue counters of the authentication pipeline."""
+    coordinator = get_coordinator(current_app.extensions['socketio'])
+    return jsonify(coordinator.get_stats())
+
+@api_bp.route('/api/auth/sessions', methods=['GET'])
+def get_auth_sessions():
+    """List open PIN-entry sessions and session counters."""
+    coordinator = get_coordinator(current_app.extensions['socketio'])
+    return jsonify({
+        'sessions': coordinator.list_sessions(),
+        'stats': coordinator.get_session_stats()
+    })
+
+@api_bp.route('/api/notifications/stats', methods=['GET'])
+def get_notification_stats():
+    """Get Socket.IO messages per second, per-client fan-out and merged PIN updates."""
+    coordinator = get_coordinator(current_app.extensions['socketio'])
+    return jsonify(coordinator.get_notification_stats())
+
+@api_bp.route('/api/hardware/rfid', methods=['GET'])
+def get_rfid_stats():
+    """Get the hardware backend, RFID polling rate, duplicate suppression and tap-to-request_pin latency."""
+    stats = get_coordinator(current_app.extensions['socketio']).get_rfid_stats()
+    if stats is None:
+        return jsonify({'error': 'RFID reader not running'}), 404
+    return jsonify(stats)
+
+@api_bp.route('/api/printer/jobs', methods=['GET'])
+def get_print_jobs():
+    """List print jobs, newest first (optional status and limit filters)."""
+    spooler = get_coordinator(current_app.extensions['socketio']).printer.spooler
+    status = request.args.get('status')
+    
+    try:
+        limit = min(int(request.args.get('limit', 50)), 500)
+    except ValueError:
+        return jsonify({'error': 'limit must be an integer'}), 400
+    
+    return jsonify({
+        'counts': spooler.counts(),
+        'jobs': spooler.get_jobs(status, limit)
+    })
+
+@api_bp.route('/api/printer/jobs/<int:job_id>', methods=['GET'])
+def get_print_job(job_id):
+    """Get the status of one print job."""
+    spooler = get_coordinator(current_app.extensions['socketio']).printer.spooler
+    job = spooler.get_job(job_id)
+    
+    if job is None:
+        return jsonify({'error': 'Print job not found'}), 404
+    return jsonify(job)
+
+@api_bp.route('/api/printer/jobs/<int:job_id>/retry', methods=['POST'])
+def retry_print_job(job_id):
+    """Requeue a failed print job."""
+    spooler = get_coordinator(current_app.extensions['socketio']).printer.spooler
+    
+    if spooler.retry_job(job_id):
+        return jsonify({'message': 'Print job requeued'})
+    return jsonify({'error': 'No failed print job with that id'}), 404
+
 @api_bp.route('/api/users', methods=['POST'])
 def add_user():
     """Add a new user."""
@@ -39,36 +152,300 @@ def add_user():
     else:
         return jsonify({'error': 'RFID UID already exists'}), 409
 
+@api_bp.route('/api/users/import', methods=['POST'])
+def import_users():
+    """
+    Add many users from a streamed CSV or NDJSON body.
+    
+    CSV needs a header row naming rfid_uid and pin (or pin_hash, as written
+    by /api/users/export?hashes=true); NDJSON is one such object per line.
+    The format comes from ?format= or the Content-Type. Rows that cannot be
+    imported are reported by line and skipped; ?on_conflict=update replaces
+    the PIN of cards that already exist instead of reporting them.
+    """
+    import_format = request.args.get('format')
+    if import_format is None:
+        import_format = 'csv' if request.mimetype == 'text/csv' else 'ndjson'
+    if import_format not in ('ndjson', 'csv'):
+        return jsonify({'error': 'format must be ndjson or csv'}), 400
+    
+    on_conflict = request.args.get('on_conflict', 'skip')
+    if on_conflict not in CONFLICT_POLICIES:
+        return jsonify({'error': f"on_conflict must be one of {', '.join(CONFLICT_POLICIES)}"}), 400
+    
+    parse = parse_csv if import_format == 'csv' else parse_ndjson
+    report = db.import_users(parse(request.stream), on_conflict)
+    return jsonify(report.to_dict())
+
+@api_bp.route('/api/users/export', methods=['GET'])
+def export_users():
+    """
+    Stream every user as NDJSON (default) or CSV, in enrollment order.
+    
+    PIN hashes are left out unless ?hashes=true; an export with hashes can
+    be imported on another appliance as is.
+    """
+    export_format = request.args.get('format', 'ndjson').lower()
+    if export_format not in ('ndjson', 'csv'):
+        return jsonify({'error': 'format must be ndjson or csv'}), 400
+    include_hashes = request.args.get('hashes', 'false').lower() in ('1', 'true', 'yes')
+    columns = USER_EXPORT_COLUMNS + (['pin_hash'] if include_hashes else [])
+    
+    def generate_ndjson():
+        lines = []
+        for user in db.iter_users(include_hashes):
+            lines.append(json.dumps(user))
+            if len(lines) >= 500:
+                yield '\n'.join(lines) + '\n'
+                lines = []
+        if lines:
+            yield '\n'.join(lines) + '\n'
+    
+    def generate_csv():
+        buffer = io.StringIO()
+        writer = csv.DictWriter(buffer, fieldnames=columns)
+        writer.writeheader()
+        for user in db.iter_users(include_hashes):
+            writer.writerow(user)
+            if buffer.tell() >= 65536:
+                yield buffer.getvalue()
+                buffer.seek(0)
+                buffer.truncate()
+        yield buffer.getvalue()
+    
+    if export_format == 'csv':
+        return Response(generate_csv(), mimetype='text/csv', headers={
+            'Content-Disposition': 'attachment; filename=users.csv'
+        })
+    return Response(generate_ndjson(), mimetype='application/x-ndjson')
+
+LOG_PAGE_SIZE = 50
+LOG_PAGE_SIZE_MAX = 500
+LOG_STATS_MAX_HOURS = 24 * 31
+LOG_EXPORT_COLUMNS = ['id', 'rfid_uid', 'success', 'message', 'created_at']
+USER_EXPORT_COLUMNS = ['rfid_uid', 'created_at']
+
+def _encode_cursor(position):
+    created_at, log_id = position
+    return base64.urlsafe_b64encode(f'{created_at}|{log_id}'.encode()).decode()
+
+def _decode_cursor(value):
+    created_at, log_id = base64.urlsafe_b64decode(value.encode()).decode().rsplit('|', 1)
+    return created_at, int(log_id)
+
+def _parse_time(value):
+    """
+    Normalize an ISO 8601 time to the UTC 'YYYY-MM-DD HH:MM:SS' form stored
+    in SQLite. Times without an offset are taken to be UTC already.
+    """
+    parsed = datetime.fromisoformat(value.replace('Z', '+00:00'))
+    if parsed.tzinfo is not None:
+        parsed = parsed.astimezone(timezone.utc).replace(tzinfo=None)
+    return parsed.strftime('%Y-%m-%d %H:%M:%S')
+
+def _parse_bool(value):
+    lowered = value.lower()
+    if lowered in ('1', 'true', 'yes'):
+        return True
+    if lowered in ('0', 'false', 'no'):
+        return False
+    raise ValueError(f'invalid boolean: {value}')
+
+def _log_filters_from_request():
+    """Read the rfid_uid, success, since and until query parameters."""
+    args = request.args
+    return {
+        'rfid_uid': args.get('rfid_uid'),
+        'success': _parse_bool(args['success']) if 'success' in args else None,
+        'since': _parse_time(args['since']) if 'since' in args else None,
+        'until': _parse_time(args['until']) if 'until' in args else None
+    }
+
 @api_bp.route('/api/logs', methods=['GET'])
 def get_logs():
-    """Get authentication logs."""
-    conn = db.get_connection()
-    cursor = conn.cursor()
+    """
+    Get authentication logs, newest first.
+    
+    Query parameters: limit, cursor (from the X-Next-Cursor header of the
+    previous page), rfid_uid, success, since and until (ISO 8601).
+    """
+    try:
+        limit = min(int(request.args.get('limit', LOG_PAGE_SIZE)), LOG_PAGE_SIZE_MAX)
+        before = _decode_cursor(request.args['cursor']) if 'cursor' in request.args else None
+        filters = _log_filters_from_request()
+    except ValueError as e:
+        return jsonify({'error': f'Invalid query parameter: {e}'}), 400
+    
+    if limit < 1:
+        return jsonify({'error': 'limit must be positive'}), 400
+    
+    logs, next_position = db.get_logs(limit, before, **filters)
     
-    cursor.execute('SELECT * FROM logs ORDER BY created_at DESC LIMIT 50')
-    logs = [dict(row) for row in cursor.fetchall()]
+    response = jsonify(logs)
+    if next_position is not None:
+        response.headers['X-Next-Cursor'] = _encode_cursor(next_position)
+    return response
+
+@api_bp.route('/api/logs/stats', methods=['GET'])
+def get_log_stats():
+    """
+    Get failure rate, taps per hour and top failing cards.
+    
+    Answered from the rollup tables, so the cost does not grow with the
+    raw log history. Query parameters: hours (default 24), top (default 5).
+    """
+    try:
+        hours = int(request.args.get('hours', 24))
+        top = int(request.args.get('top', 5))
+    except ValueError as e:
+        return jsonify({'error': f'Invalid query parameter: {e}'}), 400
+    
+    if not 1 <= hours <= LOG_STATS_MAX_HOURS or not 1 <= top <= 100:
+        return jsonify({'error': f'hours must be 1-{LOG_STATS_MAX_HOURS} and top 1-100'}), 400
+    
+    return jsonify(db.get_log_stats(hours, top))
+
+@api_bp.route('/api/logs/export', methods=['GET'])
+def export_logs():
+    """
+    Stream every matching log event as NDJSON (default) or CSV.
+    
+    Accepts the same filters as /api/logs; rows are generated as they are
+    read, so large exports never load the whole table into memory.
+    """
+    export_format = request.args.get('format', 'ndjson').lower()
+    if export_format not in ('ndjson', 'csv'):
+        return jsonify({'error': 'format must be ndjson or csv'}), 400
+    
+    try:
+        filters = _log_filters_from_request()
+    except ValueError as e:
+        return jsonify({'error': f'Invalid query parameter: {e}'}), 400
+    
+    def generate_ndjson():
+        for row in db.iter_logs(**filters):
+            yield json.dumps(row) + '\n'
+    
+    def generate_csv():
+        buffer = io.StringIO()
+        writer = csv.DictWriter(buffer, fieldnames=LOG_EXPORT_COLUMNS)
+        writer.writeheader()
+        for row in db.iter_logs(**filters):
+            writer.writerow(row)
+            yield buffer.getvalue()
+            buffer.seek(0)
+            buffer.truncate()
+        yield buffer.getvalue()
+    
+    if export_format == 'csv':
+        return Response(generate_csv(), mimetype='text/csv', headers={
+            'Content-Disposition': 'attachment; filename=logs.csv'
+        })
+    return Response(generate_ndjson(), mimetype='application/x-ndjson')
+
+@api_bp.route('/api/logs/recent', methods=['GET'])
+def get_recent_events():
+    """
+    Get the newest auth and transaction events from memory, newest first.
+    
+    Query parameters: limit (default 50), type (auth or transaction).
+    Only the last EVENT_RING_SIZE events are held; older history is in
+    /api/logs.
+    """
+    try:
+        limit = int(request.args.get('limit', LOG_PAGE_SIZE))
+    except ValueError as e:
+        return jsonify({'error': f'Invalid query parameter: {e}'}), 400
+    
+    event_type = request.args.get('type')
+    if limit < 1 or (event_type is not None and event_type not in EVENT_TYPES):
+        return jsonify({'error': f"limit must be positive and type one of {', '.join(EVENT_TYPES)}"}), 400
+    
+    coordinator = get_coordinator(current_app.extensions['socketio'])
+    events = coordinator.recent_events(min(limit, Config.EVENT_RING_SIZE), event_type)
+    return jsonify({'events': events, 'last_seq': coordinator.events.last_seq})
+
+def _sse(event, data, event_id=None):
+    """One Server-Sent Events message."""
+    message = f'id: {event_id}\n' if event_id is not None else ''
+    return message + f'event: {event}\ndata: {json.dumps(data)}\n\n'
+
+@api_bp.route('/api/logs/tail', methods=['GET'])
+def tail_events():
+    """
+    Stream auth and transaction events as Server-Sent Events, for clients
+    that cannot use the log_tail Socket.IO subscription.
+    
+    Each message's id is the event's sequence number, so an EventSource
+    resumes from where it was after a reconnect (Last-Event-ID); other
+    clients pass ?since=<seq>. Without either the stream starts with the
+    newest events (limit, default 50). A "missed" message means events
+    after the given sequence number were no longer held.
+    """
+    try:
+        since = request.headers.get('Last-Event-ID') or request.args.get('since')
+        since = int(since) if since is not None else None
+        limit = int(request.args.get('limit', TAIL_BACKLOG))
+    except ValueError as e:
+        return jsonify({'error': f'Invalid query parameter: {e}'}), 400
     
-    conn.close()
+    socketio = current_app.extensions['socketio']
+    coordinator = get_coordinator(socketio)
+    if since is not None:
+        backlog = coordinator.events_since(since)
+    else:
+        backlog = {'events': coordinator.recent_events(max(limit, 0))[::-1], 'missed': False}
+        backlog['last_seq'] = coordinator.events.last_seq
+    # The ring is filled from OS threads; a green thread has to poll it
+    sleep = socketio.sleep if async_mode_of(socketio) in GREEN_MODES else None
     
-    return jsonify(logs)
+    def generate(since):
+        result = backlog
+        # Until the server shuts down
+        while not coordinator.events.closed:
+            if result['missed']:
+                yield _sse('missed', {'since': since, 'last_seq': result['last_seq']})
+            for event in result['events']:
+                yield _sse(event['type'], event, event['seq'])
+            since = result['last_seq']
+            # An idle stream gets a comment now and then, so proxies keep
+            # it open and a gone client is noticed
+            while not coordinator.events.wait(since, Config.LOG_TAIL_KEEPALIVE, sleep):
+                yield ': keepalive\n\n'
+            result = coordinator.events_since(since)
+    
+    return Response(generate(since), mimetype='text/event-stream', headers={
+        'Cache-Control': 'no-cache',
+        'X-Accel-Buffering': 'no'
+    })
 
 @api_bp.route('/')
 def index():
     """Serve the React frontend."""
     # Serve the React app's index.html if it exists
-    static_dir = os.path.join(os.path.dirname(__file__), '..', 'static')
-    index_path = os.path.join(static_dir, 'index.html')
-    
-    if os.path.exists(index_path):
-        return send_from_directory(static_dir, 'index.html')
+    response = static_assets.response('index.html')
+    if response is not None:
+        return response
     else:
         return jsonify({'message': 'Raspberry Pi Hardware Appliance API'})
 
-@api_bp.route('/static/<path:filename>')
+@api_bp.route('/<path:filename>')
 def static_files(filename):
-    """Serve static files for the React frontend."""
-    static_dir = os.path.join(os.path.dirname(__file__), '..', 'static')
-    return send_from_directory(static_dir, filename)
+    """Serve the React build (static/js/..., favicon.ico, manifest.json)."""
+    response = static_assets.response(filename)
+    if response is None:
+        return jsonify({'error': 'Not found'}), 404
+    return response
+
+@api_bp.route('/api/startup')
+def get_startup_timeline():
+    """Imports and startup phases of this process, in ms since it was started."""
+    return jsonify(timeline.as_dict())
+
+@api_bp.route('/api/static/stats')
+def static_stats():
+    """Asset requests, 304s, encodings served and cache use."""
+    return jsonify(static_assets.stats())
 
 @api_bp.route('/api/test_auth', methods=['POST'])
 def test_auth():
@@ -81,37 +458,119 @@ def test_auth():
 @api_bp.route('/api/account/<account_id>')
 def get_account(account_id):
     """Get account information."""
-    # This is a simulation - in a real system, this would fetch from a database
-    accounts = {
-        '1234': {
-            'name': 'John Doe',
-            'accountNumber': '**** **** **** 1234',
-            'balance': 1250.75,
-            'cardUid': account_id
-        }
-    }
+    account = ledger.get_account(account_id)
     
-    if account_id in accounts:
-        return jsonify(accounts[account_id])
+    if account is not None:
+        return jsonify(account)
     else:
         return jsonify({'error': 'Account not found'}), 404
 
+@api_bp.route('/api/account/<account_id>/transactions')
+def get_account_transactions(account_id):
+    """Get the most recent transactions for an account."""
+    if ledger.get_account(account_id) is None:
+        return jsonify({'error': 'Account not found'}), 404
+    
+    return jsonify(ledger.get_transactions(account_id))
+
+def _transaction_outcome(result):
+    """JSON body and HTTP status for one ledger.withdraw() result."""
+    error = result['error']
+    if error == 'not_found':
+        return {'error': 'Account not found'}, 404
+    if error == 'invalid_amount':
+        return {'error': 'Invalid amount'}, 400
+    if error == 'idempotency_mismatch':
+        return {'error': result['message']}, 422
+    if error == 'unavailable':
+        return {'error': result['message']}, 503
+    if not result['success']:
+        return {
+            'status': 'failed',
+            'balance': result['balance'],
+            'message': result['message']
+        }, 409
+    
+    return {
+        'transaction_id': 'TXN' + str(result['transaction_id']),
+        'status': 'success',
+        'balance': result['balance'],
+        'message': 'Transaction processed successfully'
+    }, 200
+
 @api_bp.route('/api/transaction', methods=['POST'])
 def process_transaction():
-    """Process a transaction."""
-    data = request.get_json()
+    """
+    Process a withdrawal against the account ledger.
+    
+    With an Idempotency-Key header, a retry of the same request gets the
+    first response back (marked Idempotent-Replayed: true) instead of a
+    second debit.
+    """
+    key, error = check_idempotency_key(request.headers.get('Idempotency-Key'))
+    if error is None:
+        account_id, amount, error = parse_withdrawal(request.get_json(silent=True))
+    if error is not None:
+        return jsonify({'error': error}), 400
+    
+    result = ledger.withdraw(account_id, amount, key)
+    get_coordinator(current_app.extensions['socketio']).record_transaction(account_id, amount, result)
+    body, status = _transaction_outcome(result)
+    response = jsonify(body)
+    response.status_code = status
+    if result['replayed']:
+        response.headers['Idempotent-Replayed'] = 'true'
+    return response
+
+@api_bp.route('/api/transactions/batch', methods=['POST'])
+def process_transaction_batch():
+    """
+    Process many withdrawals in one request.
     
-    # This is a simulation - in a real system, this would process the transaction
-    # and update the database
+    Body: {"transactions": [{"account_id", "amount", "idempotency_key"?}, ...]}.
+    Each withdrawal succeeds or fails on its own and gets the body and
+    status code /api/transaction would have answered with. An
+    Idempotency-Key header gives every item without its own key the key
+    "<header>:<index>", so the whole batch can be retried safely.
+    """
+    batch_key, error = check_idempotency_key(request.headers.get('Idempotency-Key'))
+    if error is not None:
+        return jsonify({'error': error}), 400
     
-    if not data or 'account_id' not in data or 'amount' not in data:
-        return jsonify({'error': 'Missing account_id or amount'}), 400
+    data = request.get_json(silent=True)
+    items = data.get('transactions') if isinstance(data, dict) else None
+    if not isinstance(items, list) or not items:
+        return jsonify({'error': 'transactions must be a non-empty list'}), 400
+    if len(items) > Config.TRANSACTION_BATCH_MAX:
+        return jsonify({'error': f'At most {Config.TRANSACTION_BATCH_MAX} transactions per batch'}), 413
     
-    # Simulate transaction processing
-    transaction_id = 'TXN' + str(int(time.time() * 1000) % 1000000)
+    outcomes = [None] * len(items)
+    requests = []
+    indexes = []
+    for index, item in enumerate(items):
+        account_id, amount, error = parse_withdrawal(item)
+        if error is None:
+            key = item.get('idempotency_key')
+            if key is None and batch_key is not None:
+                key = f'{batch_key}:{index}'
+            key, error = check_idempotency_key(key)
+        if error is not None:
+            outcomes[index] = ({'error': error}, 400)
+            continue
+        requests.append((account_id, amount, key))
+        indexes.append(index)
     
+    coordinator = get_coordinator(current_app.extensions['socketio'])
+    for index, (account_id, amount, _), result in zip(indexes, requests, ledger.withdraw_many(requests)):
+        coordinator.record_transaction(account_id, amount, result)
+        body, status = _transaction_outcome(result)
+        if result['replayed']:
+            body['replayed'] = True
+        outcomes[index] = (body, status)
+    
+    results = [dict(body, index=index, code=status) for index, (body, status) in enumerate(outcomes)]
     return jsonify({
-        'transaction_id': transaction_id,
-        'status': 'success',
-        'message': 'Transaction processed successfully'
-    })
\ No newline at end of file
+        'results': results,
+        'succeeded': sum(1 for result in results if result['code'] == 200),
+        'failed': sum(1 for result in results if result['code'] != 200)
+    })
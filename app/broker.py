@@ -0,0 +1,290 @@
+"""
+Local message broker for the split (multi-process) deployment.
+
+With WEB_WORKERS set, run.py starts one hardware process (reader, keypad,
+AuthCoordinator) and several web worker processes. They talk through a
+broker in the supervisor process. The broker listens on a Unix socket and
+forwards every message to every connected client, the sender included:
+
+- Socket.IO emits, so an event published by any process reaches the
+  clients of every web worker (UnixSocketManager)
+- requests from web workers to the hardware process, and the replies
+- notices such as "this card's PIN changed" or "a print job was queued"
+
+Messages are JSON objects framed with a 4-byte length.
+"""
+import json
+import os
+import queue
+import socket
+import struct
+import threading
+import time
+from socketio import PubSubManager
+
+SOCKETIO_CHANNEL = 'socketio'
+APPLIANCE_CHANNEL = 'appliance'
+
+_HEADER = struct.Struct('!I')
+
+
+def encode_message(message):
+    data = json.dumps(message).encode()
+    return _HEADER.pack(len(data)) + data
+
+
+def read_frames(sock):
+    """Yield raw frames (header included) from a socket until it closes."""
+    buffer = bytearray()
+    while True:
+        chunk = sock.recv(65536)
+        if not chunk:
+            return
+        buffer += chunk
+        while len(buffer) >= _HEADER.size:
+            end = _HEADER.size + _HEADER.unpack_from(buffer)[0]
+            if len(buffer) < end:
+                break
+            yield bytes(buffer[:end])
+            del buffer[:end]
+
+
+def decode_frame(frame):
+    return json.loads(frame[_HEADER.size:])
+
+
+class _Subscriber:
+    """One broker connection; frames are written by its own thread so a slow reader cannot stall the rest."""
+
+    def __init__(self, conn, backlog):
+        self.conn = conn
+        self.outbox = queue.Queue(maxsize=backlog)
+        self.closed = False
+        self.thread = threading.Thread(target=self._write_loop, name='broker-writer', daemon=True)
+        self.thread.start()
+
+    def _write_loop(self):
+        while True:
+            frame = self.outbox.get()
+            if frame is None:
+                break
+            try:
+                self.conn.sendall(frame)
+            except OSError:
+                break
+        self.close()
+
+    def close(self):
+        if not self.closed:
+            self.closed = True
+            try:
+                self.conn.shutdown(socket.SHUT_RDWR)
+            except OSError:
+                pass
+            self.conn.close()
+
+
+class Broker:
+    def __init__(self, path, backlog=10000):
+        """
+        Args:
+            path (str): Unix socket path to listen on
+            backlog (int): Frames buffered per client before that client is
+                disconnected as too slow
+        """
+        self.path = path
+        self.backlog = backlog
+        self.running = False
+        self.thread = None
+        self._server = None
+        self._lock = threading.Lock()
+        self._subscribers = []
+        self.messages = 0
+        self.dropped_clients = 0
+
+    def start(self):
+        if os.path.exists(self.path):
+            # Left over from a process that did not shut down cleanly
+            os.unlink(self.path)
+        self._server = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+        self._server.bind(self.path)
+        self._server.listen(64)
+        self.running = True
+        self.thread = threading.Thread(target=self._accept_loop, name='broker', daemon=True)
+        self.thread.start()
+        print(f"[BROKER] Listening on {self.path}")
+
+    def stop(self):
+        self.running = False
+        if self._server is not None:
+            self._server.close()
+        with self._lock:
+            subscribers, self._subscribers = self._subscribers, []
+        for subscriber in subscribers:
+            subscriber.close()
+        if os.path.exists(self.path):
+            os.unlink(self.path)
+
+    def _accept_loop(self):
+        while self.running:
+            try:
+                conn, _ = self._server.accept()
+            except OSError:
+                break
+            subscriber = _Subscriber(conn, self.backlog)
+            with self._lock:
+                self._subscribers.append(subscriber)
+            threading.Thread(target=self._read_loop, args=(subscriber,), name='broker-reader', daemon=True).start()
+
+    def _read_loop(self, subscriber):
+        try:
+            for frame in read_frames(subscriber.conn):
+                self._forward(frame)
+        except OSError:
+            pass
+        self._drop(subscriber)
+
+    def _forward(self, frame):
+        with self._lock:
+            self.messages += 1
+            subscribers = list(self._subscribers)
+        for subscriber in subscribers:
+            try:
+                subscriber.outbox.put_nowait(frame)
+            except queue.Full:
+                print("[BROKER ERROR] Client is not reading, disconnecting it")
+                self.dropped_clients += 1
+                self._drop(subscriber)
+
+    def _drop(self, subscriber):
+        with self._lock:
+            if subscriber in self._subscribers:
+                self._subscribers.remove(subscriber)
+        subscriber.close()
+        try:
+            subscriber.outbox.put_nowait(None)
+        except queue.Full:
+            pass
+
+    def stats(self):
+        with self._lock:
+            return {
+                'clients': len(self._subscribers),
+                'messages': self.messages,
+                'dropped_clients': self.dropped_clients
+            }
+
+
+class BrokerClient:
+    def __init__(self, path, retry_interval=0.5):
+        """
+        Args:
+            path (str): Broker socket path
+            retry_interval (float): Seconds between reconnect attempts
+        """
+        self.path = path
+        self.retry_interval = retry_interval
+        self.closed = False
+        self._lock = threading.Lock()
+        self._sock = None
+        self._listen_sock = None
+
+    def _connect(self):
+        sock = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+        try:
+            sock.connect(self.path)
+        except OSError:
+            sock.close()
+            raise
+        return sock
+
+    def publish(self, message):
+        """
+        Send a message to every broker client.
+
+        Returns:
+            bool: False if the broker could not be reached (the message is dropped)
+        """
+        frame = encode_message(message)
+        with self._lock:
+            for attempt in range(2):
+                try:
+                    if self._sock is None:
+                        self._sock = self._connect()
+                    self._sock.sendall(frame)
+                    return True
+                except OSError as e:
+                    if self._sock is not None:
+                        self._sock.close()
+                        self._sock = None
+                    if attempt:
+                        print(f"[BROKER ERROR] Publish failed: {e}")
+        return False
+
+    def listen(self, on_connect=None):
+        """
+        Yield every message from the broker, reconnecting when it goes away.
+
+        Args:
+            on_connect (callable): Called after each (re)connection, before
+                the first message from it is yielded
+        """
+        while not self.closed:
+            try:
+                self._listen_sock = self._connect()
+            except OSError:
+                time.sleep(self.retry_interval)
+                continue
+            if on_connect is not None:
+                on_connect()
+            try:
+                for frame in read_frames(self._listen_sock):
+                    yield decode_frame(frame)
+            except OSError:
+                pass
+            self._listen_sock.close()
+            self._listen_sock = None
+            if not self.closed:
+                print("[BROKER] Connection lost, reconnecting")
+                time.sleep(self.retry_interval)
+
+    def close(self):
+        self.closed = True
+        with self._lock:
+            if self._sock is not None:
+                self._sock.close()
+                self._sock = None
+        if self._listen_sock is not None:
+            try:
+                self._listen_sock.shutdown(socket.SHUT_RDWR)
+            except OSError:
+                pass
+
+
+class UnixSocketManager(PubSubManager):
+    """
+    Socket.IO client manager that shares emits between processes through the broker.
+
+    Messages on the appliance channel are passed to the callables in
+    `handlers` instead of the Socket.IO server.
+    """
+    name = 'unix'
+
+    def __init__(self, path, channel=SOCKETIO_CHANNEL, write_only=False, logger=None):
+        super().__init__(channel=channel, write_only=write_only, logger=logger)
+        self.client = BrokerClient(path)
+        self.handlers = []
+
+    def _publish(self, data):
+        self.client.publish(dict(data, channel=self.channel))
+
+    def _listen(self):
+        for message in self.client.listen():
+            if message.get('channel') == self.channel:
+                yield message
+            else:
+                for handler in self.handlers:
+                    try:
+                        handler(message)
+                    except Exception as e:
+                        print(f"[BROKER ERROR] Message handler failed: {e}")
@@ -0,0 +1,105 @@
+"""
+Supervisor for the split deployment (WEB_WORKERS > 0).
+
+One command still starts everything. The supervisor runs the broker, opens
+the listening socket and starts run.py again as child processes with
+PROCESS_ROLE set: one hardware process and WEB_WORKERS web workers. The web
+workers inherit the listening socket and accept from it in turn, so
+connections spread over the cores without a proxy in front. A child that
+exits unexpectedly is restarted.
+"""
+import os
+import signal
+import socket
+import subprocess
+import sys
+import time
+from app.broker import Broker
+from app.config import Config
+from app.models.ids import MAX_SLOT
+from app.startup import sd_notify
+
+RESTART_DELAY = 2.0
+
+
+class Supervisor:
+    def __init__(self, script, workers, host='0.0.0.0', port=5000, broker_path=None):
+        """
+        Args:
+            script (str): Entry script the children run (run.py)
+            workers (int): Number of web worker processes
+            host (str): Address the web workers serve on
+            port (int): Port the web workers serve on
+            broker_path (str): Broker socket path (defaults to Config.BROKER_SOCKET)
+        """
+        if workers > MAX_SLOT:
+            raise ValueError(f"At most {MAX_SLOT} web workers are supported (transaction ID process slots)")
+        self.script = script
+        self.workers = workers
+        self.address = (host, port)
+        self.broker = Broker(broker_path or Config.BROKER_SOCKET)
+        self.listener = None
+        self.children = {}  # pid -> (role, slot, Popen)
+        self.stopping = False
+        self.restarts = 0
+
+    def start(self):
+        self.broker.start()
+        self.listener = socket.create_server(self.address, backlog=1024)
+        self.listener.set_inheritable(True)
+        self._spawn('hardware', 0)
+        for slot in range(1, self.workers + 1):
+            self._spawn('web', slot)
+        print(f"[CLUSTER] Hardware process and {self.workers} web workers on port {self.address[1]}")
+
+    def _spawn(self, role, slot):
+        env = dict(os.environ, PROCESS_ROLE=role, PROCESS_SLOT=str(slot), BROKER_SOCKET=self.broker.path)
+        pass_fds = ()
+        if role == 'web':
+            env['LISTEN_FD'] = str(self.listener.fileno())
+            pass_fds = (self.listener.fileno(),)
+        process = subprocess.Popen([sys.executable, self.script], env=env, pass_fds=pass_fds)
+        self.children[process.pid] = (role, slot, process)
+
+    def run(self):
+        """Start the children and keep them running until SIGINT/SIGTERM."""
+        signal.signal(signal.SIGINT, self._on_signal)
+        signal.signal(signal.SIGTERM, self._on_signal)
+        self.start()
+        while not self.stopping:
+            for pid, (role, slot, process) in list(self.children.items()):
+                if process.poll() is None or self.stopping:
+                    continue
+                del self.children[pid]
+                print(f"[CLUSTER ERROR] {role} process {pid} exited with {process.returncode}, restarting")
+                self.restarts += 1
+                time.sleep(RESTART_DELAY)
+                if not self.stopping:
+                    # The replacement takes over the slot, continuing past its IDs
+                    self._spawn(role, slot)
+            time.sleep(0.5)
+        self.stop()
+
+    def _on_signal(self, sig, frame):
+        self.stopping = True
+
+    def stop(self, timeout=10):
+        """Stop the web workers first, then the hardware process, then the broker."""
+        self.stopping = True
+        sd_notify('STOPPING=1')
+        for roles in (('web',), ('hardware',)):
+            processes = [process for role, _, process in self.children.values() if role in roles]
+            for process in processes:
+                if process.poll() is None:
+                    process.terminate()
+            deadline = time.monotonic() + timeout
+            for process in processes:
+                try:
+                    process.wait(max(0.1, deadline - time.monotonic()))
+                except subprocess.TimeoutExpired:
+                    print(f"[CLUSTER ERROR] Process {process.pid} did not stop, killing it")
+                    process.kill()
+        self.children.clear()
+        if self.listener is not None:
+            self.listener.close()
+        self.broker.stop()
@@ -10,11 +10,97 @@ class Config:
     
     # Database
     DATABASE_PATH = os.environ.get('DATABASE_PATH') or 'app.db'
+    DATABASE_BUSY_TIMEOUT = float(os.environ.get('DATABASE_BUSY_TIMEOUT', 5.0))
+    DATABASE_CACHED_STATEMENTS = int(os.environ.get('DATABASE_CACHED_STATEMENTS', 128))
+    # Maximum number of cards whose PIN hashes are kept in memory
+    CREDENTIAL_CACHE_SIZE = int(os.environ.get('CREDENTIAL_CACHE_SIZE', 10000))
+    
+    # Audit log writer (group commit)
+    AUDIT_BATCH_SIZE = int(os.environ.get('AUDIT_BATCH_SIZE', 64))
+    AUDIT_FLUSH_INTERVAL = float(os.environ.get('AUDIT_FLUSH_INTERVAL', 0.05))
+    AUDIT_QUEUE_SIZE = int(os.environ.get('AUDIT_QUEUE_SIZE', 1024))
+    # One of: block, drop_oldest, drop_newest
+    AUDIT_OVERFLOW_POLICY = os.environ.get('AUDIT_OVERFLOW_POLICY', 'block')
+    
+    # Ledger: withdrawals waiting while another commits are written in one
+    # transaction of up to LEDGER_BATCH_SIZE; /api/transactions/batch takes
+    # at most TRANSACTION_BATCH_MAX. Idempotency-Key responses are replayed
+    # for IDEMPOTENCY_KEY_TTL seconds
+    LEDGER_BATCH_SIZE = int(os.environ.get('LEDGER_BATCH_SIZE', 256))
+    TRANSACTION_BATCH_MAX = int(os.environ.get('TRANSACTION_BATCH_MAX', 500))
+    IDEMPOTENCY_KEY_TTL = float(os.environ.get('IDEMPOTENCY_KEY_TTL', 86400))
+    IDEMPOTENCY_CACHE_SIZE = int(os.environ.get('IDEMPOTENCY_CACHE_SIZE', 10000))
+    
+    # Log retention (0 keeps raw log rows forever; rollups are always kept)
+    LOG_RETENTION_DAYS = float(os.environ.get('LOG_RETENTION_DAYS', 90))
+    LOG_RETENTION_CHECK_INTERVAL = float(os.environ.get('LOG_RETENTION_CHECK_INTERVAL', 3600))
+    
+    # PIN hashing (KDF cost; existing hashes are upgraded on next login)
+    PIN_KDF = os.environ.get('PIN_KDF', 'pbkdf2_sha256')  # or 'scrypt'
+    PIN_KDF_ITERATIONS = int(os.environ.get('PIN_KDF_ITERATIONS', 100000))
+    PIN_KDF_SCRYPT_N = int(os.environ.get('PIN_KDF_SCRYPT_N', 16384))
+    PIN_KDF_SCRYPT_R = int(os.environ.get('PIN_KDF_SCRYPT_R', 8))
+    PIN_KDF_SCRYPT_P = int(os.environ.get('PIN_KDF_SCRYPT_P', 1))
+    PIN_KDF_WORKERS = int(os.environ.get('PIN_KDF_WORKERS', 2))
+    PIN_KDF_MAX_PENDING = int(os.environ.get('PIN_KDF_MAX_PENDING', 16))
+    
+    # Bulk user import: PIN hashing threads (default leaves a core for the
+    # appliance itself), rows per insert transaction, row errors reported
+    IMPORT_HASH_WORKERS = int(os.environ.get('IMPORT_HASH_WORKERS', max(1, (os.cpu_count() or 1) - 1)))
+    IMPORT_CHUNK_SIZE = int(os.environ.get('IMPORT_CHUNK_SIZE', 500))
+    IMPORT_MAX_REPORTED_ERRORS = int(os.environ.get('IMPORT_MAX_REPORTED_ERRORS', 1000))
+    
+    # Seconds a PIN-entry session waits for the next key before it is dropped
+    PIN_ENTRY_TIMEOUT = float(os.environ.get('PIN_ENTRY_TIMEOUT', 30))
+    # pin_updated messages for one terminal inside this window are merged
+    PIN_UPDATE_COALESCE_MS = float(os.environ.get('PIN_UPDATE_COALESCE_MS', 50))
+    
+    # Recent auth and transaction events kept in memory for /api/logs/recent
+    # and log_tail subscribers; idle tail streams get a keepalive this often
+    EVENT_RING_SIZE = int(os.environ.get('EVENT_RING_SIZE', 1000))
+    LOG_TAIL_KEEPALIVE = float(os.environ.get('LOG_TAIL_KEEPALIVE', 15))
+    
+    # Socket.IO server: threading (Werkzeug, one OS thread per client),
+    # eventlet or gevent (green threads; run.py patches the standard library)
+    SOCKETIO_ASYNC_MODE = os.environ.get('SOCKETIO_ASYNC_MODE', 'threading')
+    
+    # Split deployment: with WEB_WORKERS > 0, run.py starts one hardware
+    # process and this many web worker processes on one port, linked by a
+    # Unix-socket broker. PROCESS_ROLE is set by run.py for its children
+    WEB_WORKERS = int(os.environ.get('WEB_WORKERS', 0))
+    WEB_PORT = int(os.environ.get('WEB_PORT', 5000))
+    PROCESS_ROLE = os.environ.get('PROCESS_ROLE', 'all')  # all, hardware or web
+    # Unique per process (hardware 0, web workers 1..WEB_WORKERS); part of every transaction ID
+    PROCESS_SLOT = int(os.environ.get('PROCESS_SLOT', 0))
+    BROKER_SOCKET = os.environ.get('BROKER_SOCKET', '/tmp/rpi-appliance-broker.sock')
+    # Seconds a web worker waits for the hardware process to answer
+    HARDWARE_RPC_TIMEOUT = float(os.environ.get('HARDWARE_RPC_TIMEOUT', 2.0))
+    
+    # Frontend assets: memory for hot files of the React build (0 disables)
+    STATIC_CACHE_BYTES = int(os.environ.get('STATIC_CACHE_BYTES', 8 * 1024 * 1024))
     
     # Hardware settings
     RFID_READER_ENABLED = os.environ.get('RFID_READER_ENABLED', 'true').lower() == 'true'
     KEYPAD_ENABLED = os.environ.get('KEYPAD_ENABLED', 'true').lower() == 'true'
     PRINTER_ENABLED = os.environ.get('PRINTER_ENABLED', 'true').lower() == 'true'
+    # Hardware backend: rpi (RPi.GPIO, mfrc522, python-escpos), sim (simulators)
+    # or auto (rpi when its libraries import, otherwise sim)
+    HARDWARE_BACKEND = os.environ.get('HARDWARE_BACKEND', 'auto')
+    # Virtual seconds per real second for the sim backend's clock
+    SIM_CLOCK_SPEED = float(os.environ.get('SIM_CLOCK_SPEED', 1.0))
+    
+    # Receipt printer: console (simulation), usb (python-escpos, or the simulated
+    # printer on the sim backend) or file (fake USB endpoint)
+    PRINTER_BACKEND = os.environ.get('PRINTER_BACKEND', 'console')
+    PRINTER_USB_VENDOR_ID = int(os.environ.get('PRINTER_USB_VENDOR_ID', '0x04b8'), 16)
+    PRINTER_USB_PRODUCT_ID = int(os.environ.get('PRINTER_USB_PRODUCT_ID', '0x0202'), 16)
+    PRINTER_OUTPUT_PATH = os.environ.get('PRINTER_OUTPUT_PATH', 'printer_output.bin')
+    
+    # Print spooler
+    PRINTER_QUEUE_SIZE = int(os.environ.get('PRINTER_QUEUE_SIZE', 64))
+    PRINTER_MAX_ATTEMPTS = int(os.environ.get('PRINTER_MAX_ATTEMPTS', 5))
+    PRINTER_RETRY_BASE = float(os.environ.get('PRINTER_RETRY_BASE', 1.0))
+    PRINTER_RETRY_MAX = float(os.environ.get('PRINTER_RETRY_MAX', 60.0))
     
     # GPIO pins (for Raspberry Pi)
     RFID_SDA_PIN = int(os.environ.get('RFID_SDA_PIN', 8))
@@ -22,8 +108,25 @@ class Config:
     RFID_MOSI_PIN = int(os.environ.get('RFID_MOSI_PIN', 10))
     RFID_MISO_PIN = int(os.environ.get('RFID_MISO_PIN', 9))
     RFID_RST_PIN = int(os.environ.get('RFID_RST_PIN', 25))
+    # Optional MFRC522 IRQ line; when set, a falling edge wakes the poller
+    RFID_IRQ_PIN = int(os.environ['RFID_IRQ_PIN']) if os.environ.get('RFID_IRQ_PIN') else None
+    
+    # RFID polling: fast for RFID_FAST_WINDOW seconds after a card was seen,
+    # then backing off by RFID_POLL_BACKOFF per empty poll up to the idle rate
+    RFID_POLL_FAST_MS = float(os.environ.get('RFID_POLL_FAST_MS', 20))
+    RFID_POLL_IDLE_MS = float(os.environ.get('RFID_POLL_IDLE_MS', 250))
+    RFID_POLL_BACKOFF = float(os.environ.get('RFID_POLL_BACKOFF', 1.5))
+    RFID_FAST_WINDOW = float(os.environ.get('RFID_FAST_WINDOW', 5))
+    # Reads of the same card within this many seconds are ignored
+    RFID_DEDUPE_WINDOW = float(os.environ.get('RFID_DEDUPE_WINDOW', 2))
     
     # Keypad configuration
     # These read from environment variables or default to your provided list
     KEYPAD_ROW_PINS = [int(x) for x in os.environ.get('KEYPAD_ROW_PINS', '5,6,13,19').split(',') if x]
     KEYPAD_COL_PINS = [int(x) for x in os.environ.get('KEYPAD_COL_PINS', '12,16,20').split(',') if x]
+    # 'interrupt' waits for column edges and only scans while keys are down;
+    # 'poll' scans the whole matrix continuously (fallback)
+    KEYPAD_SCAN_MODE = os.environ.get('KEYPAD_SCAN_MODE', 'interrupt')
+    KEYPAD_DEBOUNCE_MS = float(os.environ.get('KEYPAD_DEBOUNCE_MS', 20))
+    KEYPAD_POLL_INTERVAL_MS = float(os.environ.get('KEYPAD_POLL_INTERVAL_MS', 10))
+    KEYPAD_ACTIVE_SCAN_INTERVAL_MS = float(os.environ.get('KEYPAD_ACTIVE_SCAN_INTERVAL_MS', 5))
@@ -0,0 +1,57 @@
+"""
+Hardware backends.
+
+The keypad, RFID reader and USB printer get GPIO, the MFRC522 reader, the
+printer device and their clock from a backend instead of importing the
+Raspberry Pi libraries directly. Config.HARDWARE_BACKEND selects:
+
+    rpi    RPi.GPIO, mfrc522 and python-escpos (on the Pi)
+    sim    in-memory simulators on an accelerable virtual clock
+    auto   rpi when its libraries can be imported, otherwise sim
+"""
+import threading
+from app.config import Config
+
+
+BACKENDS = ('auto', 'rpi', 'sim')
+
+_backend = None
+_lock = threading.Lock()
+
+
+def load_backend(name, clock_speed=1.0):
+    """Create a new backend by name (see BACKENDS)."""
+    if name not in BACKENDS:
+        raise ValueError(f"Unknown hardware backend: {name}")
+
+    if name in ('auto', 'rpi'):
+        try:
+            from app.hardware.backends.rpi import RpiBackend
+            return RpiBackend()
+        except ImportError as e:
+            if name == 'rpi':
+                raise
+            # Fine on a development machine; on the appliance it means no
+            # card or key is ever read (the service sets HARDWARE_BACKEND=rpi)
+            print(f"[HARDWARE WARNING] HARDWARE_BACKEND=auto: Raspberry Pi libraries unavailable ({e}), "
+                  f"falling back to the simulator")
+
+    from app.hardware.backends.sim import SimBackend
+    return SimBackend(clock_speed=clock_speed)
+
+
+def get_backend():
+    """The process-wide backend, created from Config on first use."""
+    global _backend
+    with _lock:
+        if _backend is None:
+            _backend = load_backend(Config.HARDWARE_BACKEND, Config.SIM_CLOCK_SPEED)
+        return _backend
+
+
+def set_backend(backend):
+    """Install a backend explicitly (tools and tests); returns it."""
+    global _backend
+    with _lock:
+        _backend = backend
+    return backend
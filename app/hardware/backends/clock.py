@@ -0,0 +1,68 @@
+"""
+Clocks used by the hardware threads.
+
+SystemClock is the real time module. VirtualClock runs `speed` times
+faster than real time: sleep(s) sleeps s / speed real seconds and
+monotonic()/time() advance speed virtual seconds per real second, so
+debounce windows, poll intervals and hold times keep their ratios when
+the simulator is accelerated.
+"""
+import threading
+import time
+
+
+class SystemClock:
+    speed = 1.0
+
+    def monotonic(self):
+        return time.monotonic()
+
+    def time(self):
+        return time.time()
+
+    def sleep(self, seconds):
+        time.sleep(seconds)
+
+    def wait(self, event, timeout):
+        """Wait for a threading.Event for up to timeout seconds."""
+        return event.wait(timeout)
+
+
+class VirtualClock:
+    def __init__(self, speed=1.0, start=None):
+        """
+        Args:
+            speed (float): Virtual seconds per real second
+            start (float): Virtual epoch time at creation (defaults to now)
+        """
+        if speed <= 0:
+            raise ValueError("Clock speed must be positive")
+        self.speed = float(speed)
+        self._lock = threading.Lock()
+        self._real_base = time.perf_counter()
+        self._virtual_base = 0.0
+        self._epoch = time.time() if start is None else start
+
+    def monotonic(self):
+        with self._lock:
+            return self._virtual_base + (time.perf_counter() - self._real_base) * self.speed
+
+    def time(self):
+        return self._epoch + self.monotonic()
+
+    def sleep(self, seconds):
+        if seconds > 0:
+            time.sleep(seconds / self.speed)
+
+    def wait(self, event, timeout):
+        return event.wait(timeout / self.speed)
+
+    def set_speed(self, speed):
+        """Change the acceleration without making virtual time jump."""
+        if speed <= 0:
+            raise ValueError("Clock speed must be positive")
+        with self._lock:
+            now = time.perf_counter()
+            self._virtual_base += (now - self._real_base) * self.speed
+            self._real_base = now
+            self.speed = float(speed)
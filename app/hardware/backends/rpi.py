@@ -0,0 +1,22 @@
+"""
+Raspberry Pi backend: the real RPi.GPIO, mfrc522 and python-escpos libraries.
+"""
+import RPi.GPIO as GPIO
+from mfrc522 import SimpleMFRC522
+from app.hardware.backends.clock import SystemClock
+
+
+class RpiBackend:
+    name = 'rpi'
+
+    def __init__(self):
+        self.GPIO = GPIO
+        self.clock = SystemClock()
+
+    def create_rfid_reader(self):
+        return SimpleMFRC522()
+
+    def create_usb_printer(self, vendor_id, product_id):
+        # python-escpos is only needed once something is printed
+        from escpos.printer import Usb
+        return Usb(vendor_id, product_id)
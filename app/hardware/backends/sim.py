@@ -0,0 +1,352 @@
+"""
+Simulated hardware backend.
+
+Stands in for RPi.GPIO (with a keypad matrix wired to it), the MFRC522
+reader and the USB receipt printer so the real Keypad, RFIDReader and
+AuthCoordinator can run on any machine. Everything runs on a
+VirtualClock that can be accelerated, and input can be scripted with
+traces of card taps and key presses:
+
+    0.00  tap  769714493968
+    0.50  key  1
+    0.75  key  2
+
+Each line is: virtual seconds from the start of the trace, the action
+(tap, place, remove or key) and its argument.
+"""
+import threading
+from collections import deque
+from app.config import Config
+from app.hardware.backends.clock import VirtualClock
+
+
+TRACE_ACTIONS = ('tap', 'place', 'remove', 'key')
+
+
+class SimGPIO:
+    """
+    In-memory RPi.GPIO.
+
+    Output pins hold the level last written. A keypad matrix is modelled as
+    contacts between row (output) and column (input) pins: a column reads
+    HIGH while a closed contact connects it to a row driven HIGH, otherwise
+    its pull-down keeps it LOW. Edge callbacks fire on the thread that
+    caused the change.
+    """
+    BCM = 11
+    BOARD = 10
+    OUT = 0
+    IN = 1
+    LOW = 0
+    HIGH = 1
+    PUD_OFF = 20
+    PUD_DOWN = 21
+    PUD_UP = 22
+    RISING = 31
+    FALLING = 32
+    BOTH = 33
+
+    def __init__(self):
+        self._lock = threading.RLock()
+        self._mode = None
+        self._outputs = {}
+        self._inputs = {}  # pin -> level driven from outside (not via the matrix)
+        self._pulls = {}
+        self._contacts = set()  # closed (row_pin, col_pin) pairs
+        self._callbacks = {}  # pin -> (edge, callback)
+        self.edges = 0
+
+    def getmode(self):
+        return self._mode
+
+    def setmode(self, mode):
+        self._mode = mode
+
+    def setwarnings(self, flag):
+        pass
+
+    def setup(self, pin, direction, pull_up_down=None, initial=None):
+        with self._lock:
+            if direction == self.OUT:
+                self._outputs[pin] = self.LOW if initial is None else initial
+            else:
+                self._outputs.pop(pin, None)
+                self._pulls[pin] = pull_up_down
+
+    def output(self, pin, level):
+        self._change(lambda: self._outputs.__setitem__(pin, level))
+
+    def input(self, pin):
+        with self._lock:
+            return self._level(pin)
+
+    def add_event_detect(self, pin, edge, callback=None, bouncetime=None):
+        with self._lock:
+            if pin in self._callbacks:
+                raise RuntimeError(f"Conflicting edge detection already enabled for GPIO {pin}")
+            self._callbacks[pin] = (edge, callback)
+
+    def remove_event_detect(self, pin):
+        with self._lock:
+            self._callbacks.pop(pin, None)
+
+    def cleanup(self, pins=None):
+        with self._lock:
+            if pins is None:
+                self._outputs.clear()
+                self._pulls.clear()
+                self._callbacks.clear()
+                self._mode = None
+            else:
+                for pin in ([pins] if isinstance(pins, int) else pins):
+                    self._outputs.pop(pin, None)
+                    self._pulls.pop(pin, None)
+                    self._callbacks.pop(pin, None)
+
+    # =========================
+    # SIMULATION SIDE
+    # =========================
+    def set_contact(self, row_pin, col_pin, closed):
+        """Close or open the matrix contact between a row and a column."""
+        if closed:
+            self._change(lambda: self._contacts.add((row_pin, col_pin)))
+        else:
+            self._change(lambda: self._contacts.discard((row_pin, col_pin)))
+
+    def set_input(self, pin, level):
+        """Drive an input pin from outside (e.g. a reader's IRQ line); None releases it."""
+        if level is None:
+            self._change(lambda: self._inputs.pop(pin, None))
+        else:
+            self._change(lambda: self._inputs.__setitem__(pin, level))
+
+    def _level(self, pin):
+        if pin in self._outputs:
+            return self._outputs[pin]
+        if pin in self._inputs:
+            return self._inputs[pin]
+        for row_pin, col_pin in self._contacts:
+            if col_pin == pin and self._outputs.get(row_pin) == self.HIGH:
+                return self.HIGH
+        return self.HIGH if self._pulls.get(pin) == self.PUD_UP else self.LOW
+
+    def _change(self, mutate):
+        with self._lock:
+            watched = {pin: self._level(pin) for pin in self._callbacks}
+            mutate()
+            fired = []
+            for pin, before in watched.items():
+                after = self._level(pin)
+                if after == before:
+                    continue
+                edge, callback = self._callbacks[pin]
+                rising = after == self.HIGH
+                if edge == self.BOTH or (edge == self.RISING) == rising:
+                    fired.append((pin, callback))
+            self.edges += len(fired)
+        for pin, callback in fired:
+            if callback:
+                callback(pin)
+
+
+class SimMFRC522:
+    """
+    Stand-in for mfrc522.SimpleMFRC522 with a card that can be held on the
+    reader. With an IRQ pin, placing a card pulses that pin low.
+    """
+
+    def __init__(self, clock, gpio=None, irq_pin=None):
+        self.clock = clock
+        self.gpio = gpio
+        self.irq_pin = irq_pin
+        self._lock = threading.Lock()
+        self._uid = None
+        self._text = ''
+        self._until = None
+        self.reads = 0
+
+    def place(self, uid, text='', hold=None):
+        """Put a card on the reader, for hold virtual seconds or until remove()."""
+        with self._lock:
+            self._uid = int(uid)
+            self._text = text
+            self._until = None if hold is None else self.clock.monotonic() + hold
+        if self.gpio is not None and self.irq_pin is not None:
+            self.gpio.set_input(self.irq_pin, self.gpio.LOW)
+            self.gpio.set_input(self.irq_pin, None)
+
+    def tap(self, uid, hold=0.3):
+        self.place(uid, hold=hold)
+
+    def remove(self):
+        with self._lock:
+            self._uid = None
+
+    @property
+    def card_present(self):
+        with self._lock:
+            return self._present()
+
+    def _present(self):
+        if self._uid is None:
+            return False
+        if self._until is not None and self.clock.monotonic() >= self._until:
+            self._uid = None
+            return False
+        return True
+
+    def read_no_block(self):
+        with self._lock:
+            self.reads += 1
+            if self._present():
+                return self._uid, self._text
+            return None, None
+
+    def read(self):
+        while True:
+            uid, text = self.read_no_block()
+            if uid is not None:
+                return uid, text
+            self.clock.sleep(0.05)
+
+
+class SimUsbPrinter:
+    """Stand-in for escpos.printer.Usb that keeps recent receipts in memory."""
+
+    def __init__(self, vendor_id, product_id, keep=1000):
+        self.vendor_id = vendor_id
+        self.product_id = product_id
+        self.receipts = deque(maxlen=keep)
+        self.writes = 0
+        self.bytes_written = 0
+        # Number of upcoming writes that fail, to exercise spooler retries
+        self.fail_writes = 0
+        self._lock = threading.Lock()
+
+    def _raw(self, data):
+        with self._lock:
+            if self.fail_writes:
+                self.fail_writes -= 1
+                raise IOError("Simulated printer fault")
+            self.receipts.append(bytes(data))
+            self.writes += 1
+            self.bytes_written += len(data)
+
+
+class SimBackend:
+    name = 'sim'
+
+    def __init__(self, clock_speed=1.0):
+        self.clock = VirtualClock(clock_speed)
+        self.GPIO = SimGPIO()
+        self.rfid = SimMFRC522(self.clock, self.GPIO, Config.RFID_IRQ_PIN)
+        self.printer = None
+        self._printer_lock = threading.Lock()
+
+    def create_rfid_reader(self):
+        return self.rfid
+
+    def create_usb_printer(self, vendor_id, product_id):
+        with self._printer_lock:
+            if self.printer is None:
+                self.printer = SimUsbPrinter(vendor_id, product_id)
+            return self.printer
+
+    # =========================
+    # SCRIPTED INPUT
+    # =========================
+    def press_key(self, key, hold=0.08, bounce=0.003):
+        """
+        Press and release a keypad key through the GPIO matrix.
+
+        Args:
+            key (str): Label from the keypad key map
+            hold (float): Virtual seconds the key stays down
+            bounce (float): Virtual seconds of contact bounce on each edge
+                (0 for clean edges)
+        """
+        from app.hardware.keypad import KEY_MAP
+
+        for row_idx, labels in enumerate(KEY_MAP):
+            if key in labels:
+                row_pin = Config.KEYPAD_ROW_PINS[row_idx]
+                col_pin = Config.KEYPAD_COL_PINS[labels.index(key)]
+                break
+        else:
+            raise ValueError(f"No such key: {key}")
+
+        self._bounce(row_pin, col_pin, True, bounce)
+        self.clock.sleep(hold)
+        self._bounce(row_pin, col_pin, False, bounce)
+
+    def _bounce(self, row_pin, col_pin, closed, bounce):
+        if bounce:
+            for _ in range(3):
+                self.GPIO.set_contact(row_pin, col_pin, closed)
+                self.clock.sleep(bounce / 6)
+                self.GPIO.set_contact(row_pin, col_pin, not closed)
+                self.clock.sleep(bounce / 6)
+        self.GPIO.set_contact(row_pin, col_pin, closed)
+
+    def play(self, trace, key_hold=0.08, key_bounce=0.003, tap_hold=0.3):
+        """
+        Play a trace of (at, action, argument) events on the calling thread.
+
+        Events run at their virtual offset from the start of the trace, or
+        immediately if an earlier event (a held key) ran late.
+
+        Returns:
+            int: Number of events played
+        """
+        start = self.clock.monotonic()
+        played = 0
+        for at, action, argument in trace:
+            delay = start + at - self.clock.monotonic()
+            if delay > 0:
+                self.clock.sleep(delay)
+
+            if action == 'tap':
+                self.rfid.tap(argument, hold=tap_hold)
+            elif action == 'place':
+                self.rfid.place(argument)
+            elif action == 'remove':
+                self.rfid.remove()
+            elif action == 'key':
+                self.press_key(argument, hold=key_hold, bounce=key_bounce)
+            else:
+                raise ValueError(f"Unknown trace action: {action}")
+            played += 1
+        return played
+
+
+# =========================
+# TRACES
+# =========================
+def session_trace(rfid_uid, pin, start=0.0, first_key_delay=0.5, key_interval=0.25, submit_key='6'):
+    """Events for one card tap followed by a PIN entry and the submit key."""
+    trace = [(start, 'tap', rfid_uid)]
+    at = start + first_key_delay
+    for key in list(pin) + [submit_key]:
+        trace.append((at, 'key', key))
+        at += key_interval
+    return trace
+
+
+def parse_trace(lines):
+    """Parse trace lines ('<seconds> <action> [argument]'); lines starting with '#' are comments."""
+    trace = []
+    for number, line in enumerate(lines, 1):
+        line = line.strip()
+        if not line or line.startswith('#'):
+            continue
+        parts = line.split()
+        if len(parts) not in (2, 3) or parts[1] not in TRACE_ACTIONS:
+            raise ValueError(f"Trace line {number}: cannot parse '{line}'")
+        trace.append((float(parts[0]), parts[1], parts[2] if len(parts) == 3 else None))
+    trace.sort(key=lambda event: event[0])
+    return trace
+
+
+def load_trace(path):
+    with open(path) as f:
+        return parse_trace(f)
@@ -1,84 +1,228 @@
-import threading
+import time
+from app.config import Config
+from app.metrics import registry
 from app.models.database import db
+from app.hardware.events import EventRing, transaction_event
+from app.hardware.pipeline import AuthPipeline
+from app.hardware.notifier import SessionNotifier
 from app.hardware.printer import Printer
+from app.hardware.sessions import SessionTable, AWAITING_PIN, CANCELLED, SUBMITTED
+
+# Terminal used by the locally attached reader and keypad
+DEFAULT_TERMINAL = 'default'
+
+AUTH_RESULTS = registry.counter(
+    'appliance_auth_results_total', 'Completed PIN verifications by outcome', labels=('result',))
+AUTH_SECONDS = registry.histogram(
+    'appliance_auth_submit_to_result_seconds', 'PIN submitted to auth_result emitted')
+SESSIONS_OPEN = registry.gauge('appliance_sessions_open', 'Open PIN-entry sessions')
 
 
 class AuthCoordinator:
-    def __init__(self, socketio):
+    def __init__(self, socketio, clock=None):
         self.socketio = socketio
-        self.current_rfid = None
-        self.pin_buffer = ""
-        self.lock = threading.Lock()
+        # Session events go to the terminal's room, not to every client
+        self.notifier = SessionNotifier(socketio, Config.PIN_UPDATE_COALESCE_MS / 1000)
+        # One PIN-entry session per terminal (keypad/reader pair or web kiosk)
+        self.sessions = SessionTable(
+            Config.PIN_ENTRY_TIMEOUT,
+            on_timeout=self._on_session_timeout,
+            clock=clock
+        )
         self.printer = Printer()
+        # Newest auth and transaction events, answered without the database
+        self.events = EventRing(Config.EVENT_RING_SIZE)
+        self.event_listeners = []
         self.rfid_reader = None
         self.keypad = None
+        self.pipeline = AuthPipeline(
+            verify=db.authenticate_user_async,
+            notify=self._notify_result,
+            record=self._record_result,
+            print_receipt=self._print_result
+        )
+        self._granted = AUTH_RESULTS.labels('granted')
+        self._denied = AUTH_RESULTS.labels('denied')
+        SESSIONS_OPEN.set_function(lambda: self.sessions.stats()['active'])
 
     def set_hardware_components(self, rfid_reader, keypad):
         self.rfid_reader = rfid_reader
         self.keypad = keypad
 
+    # Card and PIN of the default terminal's open session
+    @property
+    def current_rfid(self):
+        session = self.sessions.get(DEFAULT_TERMINAL)
+        return session.rfid_uid if session else None
+
+    @property
+    def pin_buffer(self):
+        session = self.sessions.get(DEFAULT_TERMINAL)
+        return session.pin_buffer if session else ""
+
     # =========================
     # RFID CALLBACK
     # =========================
-    def handle_rfid_detected(self, rfid_uid):
-        with self.lock:
-            self.current_rfid = rfid_uid
-            self.pin_buffer = ""
-
-        self.socketio.emit(
-            "request_pin",
-            {"rfid_uid": rfid_uid}
-        )
+    def handle_rfid_detected(self, rfid_uid, terminal_id=DEFAULT_TERMINAL):
+        """Start PIN entry for a card, cancelling whatever was open at the terminal."""
+        session, cancelled = self.sessions.start(terminal_id, rfid_uid, replace=True)
+        for old in cancelled:
+            self._emit_session_ended(old)
+        self._request_pin(session)
+
+    def try_start_session(self, rfid_uid, terminal_id=DEFAULT_TERMINAL):
+        """
+        Start PIN entry for a card unless the terminal or the card is already
+        in a session.
+
+        Returns:
+            bool: True if the session was started
+        """
+        session, _ = self.sessions.start(terminal_id, rfid_uid)
+        if session is None:
+            return False
+        self._request_pin(session)
+        return True
+
+    def cancel_session(self, terminal_id=DEFAULT_TERMINAL):
+        session = self.sessions.get(terminal_id)
+        if session is None or not self.sessions.finish(session, CANCELLED):
+            return False
+        self._emit_session_ended(session)
+        return True
+
+    def _request_pin(self, session):
+        self.notifier.request_pin(session.terminal_id, session.rfid_uid)
 
     # =========================
     # KEYPAD CALLBACK
     # =========================
-    def handle_key_press(self, key):
-        with self.lock:
-            if self.current_rfid is None:
-                return
-
-            if key == "6":  # submit
-                self._process_pin_entry()
+    def handle_key_press(self, key, terminal_id=DEFAULT_TERMINAL):
+        session = self.sessions.get(terminal_id)
+        if session is None:
+            return
+
+        if key == "6":  # submit
+            # Once submitted the buffer is frozen; later keys see the new state
+            if self.sessions.finish(session, SUBMITTED):
+                # Verification runs on the KDF pool; never under a session lock
+                self._process_pin_entry(session.rfid_uid, session.pin_buffer, terminal_id)
+            return
+
+        with session.lock:
+            if session.state != AWAITING_PIN:
                 return
-            elif key == "*":  # backspace
-                self.pin_buffer = self.pin_buffer[:-1]
+            if key == "*":  # backspace
+                session.pin_buffer = session.pin_buffer[:-1]
             elif key.isdigit():
-                self.pin_buffer += key
-
-        self.socketio.emit(
-            "pin_updated",
-            {
-                "rfid_uid": self.current_rfid,
-                "pin_length": len(self.pin_buffer),
-                "pin_buffer": self.pin_buffer
-            }
-        )
+                session.pin_buffer += key
+            else:
+                return
+            self.sessions.touch(session)
+            pin_length = len(session.pin_buffer)
+
+        # Only the length leaves the coordinator; the digits never do
+        self.notifier.pin_updated(terminal_id, pin_length)
 
     # =========================
     # PIN PROCESSING
     # =========================
-    def _process_pin_entry(self):
-        rfid_uid = self.current_rfid
-        pin = self.pin_buffer
-
-        self.current_rfid = None
-        self.pin_buffer = ""
-
-        success = db.authenticate_user(rfid_uid, pin)
-        message = "Access granted" if success else "Invalid PIN"
-
-        db.log_event(rfid_uid, success, message)
-        self.printer.print_receipt(rfid_uid, success, message)
-
-        self.socketio.emit(
-            "auth_result",
-            {
-                "rfid_uid": rfid_uid,
-                "success": success,
-                "message": message
-            }
+    def _process_pin_entry(self, rfid_uid, pin, terminal_id=DEFAULT_TERMINAL):
+        # verify -> notify / record / print, each on its own worker
+        self.pipeline.submit(rfid_uid, pin, terminal_id)
+
+    def _notify_result(self, result):
+        self.notifier.auth_result(
+            result.terminal_id or DEFAULT_TERMINAL,
+            result.rfid_uid,
+            result.success,
+            result.message
         )
+        AUTH_SECONDS.observe(time.perf_counter() - result.submitted_at)
+        (self._granted if result.success else self._denied).inc()
+        self.record_event('auth', {
+            'terminal_id': result.terminal_id or DEFAULT_TERMINAL,
+            'rfid_uid': result.rfid_uid,
+            'success': result.success,
+            'message': result.message
+        })
+
+    def _record_result(self, result):
+        db.log_event(result.rfid_uid, result.success, result.message)
+
+    def _print_result(self, result):
+        self.printer.print_receipt(result.rfid_uid, result.success, result.message)
+
+    # =========================
+    # SESSION END
+    # =========================
+    def _on_session_timeout(self, session):
+        print(f"[AUTH] PIN entry timed out at terminal {session.terminal_id}")
+        self._emit_session_ended(session)
+
+    def _emit_session_ended(self, session):
+        self.notifier.session_ended(session.terminal_id, session.rfid_uid, session.state)
+
+    # =========================
+    # RECENT EVENTS
+    # =========================
+    def record_event(self, event_type, data):
+        """
+        Add an event to the recent-events ring and push it to the clients
+        in the log_tail room.
+
+        Returns:
+            dict: The stored event, with its sequence number
+        """
+        event = self.events.append(event_type, data)
+        self.notifier.log_event(event)
+        for listener in self.event_listeners:
+            listener(event)
+        return event
+
+    def record_transaction(self, account_id, amount, result):
+        """Add a ledger.withdraw() result to the recent events (replays and rejected requests are skipped)."""
+        data = transaction_event(account_id, amount, result)
+        if data is not None:
+            self.record_event('transaction', data)
+
+    def recent_events(self, limit=50, event_type=None):
+        return self.events.recent(limit, event_type)
+
+    def events_since(self, seq):
+        """Events after seq for a resuming subscriber (see EventRing.since)."""
+        return self.events.since(seq)
+
+    def get_stats(self):
+        """Per-stage latency and queue counters of the auth pipeline."""
+        return self.pipeline.stats()
+
+    def get_session_stats(self):
+        return self.sessions.stats()
+
+    def list_sessions(self):
+        return self.sessions.sessions()
+
+    def get_rfid_stats(self):
+        """RFID reader counters, or None if the reader is not running."""
+        if self.rfid_reader is None:
+            return None
+        return self.rfid_reader.stats()
+
+    def get_notification_stats(self):
+        return self.notifier.stats()
+
+    def get_metrics(self):
+        """This process's metrics as MetricsRegistry.collect() snapshots."""
+        return registry.collect()
+
+    def shutdown(self):
+        """Let queued notify/record/print jobs finish, stop the print spooler and end log tail streams."""
+        self.sessions.stop()
+        self.pipeline.stop(timeout=5)
+        self.notifier.stop()
+        self.events.close()
+        self.printer.stop()
 
 
 # =========================
@@ -90,5 +234,10 @@ _auth_coordinator = None
 def get_coordinator(socketio):
     global _auth_coordinator
     if _auth_coordinator is None:
-        _auth_coordinator = AuthCoordinator(socketio)
+        if Config.PROCESS_ROLE == 'web':
+            # The hardware lives in another process; ask it over the broker
+            from app.hardware.remote import RemoteCoordinator
+            _auth_coordinator = RemoteCoordinator(socketio)
+        else:
+            _auth_coordinator = AuthCoordinator(socketio)
     return _auth_coordinator
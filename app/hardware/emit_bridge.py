@@ -0,0 +1,110 @@
+"""
+Socket.IO emits from hardware threads.
+
+The reader, keypad, timeout and pipeline workers are OS threads. In the
+threading async mode they may call socketio.emit directly. Under eventlet or
+gevent the server runs on a hub in the main thread, and calling into it from
+another OS thread is not safe. In those modes emits are queued and a
+background task on the hub sends them. Producers wake the task by writing a
+byte to a pipe the hub watches, so an idle bridge costs nothing and the hub
+never blocks. (eventlet's tpool is no use here: it runs the call inline on
+the hub whenever any thread holds the import lock.)
+"""
+import os
+import queue
+import threading
+
+GREEN_MODES = ('eventlet', 'gevent')
+
+_STOP = object()
+
+
+def async_mode_of(socketio):
+    """Async mode of a Flask-SocketIO instance ('threading' for test doubles)."""
+    server = getattr(socketio, 'server', None)
+    if server is None:
+        return 'threading'
+    return server.eio.async_mode
+
+
+class EmitBridge:
+    def __init__(self, socketio):
+        """
+        Args:
+            socketio: Flask-SocketIO instance, or anything with
+                emit(event, data, **kwargs)
+
+        Create the bridge in the thread that will run the server (the main
+        thread), so the sender task is started on the server's hub.
+        """
+        self.socketio = socketio
+        self.async_mode = async_mode_of(socketio)
+        self.queued = 0
+        self._queue = None
+        if self.async_mode in GREEN_MODES:
+            self._queue = queue.Queue()
+            self._wake_r, self._wake_w = os.pipe()
+            os.set_blocking(self._wake_r, False)
+            os.set_blocking(self._wake_w, False)
+            # Held while writing to or closing the write end, so a late
+            # producer never writes to a closed (or reused) descriptor
+            self._wake_lock = threading.Lock()
+            self._wait_readable = self._hub_wait()
+            socketio.start_background_task(self._send_loop)
+
+    def emit(self, event, data, **kwargs):
+        if self._queue is None:
+            self.socketio.emit(event, data, **kwargs)
+        else:
+            self.queued += 1
+            self._queue.put((event, data, kwargs))
+            self._wake()
+
+    def stop(self):
+        if self._queue is None:
+            return
+        self._queue.put(_STOP)
+        self._wake()
+        with self._wake_lock:
+            if self._wake_w is not None:
+                # The sender still reads the wake-up written above
+                os.close(self._wake_w)
+                self._wake_w = None
+
+    def _wake(self):
+        with self._wake_lock:
+            if self._wake_w is None:
+                return  # Stopped
+            try:
+                os.write(self._wake_w, b'\0')
+            except BlockingIOError:
+                pass  # The pipe is full of wake-ups the sender has yet to read
+
+    def _hub_wait(self):
+        # Waits for a file descriptor while the calling green thread yields
+        if self.async_mode == 'eventlet':
+            from eventlet.hubs import trampoline
+            return lambda fd: trampoline(fd, read=True)
+        from gevent.socket import wait_read
+        return wait_read
+
+    def _send_loop(self):
+        while True:
+            self._wait_readable(self._wake_r)
+            try:
+                os.read(self._wake_r, 4096)
+            except BlockingIOError:
+                pass
+            while True:
+                try:
+                    item = self._queue.get_nowait()
+                except queue.Empty:
+                    break
+                if item is _STOP:
+                    os.close(self._wake_r)
+                    return
+                event, data, kwargs = item
+                try:
+                    self.socketio.emit(event, data, **kwargs)
+                except Exception as e:
+                    print(f"[SOCKETIO ERROR] Emit of {event} failed: {e}")
@@ -0,0 +1,167 @@
+"""
+Recent authentication and transaction events for the Raspberry Pi hardware appliance.
+
+The coordinator adds every auth result and withdrawal to a fixed-size ring
+in memory, so the newest events are answered without touching the
+database and live subscribers (the log_tail Socket.IO room and the SSE
+stream) are fed from the same place. Every event has a sequence number; a
+client that reconnects passes the last one it saw and gets only what it
+missed, or is told that events fell off the ring in the meantime.
+
+Sequence numbers start from the clock (in microseconds) when the process
+starts and then count up by one. They keep increasing across restarts, so
+a client resuming from before a restart is told it missed events instead
+of being matched against unrelated numbers.
+"""
+import threading
+import time
+from collections import deque
+
+EVENT_TYPES = ('auth', 'transaction')
+# Newest events a tail subscriber starts with when it gives no sequence number
+TAIL_BACKLOG = 50
+
+
+def transaction_event(account_id, amount, result):
+    """
+    Event data for a ledger.withdraw() result, or None if nothing was
+    debited or declined (a replayed retry, an unknown account, a bad amount).
+    """
+    if result['replayed'] or result['error'] not in (None, 'insufficient_funds'):
+        return None
+    transaction_id = result.get('transaction_id')
+    return {
+        'account_id': account_id,
+        'amount': amount,
+        'balance': result['balance'],
+        'success': result['success'],
+        'message': result['message'],
+        'transaction_id': 'TXN' + str(transaction_id) if transaction_id is not None else None
+    }
+
+
+class EventRing:
+    def __init__(self, capacity=1000, start=None, clock=time.time):
+        """
+        Args:
+            capacity (int): Events kept; the oldest is dropped for each new one
+            start (int): Sequence number before the first event (defaults
+                to the clock in microseconds); 0 for a mirror filled with
+                events numbered by another process
+            clock (callable): Returns the current time in seconds
+        """
+        self.capacity = max(1, capacity)
+        self.clock = clock
+        self._events = deque(maxlen=self.capacity)
+        self._lock = threading.Lock()
+        self._changed = threading.Condition(self._lock)
+        self.last_seq = int(clock() * 1000000) if start is None else start
+        self.added = 0
+        self.closed = False
+
+    def append(self, event_type, data):
+        """
+        Number and store a new event.
+
+        Args:
+            event_type (str): 'auth' or 'transaction'
+            data (dict): Event fields
+
+        Returns:
+            dict: The event with seq, type and created_at added
+        """
+        event = dict(data)
+        event['type'] = event_type
+        event['created_at'] = time.strftime('%Y-%m-%d %H:%M:%S', time.gmtime(self.clock()))
+        with self._changed:
+            self.last_seq += 1
+            event['seq'] = self.last_seq
+            self._events.append(event)
+            self.added += 1
+            self._changed.notify_all()
+        return event
+
+    def extend(self, events):
+        """Store events numbered elsewhere (a mirror of another process's ring), skipping ones already held."""
+        with self._changed:
+            if all(event['seq'] > self.last_seq for event in events):
+                self._events.extend(sorted(events, key=lambda event: event['seq']))
+            else:
+                # A backfill overlapping events that arrived live
+                merged = {event['seq']: event for event in self._events}
+                merged.update((event['seq'], event) for event in events)
+                self._events = deque(
+                    (merged[seq] for seq in sorted(merged)[-self.capacity:]), maxlen=self.capacity)
+            if self._events:
+                self.last_seq = max(self.last_seq, self._events[-1]['seq'])
+            self.added += len(events)
+            self._changed.notify_all()
+
+    def recent(self, limit=50, event_type=None):
+        """Newest events first, at most limit, optionally of one type."""
+        found = []
+        with self._lock:
+            for event in reversed(self._events):
+                if len(found) >= limit:
+                    break
+                if event_type is None or event['type'] == event_type:
+                    found.append(event)
+        return found
+
+    def since(self, seq):
+        """
+        Events newer than seq, oldest first.
+
+        Returns:
+            dict: events, last_seq and missed (True if events after seq are
+                no longer held, or seq is not from this ring; all held
+                events are returned then)
+        """
+        with self._lock:
+            last_seq = self.last_seq
+            if seq > last_seq:
+                # From before a restart whose clock was behind, or made up
+                seq = -1
+            found = []
+            for event in reversed(self._events):
+                if event['seq'] <= seq:
+                    break
+                found.append(event)
+            oldest = found[-1]['seq'] if found else last_seq + 1
+        found.reverse()
+        return {'events': found, 'last_seq': last_seq, 'missed': seq < oldest - 1}
+
+    def wait(self, seq, timeout=None, sleep=None, poll_interval=0.1):
+        """
+        Block until an event newer than seq is stored or the ring is
+        closed; False on timeout.
+
+        Under eventlet or gevent pass sleep=socketio.sleep: events are added
+        from OS threads, which cannot wake a green thread, so the caller
+        polls instead of blocking the hub.
+        """
+        if sleep is None:
+            with self._changed:
+                return self._changed.wait_for(lambda: self.closed or self.last_seq > seq, timeout)
+        deadline = None if timeout is None else time.monotonic() + timeout
+        while self.last_seq <= seq and not self.closed:
+            if deadline is not None and time.monotonic() >= deadline:
+                return False
+            sleep(poll_interval)
+        return True
+
+    def close(self):
+        """Wake every waiter for good, so tail streams end and the server can stop."""
+        with self._changed:
+            self.closed = True
+            self._changed.notify_all()
+
+    def stats(self):
+        with self._lock:
+            return {
+                'capacity': self.capacity,
+                'size': len(self._events),
+                'added': self.added,
+                'last_seq': self.last_seq,
+                'oldest_seq': self._events[0]['seq'] if self._events else None
+            }
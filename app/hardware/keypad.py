@@ -1,15 +1,81 @@
 """
 Keypad module for Raspberry Pi
+
+GPIO access goes through the hardware backend (see app/hardware/backends).
 """
 import threading
 import time
 import queue
-import RPi.GPIO as GPIO
-from config import Config
+from app.config import Config
+from app.hardware.backends import get_backend
+from app.metrics import registry
+
+KEY_PRESSES = registry.counter('appliance_keypad_presses_total', 'Debounced key presses')
+KEY_TO_PIN_UPDATED_SECONDS = registry.histogram(
+    'appliance_keypad_key_to_pin_updated_seconds', 'Confirmed key press to pin_updated handed to the notifier')
+
+
+# 4x3 matrix
+KEY_MAP = [
+    ["1", "2", "3"],
+    ["4", "5", "6"],
+    ["7", "8", "9"],
+    ["*", "0", "#"]
+]
+
+
+class KeyDebouncer:
+    """
+    Debounce state machine for one key, driven by the monotonic clock.
+
+    A press is reported once the contact has read closed for debounce_time;
+    the key must then read open for debounce_time before it can be pressed
+    again. Bounces shorter than that are ignored in both directions.
+    """
+    UP = 0
+    PRESS_PENDING = 1
+    DOWN = 2
+    RELEASE_PENDING = 3
+
+    __slots__ = ('debounce_time', 'state', 'since')
+
+    def __init__(self, debounce_time):
+        self.debounce_time = debounce_time
+        self.state = self.UP
+        self.since = 0.0
+
+    def update(self, closed, now):
+        """Feed one sample; returns True when a press is confirmed."""
+        state = self.state
+        if state == self.UP:
+            if closed:
+                self.state, self.since = self.PRESS_PENDING, now
+        elif state == self.PRESS_PENDING:
+            if not closed:
+                self.state = self.UP
+            elif now - self.since >= self.debounce_time:
+                self.state = self.DOWN
+                return True
+        elif state == self.DOWN:
+            if not closed:
+                self.state, self.since = self.RELEASE_PENDING, now
+        elif closed:
+            self.state = self.DOWN
+        elif now - self.since >= self.debounce_time:
+            self.state = self.UP
+        return False
+
+    @property
+    def idle(self):
+        return self.state == self.UP
+
 
 class Keypad:
-    def __init__(self, coordinator):
+    def __init__(self, coordinator, backend=None):
         self.coordinator = coordinator  # Must be AuthCoordinator instance
+        self.backend = backend or get_backend()
+        self.gpio = self.backend.GPIO
+        self.clock = self.backend.clock
         self.running = False
         self.thread = None
         self.key_queue = queue.Queue()
@@ -18,17 +84,22 @@ class Keypad:
         self.rows = Config.KEYPAD_ROW_PINS
         self.cols = Config.KEYPAD_COL_PINS
 
-        # 4x3 matrix
-        self.key_map = [
-            ["1", "2", "3"],
-            ["4", "5", "6"],
-            ["7", "8", "9"],
-            ["*", "0", "#"]
+        self.key_map = KEY_MAP
+
+        self.mode = Config.KEYPAD_SCAN_MODE
+        self.poll_interval = Config.KEYPAD_POLL_INTERVAL_MS / 1000
+        self.active_scan_interval = Config.KEYPAD_ACTIVE_SCAN_INTERVAL_MS / 1000
+        self.debouncers = [
+            [KeyDebouncer(Config.KEYPAD_DEBOUNCE_MS / 1000) for _ in self.cols]
+            for _ in self.rows
         ]
+        # Set by column edges (interrupt mode) and simulated key presses
+        self._wake = threading.Event()
 
         self._setup_gpio()
 
     def _setup_gpio(self):
+        GPIO = self.gpio
         if GPIO.getmode() is None:
             GPIO.setmode(GPIO.BCM)
         GPIO.setwarnings(False)
@@ -40,48 +111,118 @@ class Keypad:
         for pin in self.cols:
             GPIO.setup(pin, GPIO.IN, pull_up_down=GPIO.PUD_DOWN)
 
+        if self.mode == 'interrupt':
+            try:
+                for pin in self.cols:
+                    GPIO.add_event_detect(pin, GPIO.RISING, callback=self._on_column_edge)
+            except RuntimeError as e:
+                print(f"[KEYPAD] Edge detection unavailable ({e}), falling back to polling")
+                self._remove_event_detect()
+                self.mode = 'poll'
+
+    def _remove_event_detect(self):
+        for pin in self.cols:
+            try:
+                self.gpio.remove_event_detect(pin)
+            except RuntimeError:
+                pass
+
     def start(self):
         if not self.running:
             self.running = True
-            self.thread = threading.Thread(target=self._scan_keypad_loop, daemon=True)
+            target = self._interrupt_loop if self.mode == 'interrupt' else self._scan_keypad_loop
+            self.thread = threading.Thread(target=target, daemon=True)
             self.thread.start()
 
     def stop(self):
         self.running = False
+        self._wake.set()
         if self.thread:
             self.thread.join()
-        GPIO.cleanup()
+        if self.mode == 'interrupt':
+            self._remove_event_detect()
+        self.gpio.cleanup()
+
+    # =========================
+    # SCANNING
+    # =========================
+    def _scan_matrix(self, now):
+        """Scan every row once and feed the debouncers; returns True while any key is active."""
+        GPIO = self.gpio
+        active = False
+        for row_idx, row_pin in enumerate(self.rows):
+            GPIO.output(row_pin, GPIO.HIGH)
+            debouncers = self.debouncers[row_idx]
+            for col_idx, col_pin in enumerate(self.cols):
+                closed = GPIO.input(col_pin) == GPIO.HIGH
+                debouncer = debouncers[col_idx]
+                if debouncer.update(closed, now):
+                    self._handle_key_press(self.key_map[row_idx][col_idx])
+                if not debouncer.idle:
+                    active = True
+            GPIO.output(row_pin, GPIO.LOW)
+        return active
+
+    def _drain_simulated_keys(self):
+        while True:
+            try:
+                sim_key = self.key_queue.get_nowait()
+            except queue.Empty:
+                return
+            self._handle_key_press(sim_key)
 
     def _scan_keypad_loop(self):
-        last_key = None
-        debounce_time = 0.2
-
+        """Polling mode: scan the whole matrix every poll_interval."""
         while self.running:
-            key_pressed = None
-            for row_idx, row_pin in enumerate(self.rows):
-                GPIO.output(row_pin, GPIO.HIGH)
-                for col_idx, col_pin in enumerate(self.cols):
-                    if GPIO.input(col_pin) == GPIO.HIGH:
-                        key_pressed = self.key_map[row_idx][col_idx]
-                GPIO.output(row_pin, GPIO.LOW)
-
-            if key_pressed and key_pressed != last_key:
-                self._handle_key_press(key_pressed)
-                last_key = key_pressed
-                time.sleep(debounce_time)
-            elif not key_pressed:
-                last_key = None
+            self._scan_matrix(self.clock.monotonic())
 
             # Simulated key presses
-            if not self.key_queue.empty():
-                sim_key = self.key_queue.get()
-                self._handle_key_press(sim_key)
+            self._drain_simulated_keys()
 
-            time.sleep(0.05)
+            self.clock.sleep(self.poll_interval)
+
+    def _interrupt_loop(self):
+        """
+        Interrupt mode: with every row driven high a key press raises its
+        column, and the edge wakes this thread. It then scans row by row
+        until all keys are released and debounced, and goes back to sleep.
+        """
+        GPIO = self.gpio
+        while self.running:
+            self._set_rows(GPIO.HIGH)
+            self._wake.clear()
+            # A key may already be down (or went down before the clear)
+            if not self._any_column_high():
+                self._wake.wait()
+            if not self.running:
+                return
+
+            self._drain_simulated_keys()
+            if not self._any_column_high():
+                continue  # simulated key or a glitch; nothing to scan
+
+            self._set_rows(GPIO.LOW)
+            while self.running and self._scan_matrix(self.clock.monotonic()):
+                self._drain_simulated_keys()
+                self.clock.sleep(self.active_scan_interval)
+
+    def _set_rows(self, level):
+        for row_pin in self.rows:
+            self.gpio.output(row_pin, level)
+
+    def _any_column_high(self):
+        return any(self.gpio.input(col_pin) == self.gpio.HIGH for col_pin in self.cols)
+
+    def _on_column_edge(self, channel):
+        # Runs on the GPIO library's callback thread; just wake the scanner
+        self._wake.set()
 
     def _handle_key_press(self, key):
         print(f"[KEYPAD] Key pressed: {key}")
-        self.coordinator.handle_key_press(key)
+        KEY_PRESSES.inc()
+        with KEY_TO_PIN_UPDATED_SECONDS.time():
+            self.coordinator.handle_key_press(key)
 
     def simulate_key_press(self, key):
         self.key_queue.put(key)
+        self._wake.set()
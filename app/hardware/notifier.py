@@ -0,0 +1,217 @@
+"""
+Socket.IO notifications from the AuthCoordinator.
+
+Every terminal has its own room ("terminal:<id>") and session events go
+only to the clients in that room. pin_updated carries just the PIN length
+and is coalesced per terminal: the first update after a quiet period is
+sent at once, later updates inside the window are folded into one
+trailing message with the latest length. Auth and transaction events
+for the live log go to the clients in the log_tail room.
+"""
+import threading
+import time
+from app.hardware.emit_bridge import EmitBridge
+
+# Clients following the live log (see AuthCoordinator.record_event)
+LOG_TAIL_ROOM = "log_tail"
+
+
+def terminal_room(terminal_id):
+    return f"terminal:{terminal_id}"
+
+
+class SessionNotifier:
+    def __init__(self, socketio, coalesce_window=0.05, namespace='/'):
+        """
+        Args:
+            socketio: Flask-SocketIO instance (anything with emit(event, data, to=...))
+            coalesce_window (float): Seconds within which pin_updated
+                messages for one terminal are merged (0 disables merging)
+            namespace (str): Socket.IO namespace the rooms live in
+        """
+        self.socketio = socketio
+        # Hardware threads must not call into a green-thread server directly
+        self.bridge = EmitBridge(socketio)
+        self.coalesce_window = coalesce_window
+        self.namespace = namespace
+        self._lock = threading.Lock()
+        self._wake = threading.Condition(self._lock)
+        self._last_sent = {}  # terminal_id -> time of the last pin_updated sent
+        self._pending = {}  # terminal_id -> (due, payload)
+        self.thread = None
+        self.running = False
+
+        self._stats_lock = threading.Lock()
+        self.messages = 0
+        self.deliveries = 0
+        self.max_fanout = 0
+        self.coalesced = 0
+        self.by_event = {}
+        self._rate_started = time.monotonic()
+        self._rate_messages = 0
+        self.messages_per_sec = 0.0
+
+    # =========================
+    # SESSION EVENTS
+    # =========================
+    def request_pin(self, terminal_id, rfid_uid):
+        self._discard_pending(terminal_id)
+        self.emit("request_pin", {"rfid_uid": rfid_uid, "terminal_id": terminal_id}, terminal_id)
+
+    def pin_updated(self, terminal_id, pin_length):
+        payload = {"terminal_id": terminal_id, "pin_length": pin_length}
+        if not self.coalesce_window:
+            self.emit("pin_updated", payload, terminal_id)
+            return
+
+        now = time.monotonic()
+        with self._lock:
+            pending = self._pending.get(terminal_id)
+            if pending is not None:
+                # Keep only the newest length; it goes out when the window closes
+                self._pending[terminal_id] = (pending[0], payload)
+                self.coalesced += 1
+                return
+            last = self._last_sent.get(terminal_id)
+            if last is not None and now - last < self.coalesce_window:
+                self._pending[terminal_id] = (last + self.coalesce_window, payload)
+                self._start_flusher()
+                self._wake.notify()
+                return
+            self._last_sent[terminal_id] = now
+
+        self.emit("pin_updated", payload, terminal_id)
+
+    def auth_result(self, terminal_id, rfid_uid, success, message):
+        self._discard_pending(terminal_id)
+        self.emit(
+            "auth_result",
+            {
+                "rfid_uid": rfid_uid,
+                "terminal_id": terminal_id,
+                "success": success,
+                "message": message
+            },
+            terminal_id
+        )
+
+    def session_ended(self, terminal_id, rfid_uid, reason):
+        self._discard_pending(terminal_id)
+        self.emit(
+            "session_ended",
+            {"rfid_uid": rfid_uid, "terminal_id": terminal_id, "reason": reason},
+            terminal_id
+        )
+
+    def log_event(self, event):
+        self._send("log_event", event, LOG_TAIL_ROOM)
+
+    # =========================
+    # DELIVERY
+    # =========================
+    def emit(self, event, data, terminal_id):
+        self._send(event, data, terminal_room(terminal_id))
+
+    def _send(self, event, data, room):
+        self.bridge.emit(event, data, to=room, namespace=self.namespace)
+        self._count(event, self._room_size(room))
+
+    def _room_size(self, room):
+        server = getattr(self.socketio, 'server', None)
+        if server is None:
+            return 0
+        try:
+            return sum(1 for _ in server.manager.get_participants(self.namespace, room))
+        except KeyError:
+            # Namespace has no connected clients yet
+            return 0
+
+    def _discard_pending(self, terminal_id):
+        # A result or a new session makes a queued length update meaningless
+        with self._lock:
+            self._pending.pop(terminal_id, None)
+            self._last_sent.pop(terminal_id, None)
+
+    def _start_flusher(self):
+        # Called with self._lock held
+        if not self.running:
+            self.running = True
+            self.thread = threading.Thread(target=self._flush_loop, name='pin-update-flusher', daemon=True)
+            self.thread.start()
+
+    def _flush_loop(self):
+        while True:
+            with self._lock:
+                while self.running and not self._pending:
+                    self._wake.wait()
+                if not self.running:
+                    return
+                now = time.monotonic()
+                due = [
+                    (terminal_id, payload)
+                    for terminal_id, (deadline, payload) in self._pending.items()
+                    if deadline <= now
+                ]
+                for terminal_id, _ in due:
+                    del self._pending[terminal_id]
+                    self._last_sent[terminal_id] = now
+                if not due:
+                    self._wake.wait(min(deadline for deadline, _ in self._pending.values()) - now)
+                    continue
+
+            for terminal_id, payload in due:
+                self.emit("pin_updated", payload, terminal_id)
+
+    def stop(self):
+        with self._lock:
+            self.running = False
+            self._wake.notify()
+        if self.thread is not None:
+            self.thread.join(timeout=1)
+        self.bridge.stop()
+
+    # =========================
+    # METRICS
+    # =========================
+    def _count(self, event, fanout):
+        now = time.monotonic()
+        with self._stats_lock:
+            self.messages += 1
+            self.deliveries += fanout
+            self.max_fanout = max(self.max_fanout, fanout)
+            self.by_event[event] = self.by_event.get(event, 0) + 1
+            self._rate_messages += 1
+            elapsed = now - self._rate_started
+            if elapsed >= 1.0:
+                self.messages_per_sec = self._rate_messages / elapsed
+                self._rate_started = now
+                self._rate_messages = 0
+
+    def stats(self):
+        """Messages emitted, clients reached per message and merged pin updates."""
+        with self._stats_lock:
+            messages = self.messages or 1
+            stats = {
+                'messages': self.messages,
+                'messages_per_sec': round(self.messages_per_sec, 2),
+                'deliveries': self.deliveries,
+                'fanout_avg': round(self.deliveries / messages, 3),
+                'fanout_max': self.max_fanout,
+                'by_event': dict(self.by_event),
+                'pin_updates_coalesced': self.coalesced
+            }
+        stats['clients_per_terminal'] = self._clients_per_terminal()
+        stats['log_tail_clients'] = self._room_size(LOG_TAIL_ROOM)
+        return stats
+
+    def _clients_per_terminal(self):
+        server = getattr(self.socketio, 'server', None)
+        if server is None:
+            return {}
+        rooms = server.manager.rooms.get(self.namespace, {})
+        prefix = terminal_room('')
+        return {
+            room[len(prefix):]: len(members)
+            for room, members in list(rooms.items())
+            if isinstance(room, str) and room.startswith(prefix)
+        }
@@ -0,0 +1,251 @@
+"""
+Staged authentication pipeline for the AuthCoordinator.
+
+A submitted PIN entry flows through:
+
+    verify  ->  notify  (Socket.IO auth_result)
+            ->  record  (audit log)
+            ->  print   (receipt)
+
+Verification runs on the database's KDF worker pool. The other stages
+each have their own worker thread and bounded queue, so the UI hears
+auth_result as soon as verification finishes and a slow printer or a
+busy database only delays its own stage.
+
+Every verified result must reach the UI and the audit log: when the
+notify or record queue is full the KDF worker waits for room, and new PIN
+entries fail with PinHasherBusy until it catches up. The keypad thread
+never waits: a result known at submit time (the pool was full) is queued
+without blocking and dropped if its stage is full too. Otherwise only
+receipts are dropped.
+"""
+import queue
+import threading
+import time
+from app.models.pinhash import PinHasherBusy
+
+
+class LatencyStats:
+    """Count, mean and max of queue wait and run time for one stage."""
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self.count = 0
+        self.wait_total = 0.0
+        self.wait_max = 0.0
+        self.run_total = 0.0
+        self.run_max = 0.0
+
+    def record(self, wait, run):
+        with self._lock:
+            self.count += 1
+            self.wait_total += wait
+            self.run_total += run
+            if wait > self.wait_max:
+                self.wait_max = wait
+            if run > self.run_max:
+                self.run_max = run
+
+    def to_dict(self):
+        with self._lock:
+            count = self.count or 1
+            return {
+                'count': self.count,
+                'wait_avg_ms': round(self.wait_total * 1000 / count, 3),
+                'wait_max_ms': round(self.wait_max * 1000, 3),
+                'run_avg_ms': round(self.run_total * 1000 / count, 3),
+                'run_max_ms': round(self.run_max * 1000, 3)
+            }
+
+
+class Stage:
+    """One pipeline stage: a worker thread fed by a bounded queue."""
+
+    def __init__(self, name, handler, queue_size=64, overflow='drop'):
+        """
+        Args:
+            name (str): Stage name used in stats and thread names
+            handler (callable): Called with each submitted job
+            queue_size (int): Jobs allowed to wait
+            overflow (str): What submit() does when the queue is full:
+                'drop' discards the job, 'block' waits for room
+        """
+        if overflow not in ('drop', 'block'):
+            raise ValueError(f"Unknown overflow policy: {overflow}")
+        self.name = name
+        self.handler = handler
+        self.overflow = overflow
+        self.queue = queue.Queue(maxsize=queue_size)
+        self.latency = LatencyStats()
+        self.dropped = 0
+        self.blocked = 0
+        self.failed = 0
+        self.thread = None
+        self._lock = threading.Lock()
+
+    def start(self):
+        with self._lock:
+            if self.thread is None or not self.thread.is_alive():
+                self.thread = threading.Thread(
+                    target=self._run,
+                    name=f'auth-{self.name}',
+                    daemon=True
+                )
+                self.thread.start()
+
+    def submit(self, job, block=True):
+        """
+        Queue a job. With overflow='drop', or block=False, this never
+        blocks and returns False if the queue is full; with 'block' it
+        waits for room.
+        """
+        self.start()
+        item = (time.perf_counter(), job)
+        try:
+            self.queue.put_nowait(item)
+            return True
+        except queue.Full:
+            pass
+
+        if self.overflow == 'block' and block:
+            with self._lock:
+                self.blocked += 1
+            self.queue.put(item)
+            return True
+
+        with self._lock:
+            self.dropped += 1
+        print(f"[PIPELINE] {self.name} stage full, dropped job")
+        return False
+
+    def stop(self, timeout=None):
+        """Finish queued jobs and stop the worker."""
+        if self.thread is None or not self.thread.is_alive():
+            return
+        self.queue.put((None, None))
+        self.thread.join(timeout)
+
+    def stats(self):
+        stats = self.latency.to_dict()
+        stats.update({
+            'queued': self.queue.qsize(),
+            'dropped': self.dropped,
+            'blocked': self.blocked,
+            'failed': self.failed
+        })
+        return stats
+
+    def _run(self):
+        while True:
+            enqueued_at, job = self.queue.get()
+            if enqueued_at is None:
+                return
+
+            started = time.perf_counter()
+            try:
+                self.handler(job)
+            except Exception as e:
+                with self._lock:
+                    self.failed += 1
+                print(f"[PIPELINE ERROR] {self.name}: {e}")
+            self.latency.record(started - enqueued_at, time.perf_counter() - started)
+
+
+class AuthResult:
+    __slots__ = ('rfid_uid', 'success', 'message', 'submitted_at', 'terminal_id')
+
+    def __init__(self, rfid_uid, success, message, submitted_at, terminal_id=None):
+        self.rfid_uid = rfid_uid
+        self.success = success
+        self.message = message
+        self.submitted_at = submitted_at
+        self.terminal_id = terminal_id
+
+
+class AuthPipeline:
+    def __init__(self, verify, notify, record, print_receipt, queue_size=64):
+        """
+        Args:
+            verify (callable): (rfid_uid, pin) -> Future resolving to bool
+            notify, record, print_receipt (callable): Called with an AuthResult
+            queue_size (int): Bound for each background stage's queue
+        """
+        self.verify = verify
+        self.notify = notify
+        self.verify_latency = LatencyStats()
+        # Submit to auth_result emitted, as the user experiences it
+        self.result_latency = LatencyStats()
+        self.notify_stage = Stage('notify', self._notify, queue_size, overflow='block')
+        self.record_stage = Stage('record', record, queue_size, overflow='block')
+        self.print_stage = Stage('print', print_receipt, queue_size)
+        # Verifications submitted but not yet dispatched to the stages
+        self._inflight = 0
+        self._idle = threading.Condition()
+
+    @property
+    def stages(self):
+        return (self.notify_stage, self.record_stage, self.print_stage)
+
+    def submit(self, rfid_uid, pin, terminal_id=None):
+        """Start authenticating a PIN entry; never blocks on the KDF."""
+        submitted_at = time.perf_counter()
+        try:
+            future = self.verify(rfid_uid, pin)
+        except Exception as e:
+            print(f"[AUTH ERROR] {e}")
+            self._dispatch(AuthResult(rfid_uid, False, "Authentication error", submitted_at, terminal_id), block=False)
+            return
+        with self._idle:
+            self._inflight += 1
+        if future.done():
+            # Failed fast (PinHasherBusy): add_done_callback would run the
+            # dispatch here on the caller's (keypad) thread
+            self._on_verified(rfid_uid, future, submitted_at, terminal_id, block=False)
+            return
+        future.add_done_callback(
+            lambda done: self._on_verified(rfid_uid, done, submitted_at, terminal_id)
+        )
+
+    def _on_verified(self, rfid_uid, future, submitted_at, terminal_id=None, block=True):
+        try:
+            success = future.result()
+            message = "Access granted" if success else "Invalid PIN"
+        except PinHasherBusy:
+            success = False
+            message = "System busy, please try again"
+        except Exception as e:
+            print(f"[AUTH ERROR] {e}")
+            success = False
+            message = "Authentication error"
+
+        self.verify_latency.record(0.0, time.perf_counter() - submitted_at)
+        self._dispatch(AuthResult(rfid_uid, success, message, submitted_at, terminal_id), block)
+        with self._idle:
+            self._inflight -= 1
+            self._idle.notify_all()
+
+    def _notify(self, result):
+        self.notify(result)
+        self.result_latency.record(0.0, time.perf_counter() - result.submitted_at)
+
+    def _dispatch(self, result, block=True):
+        # Notify first so the UI is not held up by the slower stages
+        self.notify_stage.submit(result, block)
+        self.record_stage.submit(result, block)
+        self.print_stage.submit(result, block)
+
+    def stop(self, timeout=None):
+        """Wait for in-flight verifications, then drain and stop the stages."""
+        with self._idle:
+            self._idle.wait_for(lambda: self._inflight == 0, timeout)
+        for stage in self.stages:
+            stage.stop(timeout)
+
+    def stats(self):
+        stats = {
+            'verify': self.verify_latency.to_dict(),
+            'submit_to_result': self.result_latency.to_dict()
+        }
+        for stage in self.stages:
+            stats[stage.name] = stage.stats()
+        return stats
@@ -3,70 +3,149 @@ Printer module for the Raspberry Pi hardware appliance.
 """
 import threading
 import time
+from app.config import Config
+from app.hardware.receipts import AUTH_TEMPLATE, TRANSACTION_TEMPLATE, create_endpoint
+from app.hardware.spooler import PrintSpooler
+from app.metrics import registry
+from app.models.database import db
 
-# Note: This import will only work on Raspberry Pi with a connected ESC/POS printer
-# from escpos.printer import Usb
+PRINT_SECONDS = registry.histogram(
+    'appliance_print_seconds', 'Rendering and writing one receipt to the printer', labels=('kind',))
+PRINT_ATTEMPTS = registry.counter(
+    'appliance_print_attempts_total', 'Print attempts by receipt kind and result', labels=('kind', 'result'))
+PRINT_QUEUE = registry.gauge('appliance_print_queue_depth', 'Print jobs waiting for the spooler thread')
+PRINT_REJECTED = registry.counter(
+    'appliance_print_rejected_total', 'Receipts rejected because the print queue was full', labels=('kind',))
 
 class Printer:
-    def __init__(self):
-        """Initialize the thermal printer."""
-        # In a real implementation, you would initialize the printer here
-        # self.printer = Usb(0x04b8, 0x0202)  # Example vendor/product IDs
-        pass
+    def __init__(self, database=None, endpoint=None, prints=True, on_enqueue=None):
+        """
+        Initialize the thermal printer and its print spooler.
+        
+        Args:
+            database (Database): Database for the print_jobs table
+            endpoint: Object with a write(bytes) method; defaults to the
+                endpoint selected by Config.PRINTER_BACKEND
+            prints (bool): False to only queue jobs in the table for the
+                hardware process's spooler (no printer is opened)
+            on_enqueue (callable): See PrintSpooler
+        """
+        self.endpoint = endpoint
+        if self.endpoint is None and prints:
+            self.endpoint = create_endpoint(
+                Config.PRINTER_BACKEND,
+                output_path=Config.PRINTER_OUTPUT_PATH,
+                vendor_id=Config.PRINTER_USB_VENDOR_ID,
+                product_id=Config.PRINTER_USB_PRODUCT_ID
+            )
+        self.spooler = PrintSpooler(
+            database or db,
+            {
+                'auth': self._measured('auth', self._print_auth_job),
+                'transaction': self._measured('transaction', self._print_transaction_job)
+            },
+            queue_size=Config.PRINTER_QUEUE_SIZE,
+            max_attempts=Config.PRINTER_MAX_ATTEMPTS,
+            retry_base=Config.PRINTER_RETRY_BASE,
+            retry_max=Config.PRINTER_RETRY_MAX,
+            prints=prints,
+            on_enqueue=on_enqueue
+        )
+        if prints:
+            PRINT_QUEUE.set_function(self.spooler.queue.qsize)
+    
+    def start(self):
+        """Start the spooler so jobs left from a previous run are printed."""
+        self.spooler.start()
+    
+    def stop(self):
+        self.spooler.stop()
     
     def print_receipt(self, rfid_uid, success, message):
         """
-        Print a receipt for the authentication attempt.
+        Queue a receipt for the authentication attempt.
+        
+        Returns immediately; the spooler thread prints it.
         
         Args:
             rfid_uid (str): The RFID UID of the card
             success (bool): Whether authentication was successful
             message (str): Message to print on the receipt
+        
+        Returns:
+            bool: False if the print queue was full
         """
-        try:
-            # In a real implementation:
-            # self.printer.text("Authentication Result\n")
-            # self.printer.text("===================\n")
-            # self.printer.text(f"Card ID: {rfid_uid}\n")
-            # self.printer.text(f"Status: {'SUCCESS' if success else 'FAILED'}\n")
-            # self.printer.text(f"Message: {message}\n")
-            # self.printer.text(f"Time: {time.strftime('%Y-%m-%d %H:%M:%S')}\n")
-            # self.printer.cut()
-            
-            # For simulation, just print to console
-            print("=" * 30)
-            print("Authentication Result")
-            print("===================")
-            print(f"Card ID: {rfid_uid}")
-            print(f"Status: {'SUCCESS' if success else 'FAILED'}")
-            print(f"Message: {message}")
-            print(f"Time: {time.strftime('%Y-%m-%d %H:%M:%S')}")
-            print("=" * 30)
-            
-        except Exception as e:
-            print(f"Error printing receipt: {e}")
-
+        return self._submit('auth', {
+            'rfid_uid': rfid_uid,
+            'success': bool(success),
+            'message': message,
+            'time': time.strftime('%Y-%m-%d %H:%M:%S')
+        })
+    
     def print_transaction_receipt(self, account_id, title, amount, balance):
         """
-        Print a transaction receipt (balance inquiry or withdrawal).
+        Queue a transaction receipt (balance inquiry or withdrawal).
+        
+        Returns immediately; the spooler thread prints it.
 
         Args:
             account_id (str): Account identifier or card UID
             title (str): Title for the receipt (e.g., 'Withdrawal')
             amount (float): Transaction amount (0 for balance inquiry)
             balance (float): Account balance after transaction
+
+        Returns:
+            bool: False if the print queue was full
         """
-        try:
-            print("=" * 30)
-            print(title)
-            print("=" * 30)
-            print(f"Account: {account_id}")
-            print(f"Amount: ${amount:.2f}")
-            print(f"Balance: ${balance:.2f}")
-            print(f"Time: {time.strftime('%Y-%m-%d %H:%M:%S')}")
-            print("=" * 30)
-        except Exception as e:
-            print(f"Error printing transaction receipt: {e}")
+        return self._submit('transaction', {
+            'account_id': account_id,
+            'title': title,
+            'amount': amount,
+            'balance': balance,
+            'time': time.strftime('%Y-%m-%d %H:%M:%S')
+        })
+    
+    def _submit(self, kind, payload):
+        if self.spooler.submit(kind, payload):
+            return True
+        PRINT_REJECTED.labels(kind).inc()
+        return False
+    
+    @staticmethod
+    def _measured(kind, handler):
+        """Wrap a spooler handler to record its print time and result."""
+        seconds = PRINT_SECONDS.labels(kind)
+        printed = PRINT_ATTEMPTS.labels(kind, 'printed')
+        failed = PRINT_ATTEMPTS.labels(kind, 'failed')
+
+        def run(job):
+            try:
+                with seconds.time():
+                    handler(job)
+            except Exception:
+                failed.inc()
+                raise
+            printed.inc()
+        return run
+
+    def _print_auth_job(self, job):
+        """Print an authentication receipt; errors propagate so the spooler retries."""
+        self.endpoint.write(AUTH_TEMPLATE.render({
+            'rfid_uid': job['rfid_uid'],
+            'status': 'SUCCESS' if job['success'] else 'FAILED',
+            'message': job['message'],
+            'time': job['time']
+        }))
+
+    def _print_transaction_job(self, job):
+        """Print a transaction receipt; errors propagate so the spooler retries."""
+        self.endpoint.write(TRANSACTION_TEMPLATE.render({
+            'title': job['title'],
+            'account_id': job['account_id'],
+            'amount': f"{job['amount']:.2f}",
+            'balance': f"{job['balance']:.2f}",
+            'time': job['time']
+        }))
 
 # Example usage:
 # if __name__ == "__main__":
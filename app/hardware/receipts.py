@@ -0,0 +1,193 @@
+"""
+Precompiled ESC/POS receipt templates and printer endpoints.
+
+Each receipt layout is compiled once into a list of static byte chunks and
+named slots. Rendering copies the chunks and the encoded slot values into
+a preallocated buffer, and the finished receipt goes to the printer in a
+single write (one USB bulk transfer) instead of one transfer per line.
+"""
+import re
+import string
+import threading
+from app.hardware.backends import get_backend
+
+# ESC/POS command bytes
+ESC = b'\x1b'
+GS = b'\x1d'
+INIT = ESC + b'@'
+ALIGN_LEFT = ESC + b'a\x00'
+ALIGN_CENTER = ESC + b'a\x01'
+BOLD_ON = ESC + b'E\x01'
+BOLD_OFF = ESC + b'E\x00'
+FEED_AND_CUT = GS + b'V\x41\x03'  # feed 3 lines, then partial cut
+
+# Printers start in code page PC437
+ENCODING = 'cp437'
+
+
+class ReceiptTemplate:
+    """
+    A receipt layout compiled to byte chunks with slots for dynamic fields.
+
+    The layout is a sequence of bytes (commands or fixed text) and str
+    (text with {field} placeholders). Every field gets a maximum width in
+    bytes; longer values are truncated so the buffer never grows.
+    """
+
+    def __init__(self, name, layout, widths):
+        self.name = name
+        self.widths = dict(widths)
+        self.segments = []  # bytes or field name, in print order
+        self._compile(layout)
+        self.max_size = sum(
+            len(segment) if isinstance(segment, bytes) else self.widths[segment]
+            for segment in self.segments
+        )
+        self._buffer = bytearray(self.max_size)
+        self._lock = threading.Lock()
+
+    def _compile(self, layout):
+        pending = bytearray()
+        for part in layout:
+            if isinstance(part, bytes):
+                pending += part
+                continue
+            for literal, field, _, _ in string.Formatter().parse(part):
+                pending += literal.encode(ENCODING)
+                if field is None:
+                    continue
+                if field not in self.widths:
+                    raise ValueError(f"Template {self.name}: no width for field '{field}'")
+                if pending:
+                    self.segments.append(bytes(pending))
+                    pending.clear()
+                self.segments.append(field)
+        if pending:
+            self.segments.append(bytes(pending))
+
+    def render(self, values):
+        """
+        Render the receipt.
+
+        Args:
+            values (dict): Field name -> value (converted with str())
+
+        Returns:
+            bytes: The complete ESC/POS byte stream
+        """
+        with self._lock:
+            buffer = self._buffer
+            position = 0
+            for segment in self.segments:
+                if isinstance(segment, bytes):
+                    data = segment
+                else:
+                    data = str(values[segment]).encode(ENCODING, errors='replace')[:self.widths[segment]]
+                end = position + len(data)
+                buffer[position:end] = data
+                position = end
+            return bytes(buffer[:position])
+
+
+AUTH_TEMPLATE = ReceiptTemplate('auth', [
+    INIT,
+    ALIGN_CENTER, BOLD_ON, 'Authentication Result\n', BOLD_OFF,
+    '===================\n',
+    ALIGN_LEFT,
+    'Card ID: {rfid_uid}\n',
+    'Status: {status}\n',
+    'Message: {message}\n',
+    'Time: {time}\n',
+    FEED_AND_CUT
+], widths={'rfid_uid': 32, 'status': 7, 'message': 64, 'time': 19})
+
+TRANSACTION_TEMPLATE = ReceiptTemplate('transaction', [
+    INIT,
+    ALIGN_CENTER, BOLD_ON, '{title}\n', BOLD_OFF,
+    '==============================\n',
+    ALIGN_LEFT,
+    'Account: {account_id}\n',
+    'Amount: ${amount}\n',
+    'Balance: ${balance}\n',
+    'Time: {time}\n',
+    FEED_AND_CUT
+], widths={'title': 32, 'account_id': 32, 'amount': 16, 'balance': 16, 'time': 19})
+
+
+# =========================
+# ENDPOINTS
+# =========================
+_CONTROL_SEQUENCE = re.compile(rb'\x1b[@]|\x1b[aE].|\x1dV..')
+
+
+class ConsoleEndpoint:
+    """Prints the text of each receipt to stdout (simulation)."""
+
+    def __init__(self):
+        self.writes = 0
+
+    def write(self, data):
+        self.writes += 1
+        text = _CONTROL_SEQUENCE.sub(b'', data).decode(ENCODING)
+        print("=" * 30)
+        print(text, end='')
+        print("=" * 30)
+
+
+class FileEndpoint:
+    """
+    Fake USB endpoint that appends every write to a file.
+
+    Records the size of each write so tests can check that a receipt is
+    sent as one bulk transfer.
+    """
+
+    def __init__(self, path):
+        self.path = path
+        self.write_sizes = []
+        self._lock = threading.Lock()
+
+    @property
+    def writes(self):
+        return len(self.write_sizes)
+
+    def write(self, data):
+        with self._lock:
+            with open(self.path, 'ab') as f:
+                f.write(data)
+            self.write_sizes.append(len(data))
+
+
+class UsbEndpoint:
+    """
+    ESC/POS printer on USB, opened on first use through the hardware
+    backend (python-escpos on the Pi, an in-memory printer on the simulator).
+    """
+
+    def __init__(self, vendor_id, product_id):
+        self.vendor_id = vendor_id
+        self.product_id = product_id
+        self.device = None
+        self.writes = 0
+
+    def write(self, data):
+        if self.device is None:
+            self.device = get_backend().create_usb_printer(self.vendor_id, self.product_id)
+        try:
+            self.device._raw(data)
+        except Exception:
+            # Reopen on the next attempt (e.g. after the printer was replugged)
+            self.device = None
+            raise
+        self.writes += 1
+
+
+def create_endpoint(backend, output_path=None, vendor_id=None, product_id=None):
+    """Build the printer endpoint selected by PRINTER_BACKEND."""
+    if backend == 'usb':
+        return UsbEndpoint(vendor_id, product_id)
+    if backend == 'file':
+        return FileEndpoint(output_path)
+    if backend == 'console':
+        return ConsoleEndpoint()
+    raise ValueError(f"Unknown printer backend: {backend}")
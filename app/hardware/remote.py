@@ -0,0 +1,224 @@
+"""
+Hardware access across processes for the split deployment.
+
+The hardware process runs the AuthCoordinator and a HardwareAgent that
+answers requests arriving through the broker. Web workers use a
+RemoteCoordinator in its place: it offers the coordinator methods the API
+and Socket.IO handlers need and forwards them as requests. Receipts are
+written to the print_jobs table directly and the hardware process's
+spooler is woken to print them. PIN changes are announced so the hardware
+process refreshes its credential cache; after a bulk import, or a broker
+reconnect when notices may have been missed, it reloads the whole cache.
+Withdrawals made in a worker are sent to the hardware process's event
+ring, and every event it records is broadcast back, so each worker keeps a
+mirror of the ring to answer /api/logs/recent and feed its tail streams.
+"""
+import threading
+import uuid
+from app.broker import APPLIANCE_CHANNEL, BrokerClient
+from app.config import Config
+from app.hardware.events import EventRing, transaction_event
+from app.hardware.printer import Printer
+from app.models.database import db
+
+
+class HardwareUnavailable(RuntimeError):
+    """The hardware process did not answer a request in time."""
+
+
+class HardwareAgent:
+    def __init__(self, coordinator, database=None, path=None):
+        """
+        Args:
+            coordinator (AuthCoordinator): The process's coordinator
+            database (Database): Database whose credential cache is kept fresh
+            path (str): Broker socket path (defaults to Config.BROKER_SOCKET)
+        """
+        self.coordinator = coordinator
+        self.database = database or db
+        path = path or Config.BROKER_SOCKET
+        self.publisher = BrokerClient(path)
+        self.listener = BrokerClient(path)
+        self.operations = {
+            'pipeline_stats': coordinator.get_stats,
+            'session_stats': coordinator.get_session_stats,
+            'sessions': coordinator.list_sessions,
+            'rfid_stats': coordinator.get_rfid_stats,
+            'notification_stats': coordinator.get_notification_stats,
+            'metrics': coordinator.get_metrics,
+            'cancel_session': coordinator.cancel_session,
+            'events_since': coordinator.events_since
+        }
+        coordinator.event_listeners.append(self._publish_event)
+        self.connections = 0
+        self.thread = None
+
+    def start(self):
+        self.thread = threading.Thread(target=self._run, name='hardware-agent', daemon=True)
+        self.thread.start()
+
+    def stop(self):
+        self.listener.close()
+        self.publisher.close()
+
+    def _on_connect(self):
+        self.connections += 1
+        if self.connections > 1:
+            # PIN changes announced while we were disconnected are lost
+            self.database.load_credentials()
+            print("[AGENT] Broker reconnected, credential cache reloaded")
+
+    def _run(self):
+        for message in self.listener.listen(on_connect=self._on_connect):
+            if message.get('channel') != APPLIANCE_CHANNEL:
+                continue
+            kind = message.get('type')
+            try:
+                if kind == 'request':
+                    self._answer(message)
+                elif kind == 'credentials' and message.get('rfid_uid') is None:
+                    # A bulk import changed many cards
+                    self.database.load_credentials()
+                elif kind == 'credentials':
+                    self.database.reload_credential(message['rfid_uid'])
+                elif kind == 'print':
+                    self.coordinator.printer.spooler.wake()
+                elif kind == 'record_event':
+                    self.coordinator.record_event(message['event_type'], message['data'])
+            except Exception as e:
+                print(f"[AGENT ERROR] Handling {kind} failed: {e}")
+
+    def _answer(self, message):
+        reply = {'channel': APPLIANCE_CHANNEL, 'type': 'reply', 'id': message['id']}
+        operation = self.operations.get(message.get('op'))
+        if operation is None:
+            reply['error'] = f"Unknown operation: {message.get('op')}"
+        else:
+            try:
+                reply['result'] = operation(*message.get('args', []))
+            except Exception as e:
+                reply['error'] = str(e)
+        self.publisher.publish(reply)
+
+    def _publish_event(self, event):
+        self.publisher.publish({'channel': APPLIANCE_CHANNEL, 'type': 'log_event', 'event': event})
+
+
+class RemoteCoordinator:
+    """Stands in for the AuthCoordinator in a web worker."""
+
+    def __init__(self, socketio, timeout=None):
+        """
+        Args:
+            socketio: Flask-SocketIO instance whose client manager is a
+                UnixSocketManager (see create_app)
+            timeout (float): Seconds to wait for the hardware process
+        """
+        self.socketio = socketio
+        self.timeout = timeout or Config.HARDWARE_RPC_TIMEOUT
+        manager = socketio.server.manager
+        manager.handlers.append(self._on_message)
+        self.broker = manager.client
+        # Waits must suit the server's async mode (green events under eventlet)
+        self._create_event = socketio.server.eio.create_event
+        self._pending = {}
+        self._lock = threading.Lock()
+        self.rfid_reader = None
+        self.keypad = None
+        self.printer = Printer(prints=False, on_enqueue=self._print_queued)
+        # Mirror of the hardware process's event ring, fed by its broadcasts
+        self.events = EventRing(Config.EVENT_RING_SIZE, start=0)
+        self._events_loaded = False
+        db.credential_listeners.append(self._credentials_changed)
+
+    def _call(self, operation, *args):
+        request_id = uuid.uuid4().hex
+        event = self._create_event()
+        with self._lock:
+            self._pending[request_id] = [event, None]
+        try:
+            sent = self.broker.publish({
+                'channel': APPLIANCE_CHANNEL,
+                'type': 'request',
+                'id': request_id,
+                'op': operation,
+                'args': list(args)
+            })
+            if not sent or not event.wait(self.timeout):
+                raise HardwareUnavailable(f"no answer to {operation}")
+        finally:
+            with self._lock:
+                reply = self._pending.pop(request_id)[1]
+        if 'error' in reply:
+            raise HardwareUnavailable(reply['error'])
+        return reply['result']
+
+    def _on_message(self, message):
+        if message.get('channel') != APPLIANCE_CHANNEL:
+            return
+        if message.get('type') == 'log_event':
+            self.events.extend([message['event']])
+            return
+        if message.get('type') != 'reply':
+            return
+        with self._lock:
+            waiting = self._pending.get(message.get('id'))
+            if waiting is None:
+                return  # Another worker's request
+            waiting[1] = message
+        waiting[0].set()
+
+    def _print_queued(self):
+        self.broker.publish({'channel': APPLIANCE_CHANNEL, 'type': 'print'})
+
+    def _credentials_changed(self, rfid_uid):
+        self.broker.publish({'channel': APPLIANCE_CHANNEL, 'type': 'credentials', 'rfid_uid': rfid_uid})
+
+    def record_transaction(self, account_id, amount, result):
+        data = transaction_event(account_id, amount, result)
+        if data is not None:
+            self.broker.publish({
+                'channel': APPLIANCE_CHANNEL,
+                'type': 'record_event',
+                'event_type': 'transaction',
+                'data': data
+            })
+
+    def _load_events(self):
+        # Events recorded before this worker started are only in the hardware process
+        if not self._events_loaded:
+            self.events.extend(self._call('events_since', 0)['events'])
+            self._events_loaded = True
+
+    def recent_events(self, limit=50, event_type=None):
+        self._load_events()
+        return self.events.recent(limit, event_type)
+
+    def events_since(self, seq):
+        self._load_events()
+        return self.events.since(seq)
+
+    def get_stats(self):
+        return self._call('pipeline_stats')
+
+    def get_session_stats(self):
+        return self._call('session_stats')
+
+    def list_sessions(self):
+        return self._call('sessions')
+
+    def get_rfid_stats(self):
+        return self._call('rfid_stats')
+
+    def get_notification_stats(self):
+        return self._call('notification_stats')
+
+    def get_metrics(self):
+        return self._call('metrics')
+
+    def cancel_session(self, terminal_id):
+        return self._call('cancel_session', terminal_id)
+
+    def shutdown(self):
+        db.credential_listeners.remove(self._credentials_changed)
+        self.events.close()
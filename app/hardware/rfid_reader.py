@@ -1,19 +1,83 @@
 """
 RFID Reader module for the Raspberry Pi hardware appliance.
+
+The reader polls fast for a few seconds after a card was seen and backs off
+while the field stays empty. With RFID_IRQ_PIN set, the reader's IRQ line
+wakes the poller as soon as a card arrives and polling only runs at the
+idle rate as a safety net. Repeated reads of the same card inside the
+dedupe window are dropped without pausing the reader.
 """
 
 import threading
-import time
-import RPi.GPIO as GPIO
-from mfrc522 import SimpleMFRC522
+from app.config import Config
+from app.hardware.backends import get_backend
+from app.metrics import registry
+
+RFID_READS = registry.counter(
+    'appliance_rfid_reads_total', 'Card reads by what became of them', labels=('outcome',))
+TAP_TO_PROMPT_SECONDS = registry.histogram(
+    'appliance_rfid_tap_to_request_pin_seconds', 'Card arrival to request_pin emitted')
+
+
+class UidDedupe:
+    """Remembers recently read UIDs; a UID is a duplicate until it has been absent for `window` seconds."""
+
+    def __init__(self, window, max_entries=256):
+        self.window = window
+        self.max_entries = max_entries
+        self._last_seen = {}
+
+    def seen(self, uid, now):
+        """Record a read; returns True if the same card was read within the window."""
+        last = self._last_seen.get(uid)
+        self._last_seen[uid] = now
+        if len(self._last_seen) > self.max_entries:
+            self._prune(now)
+        return last is not None and now - last < self.window
+
+    def _prune(self, now):
+        self._last_seen = {
+            uid: seen for uid, seen in self._last_seen.items()
+            if now - seen < self.window
+        }
 
 
 class RFIDReader:
-    def __init__(self, coordinator):
+    def __init__(self, coordinator, backend=None):
         # ?? THIS is where your snippet goes
         self.coordinator = coordinator
         self.running = False
         self.thread = None
+        self.backend = backend or get_backend()
+        self.clock = self.backend.clock
+        self.gpio = self.backend.GPIO
+        GPIO = self.gpio
+
+        self.fast_interval = Config.RFID_POLL_FAST_MS / 1000
+        self.idle_interval = Config.RFID_POLL_IDLE_MS / 1000
+        self.backoff = Config.RFID_POLL_BACKOFF
+        self.fast_window = Config.RFID_FAST_WINDOW
+        self.dedupe = UidDedupe(Config.RFID_DEDUPE_WINDOW)
+        self.irq_pin = Config.RFID_IRQ_PIN
+        # Set by the IRQ edge; stop() also sets it to end the wait
+        self._card_event = threading.Event()
+        self._irq_at = None
+
+        self._stats_lock = threading.Lock()
+        self.polls = 0
+        self.reads = 0
+        self.duplicates = 0
+        self.busy_ignored = 0
+        self.interval = self.fast_interval
+        self._rate_started = self.clock.monotonic()
+        self._rate_polls = 0
+        self.polls_per_sec = 0.0
+        self.tap_latency_count = 0
+        self.tap_latency_total = 0.0
+        self.tap_latency_max = 0.0
+        self._started = RFID_READS.labels('session_started')
+        self._duplicate = RFID_READS.labels('duplicate')
+        self._busy = RFID_READS.labels('busy')
 
         # Ensure BCM mode (same as keypad)
         if GPIO.getmode() != GPIO.BCM:
@@ -22,12 +86,21 @@ class RFIDReader:
         GPIO.setwarnings(False)
 
         try:
-            self.reader = SimpleMFRC522()
+            self.reader = self.backend.create_rfid_reader()
             print("RFID Reader initialized.")
         except Exception as e:
             print(f"[RFID ERROR] Init failed: {e}")
             self.reader = None
 
+        if self.irq_pin is not None:
+            try:
+                # The MFRC522 pulls IRQ low when it raises an interrupt
+                GPIO.setup(self.irq_pin, GPIO.IN, pull_up_down=GPIO.PUD_UP)
+                GPIO.add_event_detect(self.irq_pin, GPIO.FALLING, callback=self._on_irq)
+            except RuntimeError as e:
+                print(f"[RFID] IRQ pin unavailable ({e}), polling only")
+                self.irq_pin = None
+
     def start(self):
         if self.reader and not self.running:
             self.running = True
@@ -40,26 +113,115 @@ class RFIDReader:
 
     def stop(self):
         self.running = False
+        self._card_event.set()
         if self.thread:
             self.thread.join()
+        if self.irq_pin is not None:
+            self.gpio.remove_event_detect(self.irq_pin)
+
+    def _on_irq(self, channel):
+        self._irq_at = self.clock.monotonic()
+        self._card_event.set()
 
     def _read_rfid_loop(self):
+        last_activity = self.clock.monotonic()
+        last_empty_poll = last_activity
         while self.running:
             try:
+                if self.irq_pin is not None:
+                    self.clock.wait(self._card_event, self.interval)
+                    self._card_event.clear()
+                else:
+                    self.clock.sleep(self.interval)
+                if not self.running:
+                    break
+
                 uid, _ = self.reader.read_no_block()
+                now = self.clock.monotonic()
+                self._count_poll(now)
 
                 if uid:
-                    uid = str(uid)
+                    last_activity = now
+                    self._handle_uid(str(uid), self._irq_at or last_empty_poll)
+                    self._irq_at = None
+                else:
+                    last_empty_poll = now
+                self._adapt_interval(now - last_activity)
 
-                    # ?? Block re-reads while PIN is active
-                    if self.coordinator.current_rfid is None:
-                        print(f"RFID card read: {uid}")
-                        self.coordinator.handle_rfid_detected(uid)
+            except Exception as e:
+                print(f"[RFID ERROR] {e}")
+                self.clock.sleep(1)
 
-                    time.sleep(2)  # debounce
+    def _adapt_interval(self, idle_for):
+        if self.irq_pin is not None:
+            # The IRQ catches new cards; polling is only a safety net
+            self.interval = self.fast_interval if idle_for < self.fast_window else self.idle_interval
+        elif idle_for < self.fast_window:
+            self.interval = self.fast_interval
+        else:
+            self.interval = min(self.idle_interval, self.interval * self.backoff)
 
-                time.sleep(0.1)
+    def _handle_uid(self, uid, arrived_at):
+        """
+        Start a session for a newly presented card.
 
-            except Exception as e:
-                print(f"[RFID ERROR] {e}")
-                time.sleep(1)
+        Args:
+            uid (str): Card UID
+            arrived_at (float): Clock time the card arrived at the latest
+                (the IRQ edge, or the last poll that found no card)
+        """
+        with self._stats_lock:
+            self.reads += 1
+
+        # A card held on the reader keeps refreshing its entry
+        if self.dedupe.seen(uid, self.clock.monotonic()):
+            with self._stats_lock:
+                self.duplicates += 1
+            self._duplicate.inc()
+            return
+
+        # The session table checks and claims the terminal and the card in one step
+        if not self.coordinator.try_start_session(uid):
+            with self._stats_lock:
+                self.busy_ignored += 1
+            self._busy.inc()
+            return
+
+        print(f"RFID card read: {uid}")
+        latency = self.clock.monotonic() - arrived_at
+        self._started.inc()
+        TAP_TO_PROMPT_SECONDS.observe(latency)
+        with self._stats_lock:
+            self.tap_latency_count += 1
+            self.tap_latency_total += latency
+            self.tap_latency_max = max(self.tap_latency_max, latency)
+
+    def _count_poll(self, now):
+        with self._stats_lock:
+            self.polls += 1
+            self._rate_polls += 1
+            elapsed = now - self._rate_started
+            if elapsed >= 1.0:
+                self.polls_per_sec = self._rate_polls / elapsed
+                self._rate_started = now
+                self._rate_polls = 0
+
+    def stats(self):
+        """Polling and tap-to-request_pin counters (times in clock seconds)."""
+        with self._stats_lock:
+            count = self.tap_latency_count or 1
+            return {
+                'backend': self.backend.name,
+                'mode': 'irq' if self.irq_pin is not None else 'poll',
+                'polls': self.polls,
+                'polls_per_sec': round(self.polls_per_sec, 2),
+                'poll_interval_ms': round(self.interval * 1000, 1),
+                'reads': self.reads,
+                'duplicates_suppressed': self.duplicates,
+                'ignored_while_busy': self.busy_ignored,
+                'tap_to_request_pin': {
+                    'count': self.tap_latency_count,
+                    'avg_ms': round(self.tap_latency_total * 1000 / count, 3),
+                    'max_ms': round(self.tap_latency_max * 1000, 3)
+                }
+            }
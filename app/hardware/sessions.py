@@ -0,0 +1,275 @@
+"""
+PIN-entry sessions for the AuthCoordinator.
+
+Each terminal (a keypad/reader pair or a web kiosk) has at most one
+session at a time, and a card can only be in one session. A session moves
+through explicit states:
+
+    awaiting_pin  ->  submitted   (PIN handed to the auth pipeline)
+                  ->  timed_out   (no key within the PIN-entry timeout)
+                  ->  cancelled   (replaced by a new tap, or cancelled)
+
+Only awaiting_pin sessions are kept in the SessionTable. The table lock
+guards membership and is always taken before a session's own lock; key
+presses that only edit the PIN buffer take the session lock alone.
+Timeouts are kept in a heap served by one timer thread, so thousands of
+open sessions cost one thread and O(log n) per key press.
+"""
+import heapq
+import itertools
+import threading
+from app.hardware.backends.clock import SystemClock
+
+
+AWAITING_PIN = 'awaiting_pin'
+SUBMITTED = 'submitted'
+TIMED_OUT = 'timed_out'
+CANCELLED = 'cancelled'
+
+TRANSITIONS = {
+    AWAITING_PIN: (SUBMITTED, TIMED_OUT, CANCELLED),
+    SUBMITTED: (),
+    TIMED_OUT: (),
+    CANCELLED: (),
+}
+
+
+class SessionStateError(RuntimeError):
+    """Raised for a transition the state machine does not allow."""
+
+
+class Session:
+    __slots__ = ('terminal_id', 'rfid_uid', 'state', 'pin_buffer', 'started_at', 'deadline', 'lock')
+
+    def __init__(self, terminal_id, rfid_uid, started_at, deadline):
+        self.terminal_id = terminal_id
+        self.rfid_uid = rfid_uid
+        self.state = AWAITING_PIN
+        self.pin_buffer = ""
+        self.started_at = started_at
+        self.deadline = deadline
+        self.lock = threading.Lock()
+
+    def transition(self, state):
+        """Move to a new state; call with self.lock held."""
+        if state not in TRANSITIONS[self.state]:
+            raise SessionStateError(f"Session {self.terminal_id}: {self.state} -> {state} not allowed")
+        self.state = state
+
+    def to_dict(self, now):
+        return {
+            'terminal_id': self.terminal_id,
+            'rfid_uid': self.rfid_uid,
+            'state': self.state,
+            'pin_length': len(self.pin_buffer),
+            'age_seconds': round(now - self.started_at, 3),
+            'expires_in': round(max(0.0, self.deadline - now), 3)
+        }
+
+
+class TimeoutScheduler:
+    """
+    Calls on_timeout(session) once a session's deadline has passed.
+
+    Deadlines live in a min-heap. Extending a deadline pushes a new entry
+    and leaves the old one in place; stale entries are skipped when popped.
+    """
+
+    def __init__(self, on_timeout, clock=None):
+        self.on_timeout = on_timeout
+        self.clock = clock or SystemClock()
+        self._heap = []
+        self._counter = itertools.count()
+        self._lock = threading.Lock()
+        self._wake = threading.Event()
+        self.running = False
+        self.thread = None
+
+    def schedule(self, session, deadline):
+        with self._lock:
+            heapq.heappush(self._heap, (deadline, next(self._counter), session))
+            first = self._heap[0][2] is session
+            if not self.running:
+                self.running = True
+                self.thread = threading.Thread(target=self._run, name='session-timeouts', daemon=True)
+                self.thread.start()
+        if first:
+            self._wake.set()
+
+    def pending(self):
+        with self._lock:
+            return len(self._heap)
+
+    def stop(self, timeout=None):
+        with self._lock:
+            if not self.running:
+                return
+            self.running = False
+        self._wake.set()
+        self.thread.join(timeout)
+
+    def _run(self):
+        while True:
+            due = []
+            with self._lock:
+                if not self.running:
+                    return
+                now = self.clock.monotonic()
+                while self._heap and self._heap[0][0] <= now:
+                    deadline, _, session = heapq.heappop(self._heap)
+                    # Skip entries superseded by a later deadline or a finished session
+                    if session.deadline == deadline and session.state == AWAITING_PIN:
+                        due.append(session)
+                wait = self._heap[0][0] - now if self._heap else None
+                self._wake.clear()
+
+            for session in due:
+                try:
+                    self.on_timeout(session)
+                except Exception as e:
+                    print(f"[SESSION ERROR] Timeout handler failed: {e}")
+
+            if due:
+                continue
+            if wait is None:
+                self._wake.wait()
+            else:
+                self.clock.wait(self._wake, wait)
+
+
+class SessionTable:
+    def __init__(self, pin_timeout, on_timeout, clock=None):
+        """
+        Args:
+            pin_timeout (float): Seconds a session may wait for the next key
+            on_timeout (callable): Called with each session that timed out,
+                after it has left the table
+            clock: Clock with monotonic()/wait() (defaults to the system clock)
+        """
+        self.pin_timeout = pin_timeout
+        self.clock = clock or SystemClock()
+        self.lock = threading.Lock()
+        self._by_terminal = {}
+        self._by_card = {}
+        self._on_timeout = on_timeout
+        self.scheduler = TimeoutScheduler(self._expire, self.clock)
+        self.counters = {
+            'started': 0,
+            'submitted': 0,
+            'timed_out': 0,
+            'cancelled': 0,
+            'rejected_busy': 0,
+            'peak_active': 0
+        }
+
+    # =========================
+    # LIFECYCLE
+    # =========================
+    def start(self, terminal_id, rfid_uid, replace=False):
+        """
+        Open a session for a card at a terminal.
+
+        Args:
+            replace (bool): Cancel a session already open at this terminal
+                (or for this card elsewhere) instead of refusing
+
+        Returns:
+            tuple: (session or None if refused, list of cancelled sessions)
+        """
+        now = self.clock.monotonic()
+        cancelled = []
+        with self.lock:
+            existing = [
+                session for session in (
+                    self._by_terminal.get(terminal_id),
+                    self._by_card.get(rfid_uid)
+                ) if session is not None
+            ]
+            if existing and not replace:
+                self.counters['rejected_busy'] += 1
+                return None, cancelled
+
+            for session in existing:
+                with session.lock:
+                    if session.state != AWAITING_PIN:
+                        continue
+                    session.transition(CANCELLED)
+                self._remove(session)
+                self.counters['cancelled'] += 1
+                cancelled.append(session)
+
+            session = Session(terminal_id, rfid_uid, now, now + self.pin_timeout)
+            self._by_terminal[terminal_id] = session
+            self._by_card[rfid_uid] = session
+            self.counters['started'] += 1
+            if len(self._by_terminal) > self.counters['peak_active']:
+                self.counters['peak_active'] = len(self._by_terminal)
+
+        self.scheduler.schedule(session, session.deadline)
+        return session, cancelled
+
+    def get(self, terminal_id):
+        with self.lock:
+            return self._by_terminal.get(terminal_id)
+
+    def touch(self, session):
+        """Push the deadline out after a key press; call with session.lock held."""
+        session.deadline = self.clock.monotonic() + self.pin_timeout
+        self.scheduler.schedule(session, session.deadline)
+
+    def finish(self, session, state):
+        """
+        Move an open session to a final state and drop it from the table.
+
+        Returns:
+            bool: False if the session had already left awaiting_pin
+        """
+        with self.lock:
+            with session.lock:
+                if session.state != AWAITING_PIN:
+                    return False
+                session.transition(state)
+            self._remove(session)
+            self.counters[state] += 1
+        return True
+
+    def _remove(self, session):
+        if self._by_terminal.get(session.terminal_id) is session:
+            del self._by_terminal[session.terminal_id]
+        if self._by_card.get(session.rfid_uid) is session:
+            del self._by_card[session.rfid_uid]
+
+    def _expire(self, session):
+        with self.lock:
+            with session.lock:
+                # A key may have arrived after the timer popped the entry
+                if session.state != AWAITING_PIN or session.deadline > self.clock.monotonic():
+                    return
+                session.transition(TIMED_OUT)
+            self._remove(session)
+            self.counters['timed_out'] += 1
+        self._on_timeout(session)
+
+    def stop(self):
+        self.scheduler.stop(timeout=5)
+
+    # =========================
+    # INSPECTION
+    # =========================
+    def __len__(self):
+        with self.lock:
+            return len(self._by_terminal)
+
+    def sessions(self):
+        now = self.clock.monotonic()
+        with self.lock:
+            sessions = list(self._by_terminal.values())
+        return [session.to_dict(now) for session in sessions]
+
+    def stats(self):
+        with self.lock:
+            stats = dict(self.counters)
+            stats['active'] = len(self._by_terminal)
+        stats['pending_timeouts'] = self.scheduler.pending()
+        stats['pin_timeout'] = self.pin_timeout
+        return stats
@@ -0,0 +1,334 @@
+"""
+Print spooler for the Raspberry Pi hardware appliance.
+
+Receipts are handed to a background thread through a bounded in-memory
+queue and recorded in the `print_jobs` table before they are printed, so
+queued receipts survive a restart. Failed jobs are retried with
+exponential backoff until they succeed or run out of attempts. A receipt
+arriving while the queue is full is rejected rather than written on the
+caller's thread, and finished jobs are deleted once they are old enough.
+"""
+import json
+import queue
+import threading
+import time
+from app.startup import LazyInit
+
+
+JOB_STATUSES = ('queued', 'printing', 'done', 'failed')
+
+
+def _now_text():
+    return time.strftime('%Y-%m-%d %H:%M:%S', time.gmtime())
+
+
+class PrintSpooler:
+    def __init__(self, database, handlers, queue_size=64, max_attempts=5,
+                 retry_base=1.0, retry_max=60.0, keep_done_days=7, prune_interval=3600.0,
+                 prints=True, on_enqueue=None):
+        """
+        Args:
+            database (Database): Database holding the print_jobs table
+            handlers (dict): Job kind -> callable(payload) that prints it and
+                raises on failure
+            queue_size (int): Jobs buffered in memory; further jobs are
+                rejected until the spooler thread catches up
+            max_attempts (int): Attempts before a job is marked failed
+            retry_base (float): Delay in seconds after the first failure;
+                doubles with each further failure
+            retry_max (float): Upper bound for the retry delay
+            keep_done_days (float): Age after which finished jobs are deleted
+            prune_interval (float): Seconds between deletions of old
+                finished jobs by the spooler thread
+            prints (bool): False in a process that only queues jobs for a
+                spooler running in another process (web workers)
+            on_enqueue (callable): Called after such a process wrote a job,
+                to wake the printing spooler instead of waiting for its poll
+        """
+        self.database = database
+        self.handlers = handlers
+        self.queue = queue.Queue(maxsize=queue_size)
+        self.max_attempts = max_attempts
+        self.retry_base = retry_base
+        self.retry_max = retry_max
+        self.keep_done_days = keep_done_days
+        self.prune_interval = prune_interval
+        self.prints = prints
+        self.on_enqueue = on_enqueue
+        # Also picks up jobs written by other processes
+        self.poll_interval = 1.0
+        self.rejected = 0
+        self.running = False
+        self.thread = None
+        self._lock = threading.Lock()
+        # Created on first use so building a Printer does not touch the disk
+        self._table = LazyInit(self.init_table, 'print_jobs table')
+
+    def init_table(self):
+        conn = self.database.get_connection()
+        cursor = conn.cursor()
+        cursor.execute('''
+            CREATE TABLE IF NOT EXISTS print_jobs (
+                id INTEGER PRIMARY KEY AUTOINCREMENT,
+                kind TEXT NOT NULL,
+                payload TEXT NOT NULL,
+                status TEXT NOT NULL DEFAULT 'queued',
+                attempts INTEGER NOT NULL DEFAULT 0,
+                last_error TEXT,
+                next_attempt_at REAL NOT NULL DEFAULT 0,
+                created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
+                updated_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP
+            )
+        ''')
+        cursor.execute('CREATE INDEX IF NOT EXISTS idx_print_jobs_status ON print_jobs (status, next_attempt_at, id)')
+        conn.commit()
+        conn.close()
+
+    def _connection(self):
+        self._table()
+        return self.database.get_connection()
+
+    # =========================
+    # CALLER SIDE
+    # =========================
+    def submit(self, kind, payload):
+        """
+        Queue a receipt for printing. Never blocks on the printer or the
+        database.
+
+        Returns:
+            bool: False if the in-memory queue was full and the receipt
+                was rejected
+        """
+        if kind not in self.handlers:
+            raise ValueError(f"Unknown print job kind: {kind}")
+        if not self.prints:
+            self._insert_jobs([(kind, payload)])
+            self._notify_enqueued()
+            return True
+        self.start()
+        try:
+            self.queue.put_nowait((kind, payload))
+            return True
+        except queue.Full:
+            with self._lock:
+                self.rejected += 1
+            print(f"[PRINTER ERROR] Print queue full, {kind} receipt rejected")
+            return False
+
+    def get_jobs(self, status=None, limit=50):
+        """Return recent jobs, newest first, optionally filtered by status."""
+        conn = self._connection()
+        cursor = conn.cursor()
+        if status:
+            cursor.execute('SELECT * FROM print_jobs WHERE status = ? ORDER BY id DESC LIMIT ?', (status, limit))
+        else:
+            cursor.execute('SELECT * FROM print_jobs ORDER BY id DESC LIMIT ?', (limit,))
+        jobs = [self._job_dict(row) for row in cursor.fetchall()]
+        conn.close()
+        return jobs
+
+    def get_job(self, job_id):
+        conn = self._connection()
+        row = conn.execute('SELECT * FROM print_jobs WHERE id = ?', (job_id,)).fetchone()
+        conn.close()
+        return self._job_dict(row) if row else None
+
+    def retry_job(self, job_id):
+        """Requeue a failed job (e.g. after reloading paper)."""
+        conn = self._connection()
+        cursor = conn.cursor()
+        cursor.execute(
+            "UPDATE print_jobs SET status = 'queued', attempts = 0, next_attempt_at = 0, updated_at = ? "
+            "WHERE id = ? AND status = 'failed'",
+            (_now_text(), job_id)
+        )
+        retried = cursor.rowcount == 1
+        conn.commit()
+        conn.close()
+        if retried and self.prints:
+            self.start()
+            self._wake()
+        elif retried:
+            self._notify_enqueued()
+        return retried
+
+    def counts(self):
+        conn = self._connection()
+        cursor = conn.cursor()
+        cursor.execute('SELECT status, COUNT(*) AS count FROM print_jobs GROUP BY status')
+        counts = {status: 0 for status in JOB_STATUSES}
+        counts.update({row['status']: row['count'] for row in cursor.fetchall()})
+        conn.close()
+        counts['buffered'] = self.queue.qsize()
+        counts['rejected'] = self.rejected
+        return counts
+
+    @staticmethod
+    def _job_dict(row):
+        job = dict(row)
+        job['payload'] = json.loads(job['payload'])
+        return job
+
+    # =========================
+    # SPOOLER THREAD
+    # =========================
+    def start(self):
+        with self._lock:
+            if self.running or not self.prints:
+                return
+            self.running = True
+            self.thread = threading.Thread(target=self._run, name='print-spooler', daemon=True)
+            self.thread.start()
+
+    def stop(self, timeout=5):
+        """Stop the spooler; jobs not yet printed stay queued in the table."""
+        with self._lock:
+            if not self.running:
+                return
+            self.running = False
+        self._wake()
+        self.thread.join(timeout)
+
+    def wake(self):
+        """Look for new jobs now (e.g. ones another process just wrote)."""
+        if self.running:
+            self._wake()
+
+    def _notify_enqueued(self):
+        if self.on_enqueue is not None:
+            try:
+                self.on_enqueue()
+            except Exception as e:
+                print(f"[PRINTER ERROR] Enqueue notification failed: {e}")
+
+    def _wake(self):
+        try:
+            self.queue.put_nowait(None)
+        except queue.Full:
+            pass
+
+    def _run(self):
+        self._recover()
+        next_due = 0.0
+        next_prune = time.time() + self.prune_interval
+        while self.running:
+            timeout = self.poll_interval
+            if next_due:
+                timeout = max(0.0, min(timeout, next_due - time.time()))
+            try:
+                first = self.queue.get(timeout=timeout)
+            except queue.Empty:
+                first = None
+
+            self._persist_buffered([first] if first is not None else [])
+            next_due = self._process_due_jobs()
+            if time.time() >= next_prune:
+                self._prune_done()
+                next_prune = time.time() + self.prune_interval
+
+        # Anything still buffered is printed after the next start
+        self._persist_buffered([])
+
+    def _persist_buffered(self, incoming):
+        """Write buffered jobs to the table; None items are wake-ups."""
+        while True:
+            try:
+                item = self.queue.get_nowait()
+            except queue.Empty:
+                break
+            if item is not None:
+                incoming.append(item)
+        if incoming:
+            self._insert_jobs(incoming)
+
+    def _recover(self):
+        """Requeue jobs interrupted mid-print and drop old finished jobs."""
+        conn = self._connection()
+        cursor = conn.cursor()
+        cursor.execute("UPDATE print_jobs SET status = 'queued' WHERE status = 'printing'")
+        if cursor.rowcount:
+            print(f"[PRINTER] Requeued {cursor.rowcount} interrupted print jobs")
+        conn.commit()
+        conn.close()
+        self._prune_done()
+
+    def _prune_done(self):
+        """Delete finished jobs older than keep_done_days."""
+        cutoff = time.strftime('%Y-%m-%d %H:%M:%S', time.gmtime(time.time() - self.keep_done_days * 86400))
+        conn = self._connection()
+        try:
+            with conn:
+                cursor = conn.execute("DELETE FROM print_jobs WHERE status = 'done' AND updated_at < ?", (cutoff,))
+            return cursor.rowcount
+        finally:
+            conn.close()
+
+    def _insert_jobs(self, jobs):
+        conn = self._connection()
+        try:
+            with conn:
+                conn.executemany(
+                    'INSERT INTO print_jobs (kind, payload) VALUES (?, ?)',
+                    [(kind, json.dumps(payload)) for kind, payload in jobs]
+                )
+        finally:
+            conn.close()
+
+    def _process_due_jobs(self):
+        """
+        Print every job that is due, oldest first.
+
+        Returns:
+            float: Epoch time the next retry is due (0 if none is waiting)
+        """
+        conn = self._connection()
+        cursor = conn.cursor()
+        while self.running:
+            now = time.time()
+            cursor.execute(
+                "SELECT * FROM print_jobs WHERE status = 'queued' AND next_attempt_at <= ? ORDER BY id LIMIT 1",
+                (now,)
+            )
+            job = cursor.fetchone()
+            if job is None:
+                break
+
+            # Claim the job so a concurrent spooler in another process skips it
+            cursor.execute(
+                "UPDATE print_jobs SET status = 'printing', attempts = attempts + 1, updated_at = ? "
+                "WHERE id = ? AND status = 'queued'",
+                (_now_text(), job['id'])
+            )
+            claimed = cursor.rowcount == 1
+            conn.commit()
+            if claimed:
+                self._print_job(cursor, conn, job)
+
+        cursor.execute("SELECT MIN(next_attempt_at) FROM print_jobs WHERE status = 'queued'")
+        next_due = cursor.fetchone()[0] or 0.0
+        conn.close()
+        return next_due
+
+    def _print_job(self, cursor, conn, job):
+        attempts = job['attempts'] + 1
+        try:
+            self.handlers[job['kind']](json.loads(job['payload']))
+        except Exception as e:
+            if attempts >= self.max_attempts:
+                status, delay = 'failed', 0.0
+                print(f"[PRINTER ERROR] Job {job['id']} failed after {attempts} attempts: {e}")
+            else:
+                status = 'queued'
+                delay = min(self.retry_max, self.retry_base * 2 ** (attempts - 1))
+                print(f"[PRINTER ERROR] Job {job['id']} attempt {attempts} failed, retrying in {delay:.1f}s: {e}")
+            cursor.execute(
+                'UPDATE print_jobs SET status = ?, last_error = ?, next_attempt_at = ?, updated_at = ? WHERE id = ?',
+                (status, str(e), time.time() + delay, _now_text(), job['id'])
+            )
+        else:
+            cursor.execute(
+                "UPDATE print_jobs SET status = 'done', last_error = NULL, updated_at = ? WHERE id = ?",
+                (_now_text(), job['id'])
+            )
+        conn.commit()
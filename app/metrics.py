@@ -0,0 +1,319 @@
+"""
+Process-wide metrics for the Raspberry Pi hardware appliance.
+
+Counters, gauges and fixed-bucket histograms, exposed by /api/metrics in
+the Prometheus text format. Metrics are declared once at module level:
+
+    PRINT_SECONDS = registry.histogram('appliance_print_seconds', 'Time to print a receipt', labels=('kind',))
+    PRINT_SECONDS.labels('auth').observe(0.012)
+
+Recording is cheap enough for the hardware threads: a labelled child is
+looked up once and kept, an observation is a bisect plus two additions
+under the child's own lock (never a registry-wide one), and nothing is
+formatted until the endpoint is scraped. tools/bench_metrics.py measures
+the cost per observation.
+"""
+import bisect
+import math
+import threading
+import time
+
+# Seconds; spans a cached PIN check (sub-millisecond) to a slow printer
+LATENCY_BUCKETS = (0.0005, 0.001, 0.0025, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0)
+CONTENT_TYPE = 'text/plain; version=0.0.4; charset=utf-8'
+
+
+class _Metric:
+    kind = None
+
+    def __init__(self, name, documentation, labelnames=()):
+        self.name = name
+        self.documentation = documentation
+        self.labelnames = tuple(labelnames)
+        self._children = {}
+        self._lock = threading.Lock()
+        if not self.labelnames:
+            self._children[()] = self._new_child()
+            self._bind(self._children[()])
+
+    def labels(self, *values):
+        """
+        Child for one combination of label values (created on first use).
+
+        Hot paths should keep the child instead of calling this per event.
+        """
+        if len(values) != len(self.labelnames):
+            raise ValueError(f"{self.name} expects labels {self.labelnames}, got {values}")
+        key = tuple(str(value) for value in values)
+        child = self._children.get(key)
+        if child is None:
+            with self._lock:
+                child = self._children.setdefault(key, self._new_child())
+        return child
+
+    def _bind(self, child):
+        # An unlabelled metric records straight into its only child
+        for method in self.methods:
+            setattr(self, method, getattr(child, method))
+
+    def __getattr__(self, name):
+        # Only reached for recording methods of labelled metrics
+        if name in type(self).methods:
+            raise ValueError(f"{self.name} has labels {self.labelnames}; use .labels()")
+        raise AttributeError(name)
+
+    def _new_child(self):
+        raise NotImplementedError
+
+    def collect(self):
+        """Samples as (suffix, labels dict, value), label values in labelnames order."""
+        with self._lock:
+            children = sorted(self._children.items())
+        samples = []
+        for key, child in children:
+            labels = dict(zip(self.labelnames, key))
+            for suffix, extra, value in child.samples():
+                samples.append((suffix, dict(labels, **extra), value))
+        return samples
+
+
+class _CounterChild:
+    __slots__ = ('_value', '_lock')
+
+    def __init__(self):
+        self._value = 0.0
+        self._lock = threading.Lock()
+
+    def inc(self, amount=1):
+        if amount < 0:
+            raise ValueError("Counters only go up")
+        # acquire/release is measurably cheaper than a with block here
+        self._lock.acquire()
+        self._value += amount
+        self._lock.release()
+
+    def samples(self):
+        return [('', {}, self._value)]
+
+
+class Counter(_Metric):
+    kind = 'counter'
+    methods = ('inc',)
+
+    def _new_child(self):
+        return _CounterChild()
+
+
+class _GaugeChild:
+    __slots__ = ('_value', '_function', '_lock')
+
+    def __init__(self):
+        self._value = 0.0
+        self._function = None
+        self._lock = threading.Lock()
+
+    def set(self, value):
+        self._value = float(value)
+
+    def inc(self, amount=1):
+        self._lock.acquire()
+        self._value += amount
+        self._lock.release()
+
+    def dec(self, amount=1):
+        self.inc(-amount)
+
+    def set_function(self, function):
+        """Read the value from function() at scrape time instead (queue depths, open sessions)."""
+        self._function = function
+
+    def samples(self):
+        value = self._value
+        if self._function is not None:
+            try:
+                value = float(self._function())
+            except Exception as e:
+                print(f"[METRICS ERROR] Gauge callback failed: {e}")
+                value = math.nan
+        return [('', {}, value)]
+
+
+class Gauge(_Metric):
+    kind = 'gauge'
+    methods = ('set', 'inc', 'dec', 'set_function')
+
+    def _new_child(self):
+        return _GaugeChild()
+
+
+class _HistogramChild:
+    __slots__ = ('_bounds', '_counts', '_sum', '_lock')
+
+    def __init__(self, bounds):
+        self._bounds = bounds
+        # One slot per bucket plus the +Inf overflow; made cumulative at scrape
+        self._counts = [0] * (len(bounds) + 1)
+        self._sum = 0.0
+        self._lock = threading.Lock()
+
+    def observe(self, value):
+        # bisect_left puts a value equal to a bound into that bound's bucket (le)
+        index = bisect.bisect_left(self._bounds, value)
+        self._lock.acquire()
+        self._counts[index] += 1
+        self._sum += value
+        self._lock.release()
+
+    def time(self):
+        """Context manager observing the wall time spent in the with block, including when it raises."""
+        return _Timer(self.observe)
+
+    def samples(self):
+        with self._lock:
+            counts = list(self._counts)
+            total = self._sum
+        samples = []
+        cumulative = 0
+        for bound, count in zip(self._bounds + (math.inf,), counts):
+            cumulative += count
+            samples.append(('_bucket', {'le': _format_value(bound)}, cumulative))
+        samples.append(('_sum', {}, total))
+        samples.append(('_count', {}, cumulative))
+        return samples
+
+
+class _Timer:
+    __slots__ = ('observe', 'started')
+
+    def __init__(self, observe):
+        self.observe = observe
+
+    def __enter__(self):
+        self.started = time.perf_counter()
+        return self
+
+    def __exit__(self, *exc_info):
+        self.observe(time.perf_counter() - self.started)
+
+
+class Histogram(_Metric):
+    kind = 'histogram'
+    methods = ('observe', 'time')
+
+    def __init__(self, name, documentation, labelnames=(), buckets=LATENCY_BUCKETS):
+        self.bounds = tuple(sorted(float(bound) for bound in buckets if bound != math.inf))
+        super().__init__(name, documentation, labelnames)
+
+    def _new_child(self):
+        return _HistogramChild(self.bounds)
+
+
+class MetricsRegistry:
+    def __init__(self):
+        self._metrics = {}
+        self._lock = threading.Lock()
+
+    def _register(self, cls, name, documentation, labels, **options):
+        # Declaring the same metric twice (module reloads, tests) returns the first
+        with self._lock:
+            metric = self._metrics.get(name)
+            if metric is None:
+                metric = self._metrics[name] = cls(name, documentation, labels, **options)
+        if not isinstance(metric, cls) or metric.labelnames != tuple(labels):
+            raise ValueError(f"Metric {name} is already registered as a different {metric.kind}")
+        return metric
+
+    def counter(self, name, documentation, labels=()):
+        """Counter; by convention `name` ends in _total."""
+        return self._register(Counter, name, documentation, labels)
+
+    def gauge(self, name, documentation, labels=()):
+        return self._register(Gauge, name, documentation, labels)
+
+    def histogram(self, name, documentation, labels=(), buckets=LATENCY_BUCKETS):
+        return self._register(Histogram, name, documentation, labels, buckets=buckets)
+
+    def get(self, name):
+        return self._metrics.get(name)
+
+    def collect(self):
+        """
+        Snapshot of every metric, in a form that survives JSON (sent from
+        the hardware process to web workers in the split deployment).
+
+        Returns:
+            list: {'name', 'type', 'help', 'samples': [[suffix, labels, value], ...]}
+        """
+        with self._lock:
+            metrics = sorted(self._metrics.values(), key=lambda metric: metric.name)
+        return [
+            {
+                'name': metric.name,
+                'type': metric.kind,
+                'help': metric.documentation,
+                'samples': [list(sample) for sample in metric.collect()]
+            }
+            for metric in metrics
+        ]
+
+    def render(self):
+        return render(self.collect())
+
+
+def with_labels(families, **labels):
+    """Add labels to every sample, e.g. process="hardware" before merging with local metrics."""
+    return [
+        dict(family, samples=[[suffix, dict(labels, **sample_labels), value]
+                              for suffix, sample_labels, value in family['samples']])
+        for family in families
+    ]
+
+
+def render(families):
+    """
+    Text exposition format of collect() snapshots. Families with the same
+    name (from different processes) are written as one.
+    """
+    merged = {}
+    for family in families:
+        known = merged.get(family['name'])
+        if known is None:
+            merged[family['name']] = dict(family, samples=list(family['samples']))
+        else:
+            known['samples'].extend(family['samples'])
+
+    lines = []
+    for name, family in merged.items():
+        lines.append(f"# HELP {name} {_escape_help(family['help'])}")
+        lines.append(f"# TYPE {name} {family['type']}")
+        for suffix, labels, value in family['samples']:
+            if labels:
+                rendered = ','.join(f'{key}="{_escape_label(value)}"' for key, value in labels.items())
+                lines.append(f"{name}{suffix}{{{rendered}}} {_format_value(value)}")
+            else:
+                lines.append(f"{name}{suffix} {_format_value(value)}")
+    return '\n'.join(lines) + '\n'
+
+
+def _format_value(value):
+    if value == math.inf:
+        return '+Inf'
+    if value == -math.inf:
+        return '-Inf'
+    if value != value:
+        return 'NaN'
+    if float(value).is_integer() and abs(value) < 1e15:
+        return str(int(value))
+    return repr(float(value))
+
+
+def _escape_help(text):
+    return text.replace('\\', '\\\\').replace('\n', '\\n')
+
+
+def _escape_label(value):
+    return str(value).replace('\\', '\\\\').replace('\n', '\\n').replace('"', '\\"')
+
+
+# Global registry
+registry = MetricsRegistry()
@@ -0,0 +1,240 @@
+"""
+Asynchronous audit-log writer for the Raspberry Pi hardware appliance.
+
+Authentication events are queued in memory and committed by a background
+thread in batches, so callers never wait for an INSERT and fsync.
+"""
+import atexit
+import threading
+import time
+from collections import deque
+
+
+OVERFLOW_POLICIES = ('block', 'drop_oldest', 'drop_newest')
+
+
+class _Marker:
+    """Control item placed on the queue (flush or stop request)."""
+
+    def __init__(self, stop=False):
+        self.stop = stop
+        self.done = threading.Event()
+
+
+class _Record:
+    __slots__ = ('values', 'done', 'committed')
+
+    def __init__(self, values, durable):
+        self.values = values
+        self.done = threading.Event() if durable else None
+        self.committed = False
+
+
+class AuditLogWriter:
+    """
+    Group-commit writer for audit records.
+
+    Records are committed in one transaction per batch, either when
+    batch_size records are pending or flush_interval seconds after the
+    first record of the batch arrived. When queue_size records are pending
+    the overflow policy decides what happens:
+
+        block        wait for space (no record is lost)
+        drop_oldest  discard the oldest pending record
+        drop_newest  discard the incoming record
+
+    Flush and stop markers share the queue, so they keep their place
+    behind the records queued before them, but they never count against
+    queue_size: they neither wait for space nor get dropped.
+    """
+
+    def __init__(self, write_batch, batch_size=64, flush_interval=0.05,
+                 queue_size=1024, overflow_policy='block'):
+        """
+        Args:
+            write_batch (callable): Called from the writer thread with a list
+                of record tuples; must insert and commit them in one transaction
+            batch_size (int): Maximum records per transaction
+            flush_interval (float): Maximum seconds a record waits for a batch
+            queue_size (int): Maximum number of pending records
+            overflow_policy (str): One of OVERFLOW_POLICIES
+        """
+        if overflow_policy not in OVERFLOW_POLICIES:
+            raise ValueError(f"Unknown audit overflow policy: {overflow_policy}")
+
+        self.write_batch = write_batch
+        self.batch_size = max(1, batch_size)
+        self.flush_interval = flush_interval
+        self.overflow_policy = overflow_policy
+        self.queue_size = max(1, queue_size)
+        self._pending = deque()  # records and markers, oldest first
+        self._pending_records = 0
+        self._changed = threading.Condition(threading.Lock())
+        self.thread = None
+        self._atexit_registered = False
+        self._lock = threading.Lock()
+        self._stats = {
+            'enqueued': 0,
+            'committed': 0,
+            'batches': 0,
+            'dropped': 0,
+            'failed': 0
+        }
+
+    def start(self):
+        with self._lock:
+            if self.thread is None or not self.thread.is_alive():
+                self.thread = threading.Thread(
+                    target=self._run,
+                    name='audit-writer',
+                    daemon=True
+                )
+                self.thread.start()
+                # Don't lose queued records on a normal interpreter exit
+                if not self._atexit_registered:
+                    atexit.register(self.stop, 5.0)
+                    self._atexit_registered = True
+
+    def submit(self, values, durable=False, timeout=None):
+        """
+        Queue one record for writing.
+
+        Args:
+            values (tuple): Column values passed through to write_batch
+            durable (bool): Wait until the record's batch has been committed
+            timeout (float): Maximum seconds to wait in durable mode
+
+        Returns:
+            bool: False if the record was dropped or (durable mode) not
+            committed in time, True otherwise
+        """
+        self.start()
+        record = _Record(values, durable)
+
+        if not self._put(record):
+            return False
+
+        if record.done is None:
+            return True
+        record.done.wait(timeout)
+        return record.committed
+
+    def _put(self, record):
+        dropped = None
+        with self._changed:
+            while self._pending_records >= self.queue_size:
+                if self.overflow_policy == 'block':
+                    self._changed.wait()
+                elif self.overflow_policy == 'drop_newest':
+                    dropped = record
+                    break
+                else:
+                    # drop_oldest: discard the oldest record, never a marker
+                    dropped = next(item for item in self._pending if isinstance(item, _Record))
+                    self._pending.remove(dropped)
+                    self._pending_records -= 1
+            if dropped is not record:
+                self._pending.append(record)
+                self._pending_records += 1
+                self._changed.notify_all()
+
+        if dropped is not None:
+            self._count('dropped')
+            self._release(dropped)
+        if dropped is record:
+            return False
+        self._count('enqueued')
+        return True
+
+    def _put_marker(self, marker):
+        with self._changed:
+            self._pending.append(marker)
+            self._changed.notify_all()
+
+    def _get(self, timeout=None):
+        """Oldest pending item, or None if none arrived within timeout."""
+        with self._changed:
+            if not self._changed.wait_for(lambda: self._pending, timeout):
+                return None
+            item = self._pending.popleft()
+            if isinstance(item, _Record):
+                self._pending_records -= 1
+                # Room for a producer waiting under the block policy
+                self._changed.notify_all()
+            return item
+
+    def flush(self, timeout=None):
+        """Block until every record queued so far has been committed."""
+        if self.thread is None or not self.thread.is_alive():
+            return True
+        marker = _Marker()
+        self._put_marker(marker)
+        return marker.done.wait(timeout)
+
+    def stop(self, timeout=None):
+        """Commit pending records and stop the writer thread."""
+        if self.thread is None or not self.thread.is_alive():
+            return
+        marker = _Marker(stop=True)
+        self._put_marker(marker)
+        marker.done.wait(timeout)
+        self.thread.join(timeout)
+
+    def stats(self):
+        with self._lock:
+            stats = dict(self._stats)
+        with self._changed:
+            stats['pending'] = self._pending_records
+        stats['overflow_policy'] = self.overflow_policy
+        return stats
+
+    def _count(self, key, amount=1):
+        with self._lock:
+            self._stats[key] += amount
+
+    @staticmethod
+    def _release(record):
+        if record.done is not None:
+            record.done.set()
+
+    def _run(self):
+        while True:
+            batch = [self._get()]
+            deadline = time.monotonic() + self.flush_interval
+
+            # Collect until the batch is full, the window closes or a
+            # control marker asks us to commit now.
+            while len(batch) < self.batch_size and not isinstance(batch[-1], _Marker):
+                remaining = deadline - time.monotonic()
+                if remaining <= 0:
+                    break
+                item = self._get(remaining)
+                if item is None:
+                    break
+                batch.append(item)
+
+            records = [item for item in batch if isinstance(item, _Record)]
+            markers = [item for item in batch if isinstance(item, _Marker)]
+
+            if records:
+                self._commit(records)
+            for marker in markers:
+                marker.done.set()
+            if any(marker.stop for marker in markers):
+                return
+
+    def _commit(self, records):
+        try:
+            self.write_batch([record.values for record in records])
+        except Exception as e:
+            print(f"[AUDIT ERROR] Failed to write {len(records)} log records: {e}")
+            self._count('failed', len(records))
+        else:
+            for record in records:
+                record.committed = True
+            with self._lock:
+                self._stats['committed'] += len(records)
+                self._stats['batches'] += 1
+        finally:
+            for record in records:
+                self._release(record)
@@ -0,0 +1,203 @@
+"""
+SQLite connection management for the Raspberry Pi hardware appliance.
+
+Each thread (keypad, RFID reader, Socket.IO handlers, background writers)
+gets its own long-lived connection, configured once at open time, instead
+of reconnecting for every statement.
+"""
+import sqlite3
+import threading
+import time
+
+
+class QueryStats:
+    """Accumulated timings for a single SQL statement."""
+
+    __slots__ = ('count', 'total', 'max')
+
+    def __init__(self):
+        self.count = 0
+        self.total = 0.0
+        self.max = 0.0
+
+    def record(self, elapsed):
+        self.count += 1
+        self.total += elapsed
+        if elapsed > self.max:
+            self.max = elapsed
+
+    def to_dict(self):
+        return {
+            'count': self.count,
+            'total_ms': round(self.total * 1000, 3),
+            'avg_ms': round(self.total * 1000 / self.count, 3) if self.count else 0.0,
+            'max_ms': round(self.max * 1000, 3)
+        }
+
+
+class TimedCursor:
+    """Cursor wrapper that records the duration of every statement."""
+
+    def __init__(self, cursor, manager):
+        self._cursor = cursor
+        self._manager = manager
+
+    def execute(self, sql, parameters=()):
+        start = time.perf_counter()
+        try:
+            self._cursor.execute(sql, parameters)
+        finally:
+            self._manager.record_query(sql, time.perf_counter() - start)
+        return self
+
+    def executemany(self, sql, seq_of_parameters):
+        start = time.perf_counter()
+        try:
+            self._cursor.executemany(sql, seq_of_parameters)
+        finally:
+            self._manager.record_query(sql, time.perf_counter() - start)
+        return self
+
+    def __iter__(self):
+        return iter(self._cursor)
+
+    def __getattr__(self, name):
+        return getattr(self._cursor, name)
+
+
+class PooledConnection:
+    """
+    Thread-affine connection handed out by ConnectionManager.
+
+    Behaves like a sqlite3.Connection, except that close() only rolls back
+    any uncommitted work: the underlying connection stays open for the next
+    caller on the same thread and is closed by ConnectionManager.close_all().
+    """
+
+    def __init__(self, conn, manager):
+        self._conn = conn
+        self._manager = manager
+
+    def cursor(self):
+        return TimedCursor(self._conn.cursor(), self._manager)
+
+    def execute(self, sql, parameters=()):
+        return self.cursor().execute(sql, parameters)
+
+    def executemany(self, sql, seq_of_parameters):
+        return self.cursor().executemany(sql, seq_of_parameters)
+
+    def close(self):
+        """Release the connection back to the manager."""
+        if self._conn.in_transaction:
+            self._conn.rollback()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        # Same semantics as sqlite3.Connection: commit or roll back
+        if exc_type is None:
+            self._conn.commit()
+        else:
+            self._conn.rollback()
+        return False
+
+    def __getattr__(self, name):
+        return getattr(self._conn, name)
+
+
+class ConnectionManager:
+    """
+    Keeps one SQLite connection per thread.
+
+    Connections are opened lazily on first use from a thread and configured
+    once with WAL journaling, synchronous=NORMAL, a busy timeout and a
+    statement cache. Connections owned by threads that have exited are
+    closed the next time any thread asks for a connection.
+    """
+
+    def __init__(self, db_path, busy_timeout=5.0, cached_statements=128):
+        self.db_path = db_path
+        self.busy_timeout = busy_timeout
+        self.cached_statements = cached_statements
+        self._local = threading.local()
+        self._lock = threading.Lock()
+        self._connections = {}  # thread ident -> (thread, sqlite3.Connection)
+        self._query_stats = {}
+        self._opened = 0
+
+    def connection(self):
+        """Return the calling thread's connection, opening it if needed."""
+        pooled = getattr(self._local, 'connection', None)
+        if pooled is not None:
+            return pooled
+
+        conn = self._open()
+        pooled = PooledConnection(conn, self)
+        self._local.connection = pooled
+
+        thread = threading.current_thread()
+        with self._lock:
+            self._opened += 1
+            stale = [
+                ident for ident, (owner, _) in self._connections.items()
+                if not owner.is_alive()
+            ]
+            for ident in stale:
+                _, old = self._connections.pop(ident)
+                old.close()
+            self._connections[thread.ident] = (thread, conn)
+
+        return pooled
+
+    def _open(self):
+        # check_same_thread=False only so close_all() can close connections
+        # from the shutdown thread; each connection is used by one thread.
+        conn = sqlite3.connect(
+            self.db_path,
+            timeout=self.busy_timeout,
+            cached_statements=self.cached_statements,
+            check_same_thread=False
+        )
+        conn.row_factory = sqlite3.Row
+        if self.db_path != ':memory:':
+            conn.execute('PRAGMA journal_mode=WAL')
+        conn.execute('PRAGMA synchronous=NORMAL')
+        conn.execute(f'PRAGMA busy_timeout={int(self.busy_timeout * 1000)}')
+        return conn
+
+    def record_query(self, sql, elapsed):
+        """Record the duration of one statement."""
+        with self._lock:
+            stats = self._query_stats.get(sql)
+            if stats is None:
+                stats = self._query_stats[sql] = QueryStats()
+            stats.record(elapsed)
+
+    def close_all(self):
+        """Close every open connection (called on shutdown)."""
+        with self._lock:
+            connections = list(self._connections.values())
+            self._connections.clear()
+
+        for _, conn in connections:
+            try:
+                conn.close()
+            except sqlite3.Error as e:
+                print(f"[DB ERROR] Failed to close connection: {e}")
+
+        # Threads that ask again get a fresh connection
+        self._local = threading.local()
+
+    def stats(self):
+        """Return open-connection counts and per-query timings."""
+        with self._lock:
+            return {
+                'open_connections': len(self._connections),
+                'connections_opened': self._opened,
+                'queries': {
+                    ' '.join(sql.split()): stats.to_dict()
+                    for sql, stats in self._query_stats.items()
+                }
+            }
@@ -0,0 +1,86 @@
+"""
+In-memory credential cache for the Raspberry Pi hardware appliance.
+
+Maps RFID UIDs to stored PIN hashes so authentication does not need a
+database round trip. The cache is loaded at startup, written through by
+every path that changes a user, and bounded with LRU eviction.
+"""
+import threading
+from collections import OrderedDict
+
+
+class CredentialCache:
+    def __init__(self, max_size=10000):
+        self.max_size = max(1, max_size)
+        self._entries = OrderedDict()  # rfid_uid -> pin_hash, oldest first
+        self._lock = threading.Lock()
+        # True while every user in the database is cached, so a miss
+        # means "no such card" without asking the database
+        self.complete = False
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+
+    def load(self, rows, total_users):
+        """
+        Fill the cache at startup.
+
+        Args:
+            rows (iterable): (rfid_uid, pin_hash) pairs, most important last
+            total_users (int): Number of users in the database
+        """
+        with self._lock:
+            self._entries.clear()
+            for rfid_uid, pin_hash in rows:
+                self._entries[rfid_uid] = pin_hash
+                if len(self._entries) > self.max_size:
+                    self._entries.popitem(last=False)
+            self.complete = total_users <= self.max_size
+
+    def lookup(self, rfid_uid):
+        """
+        Look up a card's PIN hash.
+
+        Returns:
+            tuple: (found, pin_hash). found is False when the database must
+            be consulted; (True, None) means the card is known not to exist.
+        """
+        with self._lock:
+            pin_hash = self._entries.get(rfid_uid)
+            if pin_hash is not None:
+                self._entries.move_to_end(rfid_uid)
+                self.hits += 1
+                return True, pin_hash
+            if self.complete:
+                self.hits += 1
+                return True, None
+            self.misses += 1
+            return False, None
+
+    def put(self, rfid_uid, pin_hash):
+        """Insert or replace a card's PIN hash."""
+        with self._lock:
+            self._entries[rfid_uid] = pin_hash
+            self._entries.move_to_end(rfid_uid)
+            if len(self._entries) > self.max_size:
+                self._entries.popitem(last=False)
+                self.evictions += 1
+                self.complete = False
+
+    def invalidate(self, rfid_uid):
+        """Forget a card (after the user is deleted)."""
+        with self._lock:
+            self._entries.pop(rfid_uid, None)
+
+    def stats(self):
+        with self._lock:
+            lookups = self.hits + self.misses
+            return {
+                'size': len(self._entries),
+                'max_size': self.max_size,
+                'complete': self.complete,
+                'hits': self.hits,
+                'misses': self.misses,
+                'hit_rate': self.hits / lookups if lookups else 0.0,
+                'evictions': self.evictions
+            }
@@ -2,19 +2,99 @@
 Database models for the Raspberry Pi hardware appliance.
 """
 import sqlite3
-import hashlib
 import os
+import time
+from app.config import Config
+from app.metrics import registry
+from app.models.audit import AuditLogWriter
+from app.models.connection import ConnectionManager
+from app.models.credentials import CredentialCache
+from app.models.pinhash import PinHasher
+from app.models.provisioning import UserProvisioning
+from app.models.retention import LogRetention
+from app.startup import LazyInit
+
+VERIFY_SECONDS = registry.histogram(
+    'appliance_db_verify_pin_seconds', 'PIN verification on a KDF worker (authenticate_user)')
+LOG_EVENT_SECONDS = registry.histogram(
+    'appliance_db_log_event_seconds', 'log_event call, including the wait for durable events')
+LOG_BATCH_SECONDS = registry.histogram(
+    'appliance_db_log_batch_seconds', 'Audit log batch transaction')
+LOG_EVENTS_WRITTEN = registry.counter('appliance_db_log_events_written_total', 'Log events committed')
 
 class Database:
-    def __init__(self, db_path='app.db'):
-        self.db_path = db_path
-        self.init_db()
+    def __init__(self, db_path=None):
+        self.db_path = db_path or Config.DATABASE_PATH
+        self.connections = ConnectionManager(
+            self.db_path,
+            busy_timeout=Config.DATABASE_BUSY_TIMEOUT,
+            cached_statements=Config.DATABASE_CACHED_STATEMENTS
+        )
+        self.audit_writer = AuditLogWriter(
+            self._write_log_batch,
+            batch_size=Config.AUDIT_BATCH_SIZE,
+            flush_interval=Config.AUDIT_FLUSH_INTERVAL,
+            queue_size=Config.AUDIT_QUEUE_SIZE,
+            overflow_policy=Config.AUDIT_OVERFLOW_POLICY
+        )
+        self.credentials = CredentialCache(Config.CREDENTIAL_CACHE_SIZE)
+        # Called with the rfid_uid after a user's PIN hash changes, so other
+        # processes can refresh their credential caches
+        self.credential_listeners = []
+        self.hasher = PinHasher(
+            algorithm=Config.PIN_KDF,
+            iterations=Config.PIN_KDF_ITERATIONS,
+            scrypt_n=Config.PIN_KDF_SCRYPT_N,
+            scrypt_r=Config.PIN_KDF_SCRYPT_R,
+            scrypt_p=Config.PIN_KDF_SCRYPT_P,
+            workers=Config.PIN_KDF_WORKERS,
+            max_pending=Config.PIN_KDF_MAX_PENDING
+        )
+        self.retention = LogRetention(
+            self,
+            retention_days=Config.LOG_RETENTION_DAYS,
+            check_interval=Config.LOG_RETENTION_CHECK_INTERVAL
+        )
+        self.provisioning = UserProvisioning(
+            self,
+            hash_workers=Config.IMPORT_HASH_WORKERS,
+            chunk_size=Config.IMPORT_CHUNK_SIZE,
+            max_reported=Config.IMPORT_MAX_REPORTED_ERRORS
+        )
+        # Schema and credential cache are set up on first use, not at import
+        self._schema = LazyInit(self.init_db, 'database schema')
     
     def get_connection(self):
-        """Get a database connection."""
-        conn = sqlite3.connect(self.db_path)
-        conn.row_factory = sqlite3.Row
-        return conn
+        """
+        Get the calling thread's database connection.
+
+        The connection is reused by later calls on the same thread; calling
+        close() on it releases it rather than closing the underlying handle.
+        """
+        self._schema()
+        return self.connections.connection()
+    
+    def close(self):
+        """Flush queued log events and close all pooled connections (called on shutdown)."""
+        self.retention.stop()
+        self.hasher.shutdown()
+        self.audit_writer.stop()
+        self.connections.close_all()
+    
+    def flush_logs(self, timeout=None):
+        """Block until every queued log event has been committed."""
+        return self.audit_writer.flush(timeout)
+    
+    def get_stats(self):
+        """Return open-connection counts, per-query timings and audit writer counters."""
+        stats = self.connections.stats()
+        stats['audit'] = self.audit_writer.stats()
+        stats['credential_cache'] = self.credentials.stats()
+        return stats
+    
+    def ensure_ready(self):
+        """Create the tables and warm the credential cache now rather than on first use."""
+        self._schema()
     
     def init_db(self):
         """Initialize the database with required tables."""
@@ -42,16 +122,63 @@ class Database:
             )
         ''')
         
+        # Indexes for keyset pagination over (created_at, id) and its filters
+        cursor.execute('CREATE INDEX IF NOT EXISTS idx_logs_created_id ON logs (created_at, id)')
+        cursor.execute('CREATE INDEX IF NOT EXISTS idx_logs_uid_created_id ON logs (rfid_uid, created_at, id)')
+        cursor.execute('CREATE INDEX IF NOT EXISTS idx_logs_success_created_id ON logs (success, created_at, id)')
+        
+        # Per-hour and per-card-per-hour rollups of the logs table
+        self.retention.init_tables(cursor)
+        
         conn.commit()
         conn.close()
+        
+        self.load_credentials()
     
-    def add_user(self, rfid_uid, pin):
-        """Add a new user with RFID UID and PIN."""
+    def load_credentials(self):
+        """Warm the credential cache with the most recently added cards."""
         conn = self.get_connection()
         cursor = conn.cursor()
+        cursor.execute('SELECT COUNT(*) FROM users')
+        total_users = cursor.fetchone()[0]
+        cursor.execute(
+            'SELECT rfid_uid, pin_hash FROM (SELECT * FROM users ORDER BY id DESC LIMIT ?) ORDER BY id',
+            (self.credentials.max_size,)
+        )
+        self.credentials.load(cursor.fetchall(), total_users)
+        conn.close()
+    
+    def reload_credential(self, rfid_uid):
+        """Refresh one card's cached PIN hash after another process changed it."""
+        conn = self.get_connection()
+        row = conn.execute('SELECT pin_hash FROM users WHERE rfid_uid = ?', (rfid_uid,)).fetchone()
+        conn.close()
         
-        # Hash the PIN for security
-        pin_hash = hashlib.sha256(pin.encode()).hexdigest()
+        if row is None:
+            self.credentials.invalidate(rfid_uid)
+        else:
+            self.credentials.put(rfid_uid, row['pin_hash'])
+    
+    def _credentials_changed(self, rfid_uid):
+        # rfid_uid None: many cards changed (bulk import), reload the cache
+        for listener in self.credential_listeners:
+            try:
+                listener(rfid_uid)
+            except Exception as e:
+                print(f"[DB ERROR] Credential listener failed: {e}")
+    
+    def add_user(self, rfid_uid, pin):
+        """
+        Add a new user with RFID UID and PIN.
+        
+        Raises PinHasherBusy when the KDF pool is full; the API answers
+        that with 503 and Retry-After.
+        """
+        # Hash the PIN for security (salted KDF, on the worker pool)
+        pin_hash = self.hasher.wait(self.hasher.submit_hash(pin))
+        
+        conn = self.get_connection()
+        cursor = conn.cursor()
         
         try:
             cursor.execute(
@@ -59,6 +186,8 @@ class Database:
                 (rfid_uid, pin_hash)
             )
             conn.commit()
+            self.credentials.put(rfid_uid, pin_hash)
+            self._credentials_changed(rfid_uid)
             return True
         except sqlite3.IntegrityError:
             # RFID UID already exists
@@ -66,36 +195,236 @@ class Database:
         finally:
             conn.close()
     
-    def authenticate_user(self, rfid_uid, pin):
-        """Authenticate a user with RFID UID and PIN."""
+    def import_users(self, records, on_conflict='skip'):
+        """
+        Add many users at once; see app/models/provisioning.py.
+        
+        Args:
+            records (iterable): (line, record, error) from provisioning.parse_csv/parse_ndjson
+            on_conflict (str): 'skip' (report existing cards) or 'update' (replace their PIN)
+        
+        Returns:
+            ImportReport: Counts and the first row errors
+        """
+        return self.provisioning.import_users(records, on_conflict)
+    
+    def iter_users(self, include_hashes=False):
+        """Yield every user in enrollment order (PIN hashes only if asked for)."""
+        return self.provisioning.iter_users(include_hashes)
+    
+    def seed_user(self, rfid_uid, pin):
+        """Add a user unless the card exists; unlike add_user, no PIN is hashed on later boots."""
+        if self._get_pin_hash(rfid_uid) is not None:
+            return False
+        return self.add_user(rfid_uid, pin)
+    
+    def update_pin(self, rfid_uid, pin):
+        """Change a user's PIN; returns False if the card is unknown. Raises PinHasherBusy like add_user."""
+        pin_hash = self.hasher.wait(self.hasher.submit_hash(pin))
+        
         conn = self.get_connection()
         cursor = conn.cursor()
         
-        # Hash the PIN for comparison
-        pin_hash = hashlib.sha256(pin.encode()).hexdigest()
+        cursor.execute(
+            'UPDATE users SET pin_hash = ? WHERE rfid_uid = ?',
+            (pin_hash, rfid_uid)
+        )
+        updated = cursor.rowcount == 1
+        conn.commit()
+        conn.close()
         
+        if updated:
+            self.credentials.put(rfid_uid, pin_hash)
+            self._credentials_changed(rfid_uid)
+        return updated
+    
+    def delete_user(self, rfid_uid):
+        """Remove a user; returns False if the card is unknown."""
+        conn = self.get_connection()
+        cursor = conn.cursor()
+        
+        cursor.execute('DELETE FROM users WHERE rfid_uid = ?', (rfid_uid,))
+        deleted = cursor.rowcount == 1
+        conn.commit()
+        conn.close()
+        
+        self.credentials.invalidate(rfid_uid)
+        if deleted:
+            self._credentials_changed(rfid_uid)
+        return deleted
+    
+    def authenticate_user(self, rfid_uid, pin):
+        """Authenticate a user with RFID UID and PIN."""
+        return self.authenticate_user_async(rfid_uid, pin).result()
+    
+    def authenticate_user_async(self, rfid_uid, pin):
+        """
+        Start authenticating a user on the KDF worker pool.
+        
+        Returns immediately with a concurrent.futures.Future that resolves
+        to True or False. The future fails with PinHasherBusy when too many
+        verifications are already in flight.
+        """
+        return self.hasher.submit(self._verify_pin, rfid_uid, pin)
+    
+    def _verify_pin(self, rfid_uid, pin):
+        """Verify a PIN (on a KDF worker) and upgrade outdated hashes."""
+        with VERIFY_SECONDS.time():
+            return self._check_pin(rfid_uid, pin)
+    
+    def _check_pin(self, rfid_uid, pin):
+        stored_hash = self._get_pin_hash(rfid_uid)
+        if stored_hash is None:
+            # Unknown card: take as long as a real check
+            return self.hasher.verify_unknown(pin)[0]
+        
+        matches, needs_rehash = self.hasher.verify(pin, stored_hash)
+        if matches and needs_rehash:
+            self._rehash_pin(rfid_uid, stored_hash, self.hasher.hash(pin))
+        return matches
+    
+    def _rehash_pin(self, rfid_uid, old_hash, new_hash):
+        """Replace a legacy or outdated hash, unless the PIN changed meanwhile."""
+        conn = self.get_connection()
+        cursor = conn.cursor()
         cursor.execute(
-            'SELECT * FROM users WHERE rfid_uid = ? AND pin_hash = ?',
-            (rfid_uid, pin_hash)
+            'UPDATE users SET pin_hash = ? WHERE rfid_uid = ? AND pin_hash = ?',
+            (new_hash, rfid_uid, old_hash)
         )
+        updated = cursor.rowcount == 1
+        conn.commit()
+        conn.close()
+        
+        if updated:
+            self.credentials.put(rfid_uid, new_hash)
+            self._credentials_changed(rfid_uid)
+    
+    def _get_pin_hash(self, rfid_uid):
+        """Return a card's stored PIN hash, from the credential cache when possible."""
+        self._schema()
+        found, pin_hash = self.credentials.lookup(rfid_uid)
+        if found:
+            return pin_hash
         
-        user = cursor.fetchone()
+        conn = self.get_connection()
+        cursor = conn.cursor()
+        cursor.execute('SELECT pin_hash FROM users WHERE rfid_uid = ?', (rfid_uid,))
+        row = cursor.fetchone()
         conn.close()
         
-        return user is not None
+        if row is None:
+            return None
+        self.credentials.put(rfid_uid, row['pin_hash'])
+        return row['pin_hash']
+    
+    def log_event(self, rfid_uid, success, message, durable=False):
+        """
+        Log an authentication event.
+        
+        The event is queued for the background audit writer and committed
+        with the next batch. With durable=True the call waits for that
+        commit and returns whether it succeeded.
+        """
+        with LOG_EVENT_SECONDS.time():
+            # Stamp the event now; the batch may be committed a little later
+            created_at = time.strftime('%Y-%m-%d %H:%M:%S', time.gmtime())
+            return self.audit_writer.submit(
+                (rfid_uid, success, message, created_at),
+                durable=durable
+            )
     
-    def log_event(self, rfid_uid, success, message):
-        """Log an authentication event."""
+    def get_logs(self, limit=50, before=None, rfid_uid=None, success=None, since=None, until=None):
+        """
+        Get one page of log events, newest first.
+        
+        Args:
+            limit (int): Maximum number of rows to return
+            before (tuple): Keyset cursor (created_at, id); only rows strictly
+                older than it are returned
+            rfid_uid (str): Only events for this card
+            success (bool): Only successful or only failed events
+            since (str): Only events at or after this 'YYYY-MM-DD HH:MM:SS' time
+            until (str): Only events before this 'YYYY-MM-DD HH:MM:SS' time
+        
+        Returns:
+            tuple: (rows as dicts, cursor for the next page or None)
+        """
+        where, params = self._log_filters(before, rfid_uid, success, since, until)
         conn = self.get_connection()
         cursor = conn.cursor()
         
+        # Fetch one extra row to learn whether another page exists
         cursor.execute(
-            'INSERT INTO logs (rfid_uid, success, message) VALUES (?, ?, ?)',
-            (rfid_uid, success, message)
+            f'SELECT * FROM logs {where} ORDER BY created_at DESC, id DESC LIMIT ?',
+            params + [limit + 1]
         )
-        
-        conn.commit()
+        rows = [dict(row) for row in cursor.fetchall()]
         conn.close()
+        
+        next_cursor = None
+        if len(rows) > limit:
+            rows = rows[:limit]
+            next_cursor = (rows[-1]['created_at'], rows[-1]['id'])
+        return rows, next_cursor
+    
+    def get_log_stats(self, hours=24, top=5):
+        """Summarize recent authentication activity from the rollup tables."""
+        return self.retention.get_stats(hours, top)
+    
+    def prune_logs(self, max_age_days=None):
+        """Delete raw log rows older than the retention window; returns the count."""
+        return self.retention.prune(max_age_days)
+    
+    def iter_logs(self, rfid_uid=None, success=None, since=None, until=None, chunk_size=500):
+        """
+        Yield every matching log event, newest first.
+        
+        Rows are read one keyset page at a time, so memory use stays flat
+        and no read transaction is held open across the whole export.
+        """
+        before = None
+        while True:
+            rows, before = self.get_logs(chunk_size, before, rfid_uid, success, since, until)
+            yield from rows
+            if before is None:
+                return
+    
+    @staticmethod
+    def _log_filters(before, rfid_uid, success, since, until):
+        clauses = []
+        params = []
+        if before is not None:
+            clauses.append('(created_at, id) < (?, ?)')
+            params.extend(before)
+        if rfid_uid is not None:
+            clauses.append('rfid_uid = ?')
+            params.append(rfid_uid)
+        if success is not None:
+            clauses.append('success = ?')
+            params.append(1 if success else 0)
+        if since is not None:
+            clauses.append('created_at >= ?')
+            params.append(since)
+        if until is not None:
+            clauses.append('created_at < ?')
+            params.append(until)
+        where = 'WHERE ' + ' AND '.join(clauses) if clauses else ''
+        return where, params
+    
+    def _write_log_batch(self, records):
+        """Insert a batch of queued log events and update the rollups in a single transaction."""
+        conn = self.get_connection()
+        try:
+            with LOG_BATCH_SECONDS.time(), conn:
+                cursor = conn.cursor()
+                cursor.executemany(
+                    'INSERT INTO logs (rfid_uid, success, message, created_at) VALUES (?, ?, ?, ?)',
+                    records
+                )
+                self.retention.apply_batch(cursor, records)
+            LOG_EVENTS_WRITTEN.inc(len(records))
+        finally:
+            conn.close()
 
 # Global database instance
 db = Database()
\ No newline at end of file
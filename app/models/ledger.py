@@ -0,0 +1,444 @@
+"""
+Account ledger for the Raspberry Pi hardware appliance.
+
+Accounts, card-to-account mappings and transactions live in SQLite.
+Balances are kept in integer cents; debits are conditional UPDATEs, so a
+withdrawal can never take an account below zero even if several
+processes share the database. An in-process projection of every account
+serves balance reads without touching disk. In the split deployment other
+processes debit the same accounts, so balances are read from the database
+there instead.
+
+Withdrawals are group-committed: while one caller writes its transaction,
+the withdrawals arriving from other threads queue up and the next caller
+writes all of them in one. Transaction IDs come from an in-memory
+generator (app/models/ids.py), and a withdrawal carrying an idempotency
+key stores its result in the same transaction as the debit, so a retry
+is answered with the first result instead of debiting twice.
+"""
+import json
+import math
+import threading
+import time
+from collections import OrderedDict
+from app.config import Config
+from app.metrics import registry
+from app.models.database import db
+from app.models.ids import IdGenerator
+from app.startup import LazyInit
+
+COMMIT_SECONDS = registry.histogram('appliance_ledger_commit_seconds', 'Ledger group-commit transaction')
+COMMIT_BATCH_SIZE = registry.histogram(
+    'appliance_ledger_commit_batch_size', 'Withdrawals written per ledger transaction',
+    buckets=(1, 2, 4, 8, 16, 32, 64, 128, 256, 512))
+IDEMPOTENT_REPLAYS = registry.counter(
+    'appliance_ledger_idempotent_replays_total', 'Withdrawals answered with the stored result of their idempotency key')
+
+# Seconds between deletions of expired idempotency keys
+IDEMPOTENCY_PRUNE_INTERVAL = 600
+IDEMPOTENCY_KEY_MAX_LENGTH = 255
+
+
+# Account the simulated frontend and the seeded test card use
+DEFAULT_ACCOUNTS = [
+    {
+        'id': '1234',
+        'name': 'John Doe',
+        'account_number': '**** **** **** 1234',
+        'balance_cents': 125075,
+        'cards': ['1234', '769714493968']
+    }
+]
+
+
+def to_cents(amount):
+    return int(round(float(amount) * 100))
+
+
+def _failure(error, message, balance=None):
+    return {'success': False, 'balance': balance, 'message': message, 'error': error, 'replayed': False}
+
+
+def parse_withdrawal(data):
+    """Return (account_id, amount, None) from a request body, or (None, None, error message)."""
+    if not isinstance(data, dict) or 'account_id' not in data or 'amount' not in data:
+        return None, None, 'Missing account_id or amount'
+
+    try:
+        amount = float(data['amount'])
+    except (TypeError, ValueError):
+        return None, None, 'Invalid amount'
+    if not math.isfinite(amount):
+        return None, None, 'Invalid amount'
+
+    return str(data['account_id']), amount, None
+
+
+def check_idempotency_key(value):
+    """Validate a client idempotency key; returns (key, error message)."""
+    if value is None:
+        return None, None
+    value = str(value)
+    if not value or len(value) > IDEMPOTENCY_KEY_MAX_LENGTH:
+        return None, f'Idempotency-Key must be 1 to {IDEMPOTENCY_KEY_MAX_LENGTH} characters'
+    return value, None
+
+
+class _Withdrawal:
+    __slots__ = ('account_id', 'cents', 'key', 'fingerprint', 'result')
+
+    def __init__(self, account_id, cents, key):
+        self.account_id = account_id
+        self.cents = cents
+        self.key = key
+        # A repeated key must carry the same request to be replayed
+        self.fingerprint = f'withdrawal:{account_id}:{cents}'
+        self.result = None
+
+
+class Ledger:
+    def __init__(self, database, shared=None):
+        """
+        Args:
+            database (Database): Database holding the ledger tables
+            shared (bool): Other processes debit the same accounts; the
+                projection would go stale, so balances are read from the
+                database (defaults to True unless PROCESS_ROLE is 'all')
+        """
+        self.database = database
+        self.shared = Config.PROCESS_ROLE != 'all' if shared is None else shared
+        # Held by the caller writing a batch; also orders projection updates
+        self._lock = threading.Lock()
+        self._accounts = {}  # account_id -> projection dict
+        self.ids = IdGenerator(Config.PROCESS_SLOT)
+        self.batch_size = max(1, Config.LEDGER_BATCH_SIZE)
+        self._pending = []  # _Withdrawal items waiting for a transaction
+        self._pending_lock = threading.Lock()
+        self.key_ttl = Config.IDEMPOTENCY_KEY_TTL
+        self._replays = OrderedDict()  # idempotency key -> (fingerprint, result, created), oldest first
+        self._replays_size = Config.IDEMPOTENCY_CACHE_SIZE
+        self._replays_lock = threading.Lock()
+        self._last_prune = 0.0
+        # Tables and projection are loaded on first use, not at import
+        self._loaded = LazyInit(self.init_db, 'ledger projection')
+
+    def ensure_ready(self):
+        """Create the tables and load the projection now rather than on first use."""
+        self._loaded()
+
+    def init_db(self):
+        """Create the ledger tables, seed the default account and load the projection."""
+        conn = self.database.get_connection()
+        cursor = conn.cursor()
+
+        cursor.execute('''
+            CREATE TABLE IF NOT EXISTS accounts (
+                id TEXT PRIMARY KEY,
+                name TEXT NOT NULL,
+                account_number TEXT NOT NULL,
+                balance_cents INTEGER NOT NULL CHECK (balance_cents >= 0),
+                created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP
+            )
+        ''')
+
+        cursor.execute('''
+            CREATE TABLE IF NOT EXISTS cards (
+                rfid_uid TEXT PRIMARY KEY,
+                account_id TEXT NOT NULL REFERENCES accounts (id)
+            )
+        ''')
+
+        cursor.execute('''
+            CREATE TABLE IF NOT EXISTS transactions (
+                id INTEGER PRIMARY KEY AUTOINCREMENT,
+                account_id TEXT NOT NULL REFERENCES accounts (id),
+                type TEXT NOT NULL,
+                amount_cents INTEGER NOT NULL,
+                balance_after_cents INTEGER NOT NULL,
+                created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP
+            )
+        ''')
+        cursor.execute('CREATE INDEX IF NOT EXISTS idx_transactions_account ON transactions (account_id, id)')
+        cursor.execute('CREATE INDEX IF NOT EXISTS idx_cards_account ON cards (account_id)')
+
+        cursor.execute('''
+            CREATE TABLE IF NOT EXISTS idempotency_keys (
+                key TEXT PRIMARY KEY,
+                fingerprint TEXT NOT NULL,
+                result TEXT NOT NULL,
+                created_at REAL NOT NULL
+            )
+        ''')
+        cursor.execute('CREATE INDEX IF NOT EXISTS idx_idempotency_keys_created ON idempotency_keys (created_at)')
+
+        cursor.execute('SELECT 1 FROM accounts LIMIT 1')
+        if cursor.fetchone() is None:
+            for account in DEFAULT_ACCOUNTS:
+                cursor.execute(
+                    'INSERT INTO accounts (id, name, account_number, balance_cents) VALUES (?, ?, ?, ?)',
+                    (account['id'], account['name'], account['account_number'], account['balance_cents'])
+                )
+                cursor.executemany(
+                    'INSERT OR IGNORE INTO cards (rfid_uid, account_id) VALUES (?, ?)',
+                    [(uid, account['id']) for uid in account['cards']]
+                )
+
+        conn.commit()
+
+        # The only lookup the ID generator needs: never go below IDs that
+        # an earlier run (possibly with a later clock) already stored
+        cursor.execute('SELECT MAX(id) AS max_id FROM transactions')
+        self.ids.advance_past(cursor.fetchone()['max_id'])
+
+        conn.close()
+        self.reload()
+
+    def reload(self):
+        """Rebuild the in-memory projection from the database."""
+        accounts = self._read_accounts()
+        with self._lock:
+            self._accounts = accounts
+
+    def _read_accounts(self, account_id=None):
+        """Projection entries for every account, or just account_id, as stored now."""
+        where = 'WHERE a.id = ?' if account_id is not None else ''
+        conn = self.database.get_connection()
+        cursor = conn.cursor()
+        cursor.execute(f'''
+            SELECT a.id, a.name, a.account_number, a.balance_cents, MIN(c.rfid_uid) AS card_uid
+            FROM accounts a LEFT JOIN cards c ON c.account_id = a.id
+            {where} GROUP BY a.id
+        ''', () if account_id is None else (account_id,))
+        accounts = {
+            row['id']: {
+                'name': row['name'],
+                'accountNumber': row['account_number'],
+                'balance_cents': row['balance_cents'],
+                'cardUid': row['card_uid'] or row['id']
+            }
+            for row in cursor.fetchall()
+        }
+        conn.close()
+        return accounts
+
+    def _account(self, account_id):
+        self._loaded()
+        if self.shared:
+            return self._read_accounts(account_id).get(account_id)
+        return self._accounts.get(account_id)
+
+    def get_account(self, account_id):
+        """Return the account as served by /api/account, or None."""
+        account = self._account(account_id)
+        if account is None:
+            return None
+        return {
+            'name': account['name'],
+            'accountNumber': account['accountNumber'],
+            'balance': account['balance_cents'] / 100,
+            'cardUid': account['cardUid']
+        }
+
+    def get_balance(self, account_id):
+        """Return the balance in currency units, or None."""
+        account = self._account(account_id)
+        return None if account is None else account['balance_cents'] / 100
+
+    def account_for_card(self, rfid_uid):
+        """Return the account id a card is linked to, or None."""
+        self._loaded()
+        conn = self.database.get_connection()
+        row = conn.execute('SELECT account_id FROM cards WHERE rfid_uid = ?', (rfid_uid,)).fetchone()
+        conn.close()
+        return row['account_id'] if row else None
+
+    def withdraw(self, account_id, amount, idempotency_key=None):
+        """
+        Debit an account atomically.
+
+        Args:
+            account_id (str): Account to debit
+            amount (float): Amount in currency units, must be positive
+            idempotency_key (str): Optional client key; repeating a request
+                with the same key returns the first result (balance as it
+                was then) instead of debiting again
+
+        Returns:
+            dict: 'success', 'balance', 'message', 'error' (None,
+            'invalid_amount', 'not_found', 'insufficient_funds',
+            'idempotency_mismatch' or 'unavailable'), 'replayed' and, when
+            the debit was recorded, 'transaction_id'
+        """
+        return self.withdraw_many([(account_id, amount, idempotency_key)])[0]
+
+    def withdraw_many(self, requests):
+        """
+        Debit several accounts; each request succeeds or fails on its own.
+
+        Args:
+            requests (list): (account_id, amount, idempotency_key) tuples;
+                idempotency_key may be None
+
+        Returns:
+            list: One withdraw() result per request, in the same order
+        """
+        self._loaded()
+        results = [None] * len(requests)
+        queued = []
+        for index, (account_id, amount, key) in enumerate(requests):
+            cents = to_cents(amount)
+            if cents <= 0:
+                results[index] = _failure('invalid_amount', 'Invalid amount', self.get_balance(account_id))
+            elif self._account(account_id) is None:
+                results[index] = _failure('not_found', 'Account not found')
+            else:
+                item = _Withdrawal(account_id, cents, key)
+                replay = self._cached_replay(item) if key is not None else None
+                if replay is not None:
+                    results[index] = replay
+                else:
+                    queued.append((index, item))
+
+        if queued:
+            self._commit([item for _, item in queued])
+            for index, item in queued:
+                results[index] = item.result
+        return results
+
+    def _commit(self, items):
+        with self._pending_lock:
+            self._pending.extend(items)
+
+        # Group commit: whoever holds the lock writes everything pending in
+        # one transaction, so callers that queued meanwhile share the next
+        # one. Batches are taken in queue order, so once our last item has
+        # a result all of ours have.
+        with self._lock:
+            while items[-1].result is None:
+                with self._pending_lock:
+                    batch = self._pending[:self.batch_size]
+                    del self._pending[:self.batch_size]
+                self._write_batch(batch)
+
+    def _write_batch(self, batch):
+        started = time.perf_counter()
+        now = time.time()
+        created_at = time.strftime('%Y-%m-%d %H:%M:%S', time.gmtime(now))
+        balances = {}
+
+        conn = self.database.get_connection()
+        try:
+            # IMMEDIATE takes the write lock before the key lookups, so no
+            # other process can store the same key between check and insert
+            conn.execute('BEGIN IMMEDIATE')
+            cursor = conn.cursor()
+            for item in batch:
+                if item.key is not None:
+                    cursor.execute('SELECT fingerprint, result FROM idempotency_keys WHERE key = ?', (item.key,))
+                    row = cursor.fetchone()
+                    if row is not None:
+                        item.result = self._replay(item, row['fingerprint'], json.loads(row['result']))
+                        continue
+
+                cursor.execute(
+                    'UPDATE accounts SET balance_cents = balance_cents - ? '
+                    'WHERE id = ? AND balance_cents >= ?',
+                    (item.cents, item.account_id, item.cents)
+                )
+                debited = cursor.rowcount == 1
+
+                cursor.execute('SELECT balance_cents FROM accounts WHERE id = ?', (item.account_id,))
+                balance_cents = cursor.fetchone()['balance_cents']
+                balances[item.account_id] = balance_cents
+
+                result = {
+                    'success': debited,
+                    'balance': balance_cents / 100,
+                    'message': 'Transaction successful' if debited else 'Insufficient funds',
+                    'error': None if debited else 'insufficient_funds'
+                }
+                if debited:
+                    result['transaction_id'] = self.ids.next_id()
+                    cursor.execute(
+                        'INSERT INTO transactions (id, account_id, type, amount_cents, balance_after_cents, created_at) '
+                        'VALUES (?, ?, ?, ?, ?, ?)',
+                        (result['transaction_id'], item.account_id, 'withdrawal', item.cents, balance_cents, created_at)
+                    )
+                if item.key is not None:
+                    cursor.execute(
+                        'INSERT INTO idempotency_keys (key, fingerprint, result, created_at) VALUES (?, ?, ?, ?)',
+                        (item.key, item.fingerprint, json.dumps(result), now)
+                    )
+                item.result = dict(result, replayed=False)
+
+            if self.key_ttl > 0 and now - self._last_prune >= IDEMPOTENCY_PRUNE_INTERVAL:
+                cursor.execute('DELETE FROM idempotency_keys WHERE created_at < ?', (now - self.key_ttl,))
+                self._last_prune = now
+            conn.commit()
+        except Exception as e:
+            print(f"[LEDGER ERROR] Failed to commit {len(batch)} withdrawals: {e}")
+            for item in batch:
+                item.result = _failure('unavailable', 'Ledger unavailable')
+            return
+        finally:
+            # Rolls back whatever was not committed
+            conn.close()
+
+        if not self.shared:
+            for account_id, balance_cents in balances.items():
+                # An account created after the last reload has no entry yet
+                account = self._accounts.get(account_id)
+                if account is not None:
+                    account['balance_cents'] = balance_cents
+        for item in batch:
+            if item.key is not None and not item.result['replayed']:
+                self._remember(item, now)
+        COMMIT_SECONDS.observe(time.perf_counter() - started)
+        COMMIT_BATCH_SIZE.observe(len(batch))
+
+    def _replay(self, item, fingerprint, result):
+        if fingerprint != item.fingerprint:
+            return _failure('idempotency_mismatch', 'Idempotency-Key was already used for a different request')
+        IDEMPOTENT_REPLAYS.inc()
+        return dict(result, replayed=True)
+
+    def _cached_replay(self, item):
+        # Retries that reach the process which answered them first skip the
+        # write lock entirely
+        with self._replays_lock:
+            entry = self._replays.get(item.key)
+            if entry is None:
+                return None
+            fingerprint, result, created = entry
+            if self.key_ttl > 0 and time.time() - created >= self.key_ttl:
+                del self._replays[item.key]
+                return None
+            self._replays.move_to_end(item.key)
+        return self._replay(item, fingerprint, result)
+
+    def _remember(self, item, created):
+        if self._replays_size <= 0:
+            return
+        result = dict(item.result)
+        del result['replayed']
+        with self._replays_lock:
+            self._replays[item.key] = (item.fingerprint, result, created)
+            self._replays.move_to_end(item.key)
+            while len(self._replays) > self._replays_size:
+                self._replays.popitem(last=False)
+
+    def get_transactions(self, account_id, limit=20):
+        """Return the most recent transactions for an account."""
+        self._loaded()
+        conn = self.database.get_connection()
+        cursor = conn.cursor()
+        cursor.execute(
+            'SELECT * FROM transactions WHERE account_id = ? ORDER BY id DESC LIMIT ?',
+            (account_id, limit)
+        )
+        transactions = [dict(row) for row in cursor.fetchall()]
+        conn.close()
+        return transactions
+
+# Global ledger instance
+ledger = Ledger(db)
@@ -0,0 +1,188 @@
+"""
+PIN hashing for the Raspberry Pi hardware appliance.
+
+PINs are stored with a salted, deliberately slow key-derivation function.
+Hashing and verification run on a small worker pool so callers (the
+keypad thread in particular) never block on the KDF. Hashes written by
+older versions (a bare, unsalted SHA-256 hex digest) are still accepted
+and flagged for rehashing.
+
+Stored formats:
+    pbkdf2_sha256$<iterations>$<salt hex>$<hash hex>
+    scrypt$<n>$<r>$<p>$<salt hex>$<hash hex>
+    <64 hex characters>                     (legacy SHA-256)
+"""
+import hashlib
+import hmac
+import os
+import threading
+from concurrent.futures import Future, ThreadPoolExecutor
+
+
+ALGORITHMS = ('pbkdf2_sha256', 'scrypt')
+SALT_BYTES = 16
+
+
+class PinHasherBusy(RuntimeError):
+    """Raised through a future when too many hash jobs are already pending."""
+
+
+def is_legacy_hash(stored):
+    return '$' not in stored and len(stored) == 64
+
+
+def is_supported_hash(stored):
+    """True if stored is in one of the formats above (for hashes imported from another appliance)."""
+    if not isinstance(stored, str):
+        return False
+    parts = stored.split('$')
+    if is_legacy_hash(stored):
+        hex_parts, numbers = parts, []
+    elif parts[0] == 'pbkdf2_sha256' and len(parts) == 4:
+        hex_parts, numbers = parts[2:], parts[1:2]
+    elif parts[0] == 'scrypt' and len(parts) == 6:
+        hex_parts, numbers = parts[4:], parts[1:4]
+    else:
+        return False
+    try:
+        for part in hex_parts:
+            bytes.fromhex(part)
+    except ValueError:
+        return False
+    return all(number.isdigit() and int(number) > 0 for number in numbers) and all(hex_parts)
+
+
+class PinHasher:
+    def __init__(self, algorithm='pbkdf2_sha256', iterations=100000,
+                 scrypt_n=16384, scrypt_r=8, scrypt_p=1, workers=2, max_pending=16):
+        """
+        Args:
+            algorithm (str): KDF used for new hashes, one of ALGORITHMS
+            iterations (int): PBKDF2 iteration count
+            scrypt_n, scrypt_r, scrypt_p (int): scrypt cost parameters
+            workers (int): Worker threads (the KDFs release the GIL)
+            max_pending (int): Jobs allowed queued or running at once;
+                further submissions fail fast with PinHasherBusy
+        """
+        if algorithm not in ALGORITHMS:
+            raise ValueError(f"Unknown PIN KDF: {algorithm}")
+
+        self.algorithm = algorithm
+        self.iterations = iterations
+        self.scrypt_params = (scrypt_n, scrypt_r, scrypt_p)
+        self.workers = workers
+        self._slots = threading.BoundedSemaphore(max_pending)
+        # Set to socketio.sleep under eventlet or gevent (see wait())
+        self.sleep = None
+        self.poll_interval = 0.005
+        self._executor = None
+        self._executor_lock = threading.Lock()
+        # Verified against for unknown cards so both paths cost the same
+        self._dummy_hash = None
+
+    # =========================
+    # SYNCHRONOUS PRIMITIVES
+    # =========================
+    def hash(self, pin):
+        """Hash a PIN with the configured KDF and a fresh salt."""
+        salt = os.urandom(SALT_BYTES)
+        if self.algorithm == 'scrypt':
+            n, r, p = self.scrypt_params
+            digest = self._scrypt(pin, salt, n, r, p)
+            return f"scrypt${n}${r}${p}${salt.hex()}${digest.hex()}"
+        digest = hashlib.pbkdf2_hmac('sha256', pin.encode(), salt, self.iterations)
+        return f"pbkdf2_sha256${self.iterations}${salt.hex()}${digest.hex()}"
+
+    def verify(self, pin, stored):
+        """
+        Check a PIN against a stored hash in constant time.
+
+        Returns:
+            tuple: (matches, needs_rehash)
+        """
+        if is_legacy_hash(stored):
+            computed = hashlib.sha256(pin.encode()).hexdigest()
+            return hmac.compare_digest(computed, stored), True
+
+        parts = stored.split('$')
+        if parts[0] == 'pbkdf2_sha256' and len(parts) == 4:
+            iterations = int(parts[1])
+            salt, expected = bytes.fromhex(parts[2]), bytes.fromhex(parts[3])
+            computed = hashlib.pbkdf2_hmac('sha256', pin.encode(), salt, iterations)
+            current = self.algorithm == 'pbkdf2_sha256' and iterations == self.iterations
+        elif parts[0] == 'scrypt' and len(parts) == 6:
+            n, r, p = int(parts[1]), int(parts[2]), int(parts[3])
+            salt, expected = bytes.fromhex(parts[4]), bytes.fromhex(parts[5])
+            computed = self._scrypt(pin, salt, n, r, p)
+            current = self.algorithm == 'scrypt' and (n, r, p) == self.scrypt_params
+        else:
+            return False, False
+
+        return hmac.compare_digest(computed, expected), not current
+
+    def verify_unknown(self, pin):
+        """Spend the same KDF time as a real verification, then fail."""
+        if self._dummy_hash is None:
+            self._dummy_hash = self.hash('0000')
+        self.verify(pin, self._dummy_hash)
+        return False, False
+
+    @staticmethod
+    def _scrypt(pin, salt, n, r, p):
+        return hashlib.scrypt(pin.encode(), salt=salt, n=n, r=r, p=p, maxmem=256 * n * r + 1024 * 1024)
+
+    # =========================
+    # WORKER POOL
+    # =========================
+    def submit(self, fn, *args):
+        """
+        Run fn(*args) on the KDF pool.
+
+        Never blocks: when max_pending jobs are already queued or running
+        the returned future fails immediately with PinHasherBusy.
+        """
+        if not self._slots.acquire(blocking=False):
+            future = Future()
+            future.set_exception(PinHasherBusy('Too many PIN verifications in progress'))
+            return future
+
+        try:
+            future = self._get_executor().submit(fn, *args)
+        except Exception:
+            self._slots.release()
+            raise
+        future.add_done_callback(lambda _: self._slots.release())
+        return future
+
+    def submit_hash(self, pin):
+        return self.submit(self.hash, pin)
+
+    def wait(self, future):
+        """
+        Return future.result() for a caller that needs the value now (adding
+        a user, an import).
+
+        With self.sleep set the caller polls instead of blocking: a request
+        handler runs on the eventlet or gevent hub, and a KDF worker is an
+        OS thread that cannot wake a green thread.
+        """
+        if self.sleep is not None:
+            while not future.done():
+                self.sleep(self.poll_interval)
+        return future.result()
+
+    def _get_executor(self):
+        with self._executor_lock:
+            if self._executor is None:
+                self._executor = ThreadPoolExecutor(
+                    max_workers=self.workers,
+                    thread_name_prefix='pin-kdf'
+                )
+            return self._executor
+
+    def shutdown(self):
+        """Wait for in-flight jobs and stop the worker threads."""
+        with self._executor_lock:
+            executor, self._executor = self._executor, None
+        if executor is not None:
+            executor.shutdown(wait=True)
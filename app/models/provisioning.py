@@ -0,0 +1,286 @@
+"""
+Bulk user provisioning for the Raspberry Pi hardware appliance.
+
+Imports thousands of cards in one request: rows are parsed from a CSV or
+NDJSON stream as they arrive, PINs are hashed on a dedicated worker pool
+(separate from the one serving live PIN checks, so an import never makes
+a tap wait) and each chunk is inserted with one executemany transaction
+while the next chunk is still hashing. A row that cannot be imported
+(invalid, duplicated in the upload, card already enrolled) is reported
+with its line number and the import carries on.
+
+Rows carry either a plain PIN or a pin_hash from a previous export, which
+is stored as is, so cards move between appliances without knowing PINs.
+"""
+import csv
+import io
+import json
+import sqlite3
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
+from app.models.pinhash import is_supported_hash
+
+CONFLICT_POLICIES = ('skip', 'update')
+MIN_PIN_LENGTH = 4
+
+
+def parse_csv(stream):
+    """
+    Yield (line, record, error) from a CSV byte stream with a header row
+    naming rfid_uid and pin or pin_hash.
+    """
+    reader = csv.DictReader(io.TextIOWrapper(stream, encoding='utf-8', newline=''))
+    if reader.fieldnames is None or 'rfid_uid' not in reader.fieldnames:
+        yield 1, None, 'CSV header must name rfid_uid and pin or pin_hash'
+        return
+    for record in reader:
+        yield reader.line_num, record, None
+
+
+def parse_ndjson(stream):
+    """Yield (line, record, error) from a byte stream of one JSON object per line."""
+    for line, raw in enumerate(stream, 1):
+        if not raw.strip():
+            continue
+        try:
+            record = json.loads(raw)
+        except ValueError:
+            yield line, None, 'Invalid JSON'
+            continue
+        if not isinstance(record, dict):
+            yield line, None, 'Expected a JSON object'
+            continue
+        yield line, record, None
+
+
+class ImportReport:
+    """Counts for one import plus the first max_reported row errors."""
+
+    def __init__(self, max_reported=1000):
+        self.max_reported = max_reported
+        self.rows = 0
+        self.imported = 0
+        self.updated = 0
+        self.conflicts = 0
+        self.invalid = 0
+        self.errors = []
+
+    def reject(self, line, rfid_uid, error, conflict=False):
+        if conflict:
+            self.conflicts += 1
+        else:
+            self.invalid += 1
+        if len(self.errors) < self.max_reported:
+            self.errors.append({'line': line, 'rfid_uid': rfid_uid, 'error': error})
+
+    def to_dict(self):
+        return {
+            'rows': self.rows,
+            'imported': self.imported,
+            'updated': self.updated,
+            'conflicts': self.conflicts,
+            'invalid': self.invalid,
+            'errors': sorted(self.errors, key=lambda error: error['line']),
+            'errors_truncated': self.conflicts + self.invalid > len(self.errors)
+        }
+
+
+class _Row:
+    __slots__ = ('line', 'rfid_uid', 'pin', 'pin_hash')
+
+    def __init__(self, line, rfid_uid, pin, pin_hash):
+        self.line = line
+        self.rfid_uid = rfid_uid
+        self.pin = pin
+        self.pin_hash = pin_hash
+
+
+class UserProvisioning:
+    def __init__(self, database, hash_workers=1, chunk_size=500, max_reported=1000):
+        """
+        Args:
+            database (Database): Database the users are written to
+            hash_workers (int): Threads hashing PINs during an import (the
+                KDFs release the GIL, so these run on separate cores)
+            chunk_size (int): Rows per insert transaction (at most 999, the
+                bound-parameter limit of older SQLite builds)
+            max_reported (int): Row errors listed in an import report
+        """
+        self.database = database
+        self.hash_workers = max(1, hash_workers)
+        self.chunk_size = max(1, min(chunk_size, 999))
+        self.max_reported = max_reported
+
+    def import_users(self, records, on_conflict='skip'):
+        """
+        Import users from parsed records.
+
+        Args:
+            records (iterable): (line, record dict, error) as yielded by
+                parse_csv/parse_ndjson
+            on_conflict (str): 'skip' reports cards that already exist,
+                'update' replaces their PIN
+
+        Returns:
+            ImportReport: Counts and the first row errors
+        """
+        if on_conflict not in CONFLICT_POLICIES:
+            raise ValueError(f"Unknown conflict policy: {on_conflict}")
+
+        report = ImportReport(self.max_reported)
+        hasher = self.database.hasher
+        seen = set()
+        in_flight = deque()  # (rows, hash futures, existing uids), oldest first
+
+        with ThreadPoolExecutor(self.hash_workers, thread_name_prefix='import-kdf') as executor:
+            for chunk in self._chunks(self._validate(records, report, seen)):
+                existing = self._existing([row.rfid_uid for row in chunk])
+                if on_conflict == 'skip' and existing:
+                    for row in chunk:
+                        if row.rfid_uid in existing:
+                            report.reject(row.line, row.rfid_uid, 'Card already enrolled', conflict=True)
+                    chunk = [row for row in chunk if row.rfid_uid not in existing]
+                # One job per worker and chunk rather than per row: the
+                # futures would cost more than a cheap KDF
+                pins = [row for row in chunk if row.pin_hash is None]
+                size = -(-len(pins) // self.hash_workers) or 1
+                futures = [
+                    executor.submit(self._hash_rows, hasher, pins[start:start + size])
+                    for start in range(0, len(pins), size)
+                ]
+                in_flight.append((chunk, futures, existing))
+                # Keep one chunk hashing while the previous one is written
+                while len(in_flight) > 1:
+                    self._write(*in_flight.popleft(), on_conflict, report)
+            while in_flight:
+                self._write(*in_flight.popleft(), on_conflict, report)
+
+        if report.imported or report.updated:
+            self.database._credentials_changed(None)
+        return report
+
+    def _validate(self, records, report, seen):
+        for line, record, error in records:
+            report.rows += 1
+            if error is not None:
+                report.reject(line, None, error)
+                continue
+
+            rfid_uid = record.get('rfid_uid')
+            rfid_uid = str(rfid_uid).strip() if rfid_uid is not None else ''
+            pin = record.get('pin')
+            pin = str(pin) if pin not in (None, '') else None
+            pin_hash = record.get('pin_hash') or None
+
+            if not rfid_uid:
+                report.reject(line, None, 'Missing rfid_uid')
+            elif pin is None and pin_hash is None:
+                report.reject(line, rfid_uid, 'Missing pin or pin_hash')
+            elif pin is not None and len(pin) < MIN_PIN_LENGTH:
+                report.reject(line, rfid_uid, f'PIN must be at least {MIN_PIN_LENGTH} characters')
+            elif pin is None and not is_supported_hash(pin_hash):
+                report.reject(line, rfid_uid, 'Unsupported pin_hash format')
+            elif rfid_uid in seen:
+                report.reject(line, rfid_uid, 'Duplicate rfid_uid in upload', conflict=True)
+            else:
+                seen.add(rfid_uid)
+                # A plain PIN wins over a hash given in the same row
+                yield _Row(line, rfid_uid, pin, None if pin is not None else pin_hash)
+
+    @staticmethod
+    def _hash_rows(hasher, rows):
+        for row in rows:
+            row.pin_hash = hasher.hash(row.pin)
+            row.pin = None
+
+    def _chunks(self, rows):
+        chunk = []
+        for row in rows:
+            chunk.append(row)
+            if len(chunk) >= self.chunk_size:
+                yield chunk
+                chunk = []
+        if chunk:
+            yield chunk
+
+    def _existing(self, rfid_uids):
+        conn = self.database.get_connection()
+        try:
+            placeholders = ','.join('?' * len(rfid_uids))
+            cursor = conn.execute(f'SELECT rfid_uid FROM users WHERE rfid_uid IN ({placeholders})', rfid_uids)
+            return {row['rfid_uid'] for row in cursor.fetchall()}
+        finally:
+            conn.close()
+
+    def _write(self, chunk, futures, existing, on_conflict, report):
+        for future in futures:
+            self.database.hasher.wait(future)
+        rows = [(row.rfid_uid, row.pin_hash) for row in chunk]
+        if not rows:
+            return
+
+        if on_conflict == 'update':
+            sql = ('INSERT INTO users (rfid_uid, pin_hash) VALUES (?, ?) '
+                   'ON CONFLICT (rfid_uid) DO UPDATE SET pin_hash = excluded.pin_hash')
+        else:
+            sql = 'INSERT OR IGNORE INTO users (rfid_uid, pin_hash) VALUES (?, ?)'
+
+        conn = self.database.get_connection()
+        try:
+            with conn:
+                cursor = conn.executemany(sql, rows)
+                written = cursor.rowcount
+                lost = set()
+                if on_conflict == 'skip' and written < len(rows):
+                    # Enrolled by someone else since _existing(): whatever
+                    # hash is stored now is not ours
+                    ours = dict(rows)
+                    placeholders = ','.join('?' * len(rows))
+                    stored = conn.execute(
+                        f'SELECT rfid_uid, pin_hash FROM users WHERE rfid_uid IN ({placeholders})',
+                        list(ours)
+                    ).fetchall()
+                    lost = {row['rfid_uid'] for row in stored if row['pin_hash'] != ours[row['rfid_uid']]}
+        except sqlite3.Error as e:
+            print(f"[DB ERROR] Failed to import {len(rows)} users: {e}")
+            for row in chunk:
+                report.reject(row.line, row.rfid_uid, 'Database error')
+            return
+        finally:
+            conn.close()
+
+        credentials = self.database.credentials
+        for row, (rfid_uid, pin_hash) in zip(chunk, rows):
+            if rfid_uid in lost:
+                report.reject(row.line, rfid_uid, 'Card already enrolled', conflict=True)
+                continue
+            if rfid_uid in existing:
+                report.updated += 1
+            else:
+                report.imported += 1
+            credentials.put(rfid_uid, pin_hash)
+
+    def iter_users(self, include_hashes=False, chunk_size=1000):
+        """
+        Yield every user in enrollment order as a dict with rfid_uid,
+        created_at and, if include_hashes, pin_hash. Read in keyset pages,
+        so memory use stays flat for any number of users.
+        """
+        columns = 'id, rfid_uid, created_at' + (', pin_hash' if include_hashes else '')
+        last_id = 0
+        while True:
+            conn = self.database.get_connection()
+            try:
+                rows = conn.execute(
+                    f'SELECT {columns} FROM users WHERE id > ? ORDER BY id LIMIT ?',
+                    (last_id, chunk_size)
+                ).fetchall()
+            finally:
+                conn.close()
+            for row in rows:
+                user = dict(row)
+                del user['id']
+                yield user
+            if len(rows) < chunk_size:
+                return
+            last_id = rows[-1]['id']
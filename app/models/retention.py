@@ -0,0 +1,211 @@
+"""
+Log retention and rollups for the Raspberry Pi hardware appliance.
+
+Per-hour and per-card-per-hour aggregates are kept up to date in the same
+transaction that writes each batch of log events, so dashboard summaries
+never scan the raw logs table. Raw rows older than the retention window
+are pruned in the background; the rollups keep their history.
+"""
+import threading
+import time
+
+
+def _hour_of(created_at):
+    """Truncate a 'YYYY-MM-DD HH:MM:SS' timestamp to its hour."""
+    return created_at[:13] + ':00:00'
+
+
+class LogRetention:
+    def __init__(self, database, retention_days=90, check_interval=3600, prune_chunk=1000):
+        """
+        Args:
+            database (Database): Database whose logs are rolled up and pruned
+            retention_days (float): Age after which raw log rows are deleted
+                (0 keeps them forever)
+            check_interval (float): Seconds between background prune runs
+            prune_chunk (int): Rows deleted per transaction while pruning
+        """
+        self.database = database
+        self.retention_days = retention_days
+        self.check_interval = check_interval
+        self.prune_chunk = prune_chunk
+        self.running = False
+        self.thread = None
+        self._wake = threading.Event()
+
+    def init_tables(self, cursor):
+        """Create the rollup tables; called from Database.init_db."""
+        cursor.execute('''
+            CREATE TABLE IF NOT EXISTS log_rollup_hourly (
+                hour TEXT PRIMARY KEY,
+                total INTEGER NOT NULL DEFAULT 0,
+                successes INTEGER NOT NULL DEFAULT 0,
+                failures INTEGER NOT NULL DEFAULT 0
+            )
+        ''')
+        # Cards are rolled up per hour so top failing cards cover the same
+        # window as the other stats
+        cursor.execute('''
+            CREATE TABLE IF NOT EXISTS log_rollup_card_hourly (
+                hour TEXT NOT NULL,
+                rfid_uid TEXT NOT NULL,
+                total INTEGER NOT NULL DEFAULT 0,
+                successes INTEGER NOT NULL DEFAULT 0,
+                failures INTEGER NOT NULL DEFAULT 0,
+                last_seen TIMESTAMP,
+                PRIMARY KEY (hour, rfid_uid)
+            )
+        ''')
+        # Replaced by log_rollup_card_hourly (its counts had no time window)
+        cursor.execute('DROP TABLE IF EXISTS log_rollup_card')
+
+        # Databases created before the rollups existed: build them once
+        cursor.execute('SELECT 1 FROM log_rollup_hourly LIMIT 1')
+        if cursor.fetchone() is None:
+            cursor.execute('''
+                INSERT INTO log_rollup_hourly (hour, total, successes, failures)
+                SELECT substr(created_at, 1, 13) || ':00:00', COUNT(*),
+                       SUM(success != 0), SUM(success = 0)
+                FROM logs GROUP BY 1
+            ''')
+        cursor.execute('SELECT 1 FROM log_rollup_card_hourly LIMIT 1')
+        if cursor.fetchone() is None:
+            cursor.execute('''
+                INSERT INTO log_rollup_card_hourly (hour, rfid_uid, total, successes, failures, last_seen)
+                SELECT substr(created_at, 1, 13) || ':00:00', rfid_uid, COUNT(*),
+                       SUM(success != 0), SUM(success = 0), MAX(created_at)
+                FROM logs WHERE rfid_uid IS NOT NULL GROUP BY 1, 2
+            ''')
+
+    def apply_batch(self, cursor, records):
+        """
+        Fold a batch of (rfid_uid, success, message, created_at) records into
+        the rollups. Runs inside the transaction that inserts the batch.
+        """
+        hours = {}
+        cards = {}
+        for rfid_uid, success, _, created_at in records:
+            ok = 1 if success else 0
+            hour = hours.setdefault(_hour_of(created_at), [0, 0, 0])
+            hour[0] += 1
+            hour[1] += ok
+            hour[2] += 1 - ok
+            if rfid_uid is not None:
+                card = cards.setdefault((_hour_of(created_at), rfid_uid), [0, 0, 0, created_at])
+                card[0] += 1
+                card[1] += ok
+                card[2] += 1 - ok
+                card[3] = max(card[3], created_at)
+
+        cursor.executemany('''
+            INSERT INTO log_rollup_hourly (hour, total, successes, failures) VALUES (?, ?, ?, ?)
+            ON CONFLICT (hour) DO UPDATE SET
+                total = total + excluded.total,
+                successes = successes + excluded.successes,
+                failures = failures + excluded.failures
+        ''', [(hour, *counts) for hour, counts in hours.items()])
+        cursor.executemany('''
+            INSERT INTO log_rollup_card_hourly (hour, rfid_uid, total, successes, failures, last_seen)
+            VALUES (?, ?, ?, ?, ?, ?)
+            ON CONFLICT (hour, rfid_uid) DO UPDATE SET
+                total = total + excluded.total,
+                successes = successes + excluded.successes,
+                failures = failures + excluded.failures,
+                last_seen = MAX(last_seen, excluded.last_seen)
+        ''', [(*key, *counts) for key, counts in cards.items()])
+
+    def get_stats(self, hours=24, top=5):
+        """
+        Summarize the last `hours` hours from the rollups.
+
+        Cost depends only on `hours` and the cards seen in them, not on the
+        size of the raw logs table.
+        """
+        since = _hour_of(time.strftime('%Y-%m-%d %H:%M:%S', time.gmtime(time.time() - (hours - 1) * 3600)))
+        conn = self.database.get_connection()
+        cursor = conn.cursor()
+
+        cursor.execute(
+            'SELECT hour, total, successes, failures FROM log_rollup_hourly WHERE hour >= ? ORDER BY hour',
+            (since,)
+        )
+        per_hour = [dict(row) for row in cursor.fetchall()]
+
+        cursor.execute(
+            'SELECT rfid_uid, SUM(total) AS total, SUM(successes) AS successes, '
+            'SUM(failures) AS failures, MAX(last_seen) AS last_seen '
+            'FROM log_rollup_card_hourly WHERE hour >= ? GROUP BY rfid_uid '
+            'HAVING SUM(failures) > 0 ORDER BY failures DESC, last_seen DESC LIMIT ?',
+            (since, top)
+        )
+        top_failing = [dict(row) for row in cursor.fetchall()]
+        conn.close()
+
+        total = sum(row['total'] for row in per_hour)
+        failures = sum(row['failures'] for row in per_hour)
+        return {
+            'window_hours': hours,
+            'since': since,
+            'total': total,
+            'successes': total - failures,
+            'failures': failures,
+            'failure_rate': failures / total if total else 0.0,
+            'per_hour': per_hour,
+            'top_failing_cards': top_failing
+        }
+
+    def prune(self, max_age_days=None):
+        """
+        Delete raw log rows older than max_age_days (defaults to the
+        configured retention). Deletes in small chunks so the audit writer
+        is never locked out for long.
+
+        Returns:
+            int: Number of rows deleted
+        """
+        days = self.retention_days if max_age_days is None else max_age_days
+        if not days or days <= 0:
+            return 0
+
+        cutoff = time.strftime('%Y-%m-%d %H:%M:%S', time.gmtime(time.time() - days * 86400))
+        conn = self.database.get_connection()
+        deleted = 0
+        try:
+            while True:
+                with conn:
+                    cursor = conn.execute(
+                        'DELETE FROM logs WHERE id IN '
+                        '(SELECT id FROM logs WHERE created_at < ? ORDER BY created_at LIMIT ?)',
+                        (cutoff, self.prune_chunk)
+                    )
+                deleted += cursor.rowcount
+                if cursor.rowcount < self.prune_chunk:
+                    break
+        finally:
+            conn.close()
+        return deleted
+
+    def start(self):
+        """Start pruning in the background every check_interval seconds."""
+        if not self.running and self.retention_days > 0:
+            self.running = True
+            self._wake.clear()
+            self.thread = threading.Thread(target=self._prune_loop, name='log-retention', daemon=True)
+            self.thread.start()
+
+    def stop(self):
+        self.running = False
+        self._wake.set()
+        if self.thread:
+            self.thread.join()
+            self.thread = None
+
+    def _prune_loop(self):
+        while self.running:
+            try:
+                deleted = self.prune()
+                if deleted:
+                    print(f"[RETENTION] Pruned {deleted} log rows older than {self.retention_days} days")
+            except Exception as e:
+                print(f"[RETENTION ERROR] {e}")
+            self._wake.wait(self.check_interval)
@@ -0,0 +1,168 @@
+"""
+Startup timeline and systemd readiness for the Raspberry Pi hardware appliance.
+
+After a power cut the kiosk shows nothing until the web server answers, so
+run.py serves first and lets the database, ledger and hardware initialize
+in the background or on first use (LazyInit). The timeline records each
+import and phase, measured from the moment the kernel started the process.
+It is printed once the appliance is serving and returned by /api/startup.
+"""
+import os
+import socket
+import threading
+import time
+from contextlib import contextmanager
+
+
+def process_start_time():
+    """time.monotonic() value at which the kernel started this process (Linux), else now."""
+    try:
+        with open('/proc/self/stat') as f:
+            # Field 22 (starttime) counts clock ticks since boot; fields
+            # after the ')' of the command name start with field 3
+            start_ticks = int(f.read().rsplit(')', 1)[1].split()[19])
+        with open('/proc/uptime') as f:
+            uptime = float(f.read().split()[0])
+        age = uptime - start_ticks / os.sysconf('SC_CLK_TCK')
+        return time.monotonic() - max(0.0, age)
+    except (OSError, ValueError, IndexError):
+        return time.monotonic()
+
+
+class StartupTimeline:
+    def __init__(self, origin=None):
+        """
+        Args:
+            origin (float): time.monotonic() value offsets are measured from
+                (defaults to the process start)
+        """
+        self.origin = origin if origin is not None else process_start_time()
+        self._lock = threading.Lock()
+        self.phases = []  # (name, start, end, thread name)
+        self.marks = []  # (name, time)
+        self.ready_at = None
+
+    def record(self, name, start, end=None):
+        """Record a phase that has already finished."""
+        end = end if end is not None else time.monotonic()
+        with self._lock:
+            self.phases.append((name, start, end, threading.current_thread().name))
+
+    @contextmanager
+    def phase(self, name):
+        start = time.monotonic()
+        try:
+            yield
+        finally:
+            self.record(name, start)
+
+    def mark(self, name):
+        """Record a point in time, e.g. 'serving' or 'hardware ready'."""
+        with self._lock:
+            self.marks.append((name, time.monotonic()))
+
+    def ready(self):
+        """
+        Mark the web server as serving: tell systemd (READY=1) and print the
+        timeline so far. Phases still running in the background are added
+        to /api/startup as they finish.
+        """
+        if self.ready_at is not None:
+            return
+        self.mark('serving')
+        self.ready_at = time.monotonic()
+        sd_notify('READY=1', f'STATUS=Serving after {self.ready_at - self.origin:.2f}s')
+        print(self.report())
+
+    def as_dict(self):
+        with self._lock:
+            phases = sorted(self.phases, key=lambda phase: phase[1])
+            marks = list(self.marks)
+        return {
+            'ready_after_ms': None if self.ready_at is None else round((self.ready_at - self.origin) * 1000, 1),
+            'phases': [
+                {
+                    'name': name,
+                    'start_ms': round((start - self.origin) * 1000, 1),
+                    'duration_ms': round((end - start) * 1000, 1),
+                    'thread': thread
+                }
+                for name, start, end, thread in phases
+            ],
+            'marks': {name: round((at - self.origin) * 1000, 1) for name, at in marks}
+        }
+
+    def report(self):
+        """Human-readable timeline, one line per phase in start order."""
+        timeline = self.as_dict()
+        lines = ["[STARTUP] Timeline (ms since process start):"]
+        for phase in timeline['phases']:
+            lines.append(f"  {phase['start_ms']:8.1f} +{phase['duration_ms']:8.1f}  {phase['name']}"
+                         + ('' if phase['thread'] == 'MainThread' else f" [{phase['thread']}]"))
+        for name, at in timeline['marks'].items():
+            lines.append(f"  {at:8.1f}            -- {name}")
+        return '\n'.join(lines)
+
+
+class LazyInit:
+    """
+    Run an initializer once, the first time something needs it.
+
+    Other threads calling in the meantime wait for it to finish. The
+    initializing thread itself may call again (Database.init_db opens
+    connections, which ask for the schema) and returns at once. If the
+    initializer raises, the next call tries again.
+    """
+
+    def __init__(self, func, name):
+        """
+        Args:
+            func (callable): Initializer
+            name (str): Phase name in the startup timeline
+        """
+        self.func = func
+        self.name = name
+        self.done = False
+        self._running = False
+        self._lock = threading.RLock()
+
+    def __call__(self):
+        if self.done:
+            return
+        with self._lock:
+            if self.done or self._running:
+                return
+            self._running = True
+            try:
+                with timeline.phase(self.name):
+                    self.func()
+                self.done = True
+            finally:
+                self._running = False
+
+
+def sd_notify(*states):
+    """
+    Send state lines (READY=1, STATUS=...) to systemd.
+
+    Returns:
+        bool: False when not started by a Type=notify service
+    """
+    path = os.environ.get('NOTIFY_SOCKET')
+    if not path:
+        return False
+    if path.startswith('@'):
+        # Abstract namespace socket
+        path = '\0' + path[1:]
+    try:
+        with socket.socket(socket.AF_UNIX, socket.SOCK_DGRAM) as sock:
+            sock.connect(path)
+            sock.sendall('\n'.join(states).encode())
+        return True
+    except OSError as e:
+        print(f"[STARTUP ERROR] sd_notify failed: {e}")
+        return False
+
+
+# Global startup timeline
+timeline = StartupTimeline()
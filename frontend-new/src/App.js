@@ -8,7 +8,6 @@ function App() {
   const [currentView, setCurrentView] = useState('welcome');
   const [rfidUid, setRfidUid] = useState('');
   const [pinLength, setPinLength] = useState(0);
-  const [pinBuffer, setPinBuffer] = useState(''); // Added to store actual keys from backend
   const [accountInfo, setAccountInfo] = useState(null);
   const [currentTransaction, setCurrentTransaction] = useState(null);
   const [withdrawAmount, setWithdrawAmount] = useState('');
@@ -17,7 +16,10 @@ function App() {
 
 
   useEffect(() => {
-    const s = io('http://localhost:5000');
+    // Session events arrive only for this kiosk's terminal (?terminal=<id>)
+    const terminalId = new URLSearchParams(window.location.search).get('terminal') || 'default';
+    // WebSocket only: with several web workers there are no sticky sessions for polling
+    const s = io('http://localhost:5000', { query: { terminal: terminalId }, transports: ['websocket'] });
     setSocket(s);
 
     s.on('connect', () => {
@@ -38,7 +40,6 @@ function App() {
     s.on('request_pin', (data) => {
       setRfidUid(data.rfid_uid);
       setPinLength(0);
-      setPinBuffer('');
       setCurrentView('pinEntry');
       addMessage('Enter PIN on physical keypad');
     });
@@ -46,7 +47,11 @@ function App() {
     s.on('pin_updated', (data) => {
       console.log('PIN_UPDATED RECEIVED:', data);
       setPinLength(data.pin_length);
-      setPinBuffer(data.pin_buffer);
+    });
+
+    s.on('session_ended', (data) => {
+      addMessage(data.reason === 'timed_out' ? 'PIN entry timed out' : 'PIN entry cancelled');
+      resetSession();
     });
 
     s.on('auth_result', (data) => {
@@ -117,7 +122,6 @@ function App() {
   const resetSession = () => {
     setRfidUid('');
     setPinLength(0);
-    setPinBuffer('');
     setAccountInfo(null);
     setCurrentView('welcome');
     addMessage('Session reset');
@@ -191,11 +195,6 @@ function App() {
               </div>
             </div>
 
-            {/* Actual keys pressed (for testing/debug) */}
-            <div className="pin-keys-display" style={{ marginTop: '20px', color: '#888' }}>
-              {pinBuffer || 'No keys pressed yet'}
-            </div>
-
             <p style={{ fontSize: '0.9rem', marginTop: '10px', color: '#555' }}>
               Use physical keypad
             </p>
@@ -12,7 +12,7 @@ const HardwareApplianceUI = () => {
 
   useEffect(() => {
     // Connect to Flask-SocketIO server
-    const newSocket = io('http://localhost:5000');
+    const newSocket = io('http://localhost:5000', { transports: ['websocket'] });
     setSocket(newSocket);
 
     // Listen for connection status
@@ -12,6 +12,9 @@ npm run build
 # Copy build files to Flask static directory
 cp -r build/* ../app/static/
 
+# Write .gz/.br variants for the server to send as-is
+python3 ../tools/compress_static.py --root ../app/static
+
 echo "Frontend build complete!"
 echo "Files copied to ../app/static/"
 echo "The Flask backend will now serve the React frontend."
\ No newline at end of file
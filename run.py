@@ -1,57 +1,255 @@
 import sys
 import os
 import signal
+import socket
+import threading
+import time
+import importlib
+
+# Imports are timed by hand until app.startup (which imports the app
+# package) is available to record them in the startup timeline
+IMPORTS = []
+
+
+def timed_import(name):
+    started = time.monotonic()
+    module = importlib.import_module(name)
+    IMPORTS.append((f"import {name}", started, time.monotonic()))
+    return module
+
+
+# With WEB_WORKERS > 0 this script supervises a hardware process and web
+# workers, which run this script again with PROCESS_ROLE set (app/cluster.py)
+ROLE = os.environ.get('PROCESS_ROLE', 'all')
+SERVES_WEB = ROLE == 'web' or (ROLE == 'all' and int(os.environ.get('WEB_WORKERS', 0)) == 0)
+
+# eventlet/gevent must patch the standard library before Flask and the
+# hardware modules are imported. Threads stay native: the reader, keypad and
+# KDF workers run beside the hub and emit through app/hardware/emit_bridge.py
+ASYNC_MODE = os.environ.get('SOCKETIO_ASYNC_MODE', 'threading')
+if SERVES_WEB and ASYNC_MODE == 'eventlet':
+    # The appliance resolves no host names; skipping eventlet's dnspython
+    # resolver takes a few hundred ms off its import
+    os.environ.setdefault('EVENTLET_NO_GREENDNS', 'yes')
+    timed_import('eventlet').monkey_patch(thread=False)
+elif SERVES_WEB and ASYNC_MODE == 'gevent':
+    timed_import('gevent.monkey').patch_all(thread=False)
 
 sys.path.append(os.path.join(os.path.dirname(__file__), 'app'))
 
+for module in ('flask', 'flask_socketio', 'app'):
+    timed_import(module)
+
 from app import create_app
-from app.hardware.rfid_reader import RFIDReader
-from app.hardware.keypad import Keypad
+from app.config import Config
 from app.hardware.coordinator import get_coordinator
 from app.models.database import db
+from app.models.ledger import ledger
+from app.startup import sd_notify, timeline
 
+for imported in IMPORTS:
+    timeline.record(*imported)
 
-def main():
-    print("Starting Raspberry Pi Banking Appliance")
 
-    # Create Flask app + SocketIO
-    app, socketio = create_app()
+def start_hardware(coordinator):
+    """
+    Bring up the database, reader, keypad, printer and log retention.
 
-    # Initialize database
-    db.init_db()
-    db.add_user("769714493968", "1234")
+    The reader and keypad load the hardware backend (RPi.GPIO, mfrc522) and
+    set up the pins, so run_single calls this off the main thread while the
+    web server is already answering.
 
-    # Create coordinator (ONLY place SocketIO is used)
-    coordinator = get_coordinator(socketio)
+    Returns:
+        callable that stops the reader and keypad again
+    """
+    db.ensure_ready()
+    # Demo card; its PIN is only hashed on the first boot of a fresh database
+    with timeline.phase('seed demo user'):
+        db.seed_user("769714493968", "1234")
 
-    # Initialize hardware
-    rfid_reader = RFIDReader(coordinator)
-    keypad = Keypad(coordinator)
+    with timeline.phase('import hardware modules'):
+        from app.hardware.rfid_reader import RFIDReader
+        from app.hardware.keypad import Keypad
 
-    coordinator.set_hardware_components(rfid_reader, keypad)
+    # Initialize hardware
+    with timeline.phase('hardware init'):
+        rfid_reader = RFIDReader(coordinator)
+        keypad = Keypad(coordinator)
+        coordinator.set_hardware_components(rfid_reader, keypad)
 
     # Start hardware threads
-    rfid_reader.start()
-    keypad.start()
+    with timeline.phase('hardware start'):
+        rfid_reader.start()
+        keypad.start()
+        coordinator.printer.start()
+        db.retention.start()
+    timeline.mark('hardware ready')
+
+    def stop():
+        rfid_reader.stop()
+        keypad.stop()
+
+    return stop
+
+
+def warm_up():
+    """Open the database and load the ledger before the first request needs them."""
+    try:
+        db.ensure_ready()
+        ledger.ensure_ready()
+    except Exception as e:
+        # The first request that needs them tries again
+        print(f"[STARTUP ERROR] Warm-up failed: {e}")
+
+
+def open_listener(port):
+    with timeline.phase('bind port'):
+        return socket.create_server(('0.0.0.0', port), backlog=1024)
+
+
+def unbuffered_event_streams(app):
+    """
+    eventlet.wsgi holds back response writes until 4 KiB have piled up; let
+    Server-Sent Events (/api/logs/tail) out as they are written. Set on the
+    server's own environ, which the Socket.IO middleware only hands a copy
+    of to Flask.
+    """
+    def wrapped(environ, start_response):
+        def start(status, headers, exc_info=None):
+            for name, value in headers:
+                if name.lower() == 'content-type' and value.startswith('text/event-stream'):
+                    environ['eventlet.minimum_write_chunk_size'] = 0
+            return start_response(status, headers, exc_info)
+        return app(environ, start)
+    return wrapped
+
+
+def serve(app, listener):
+    """
+    Serve on an open listening socket with the server that suits
+    ASYNC_MODE, telling systemd we are ready just before accepting.
+    """
+    if ASYNC_MODE == 'eventlet':
+        import eventlet.wsgi
+        from eventlet.greenio import GreenSocket
+        timeline.ready()
+        eventlet.wsgi.server(GreenSocket(listener), unbuffered_event_streams(app), log_output=False)
+    elif ASYNC_MODE == 'gevent':
+        from gevent.pywsgi import WSGIServer
+        from geventwebsocket.handler import WebSocketHandler
+        server = WSGIServer(listener, app, handler_class=WebSocketHandler, log=None)
+        timeline.ready()
+        server.serve_forever()
+    else:
+        # Werkzeug's threaded server (development server; threading mode)
+        from werkzeug.serving import make_server
+        host, port = listener.getsockname()[:2]
+        server = make_server(host, port, app, threaded=True, fd=listener.fileno())
+        timeline.ready()
+        server.serve_forever()
+
+
+def run_single():
+    """Hardware and web clients in one process (the default)."""
+    print("Starting Raspberry Pi Banking Appliance")
+
+    # Create Flask app + SocketIO; the database and ledger open on first use
+    with timeline.phase('create app'):
+        app, socketio = create_app()
+    listener = open_listener(Config.WEB_PORT)
+
+    # Built here so its emit bridge belongs to the server's event loop
+    with timeline.phase('coordinator'):
+        coordinator = get_coordinator(socketio)
+
+    # Until the hardware is up the API reports it as not running
+    stops = []
+
+    def bring_up():
+        warm_up()
+        try:
+            stops.append(start_hardware(coordinator))
+            sd_notify('STATUS=Serving, hardware ready')
+            print(f"[STARTUP] Hardware ready after {timeline.as_dict()['marks']['hardware ready']:.0f} ms")
+        except Exception as e:
+            print(f"[STARTUP ERROR] Hardware startup failed: {e}")
+
+    threading.Thread(target=bring_up, name='hardware-startup', daemon=True).start()
 
     # Graceful shutdown
     def shutdown(sig, frame):
         print("Shutting down...")
-        rfid_reader.stop()
-        keypad.stop()
+        sd_notify('STOPPING=1')
+        for stop in stops:
+            stop()
+        coordinator.shutdown()
+        db.close()
         sys.exit(0)
 
     signal.signal(signal.SIGINT, shutdown)
     signal.signal(signal.SIGTERM, shutdown)
 
-    print("System running on port 5000")
-    socketio.run(
-        app,
-        host="0.0.0.0",
-        port=5000,
-        debug=False,
-        use_reloader=False
+    # eventlet and gevent serve with their own production WSGI servers;
+    # threading uses the Werkzeug development server
+    print(f"System running on port {Config.WEB_PORT} ({ASYNC_MODE})")
+    serve(app, listener)
+
+
+def run_hardware():
+    """Hardware owner of the split deployment; publishes its events to the broker."""
+    import socketio as python_socketio
+    from app.broker import UnixSocketManager
+    from app.hardware.remote import HardwareAgent
+
+    print("Starting hardware process")
+
+    # Write-only server: emits go to the web workers' clients via the broker
+    emitter = python_socketio.Server(
+        async_mode='threading',
+        client_manager=UnixSocketManager(Config.BROKER_SOCKET, write_only=True)
     )
+    coordinator = get_coordinator(emitter)
+    stop_hardware = start_hardware(coordinator)
+    agent = HardwareAgent(coordinator)
+    agent.start()
+    print(timeline.report())
+
+    def shutdown(sig, frame):
+        print("Hardware process shutting down...")
+        agent.stop()
+        stop_hardware()
+        coordinator.shutdown()
+        db.close()
+        sys.exit(0)
+
+    signal.signal(signal.SIGINT, shutdown)
+    signal.signal(signal.SIGTERM, shutdown)
+    while True:
+        signal.pause()
+
+
+def run_web():
+    """Web worker of the split deployment; serves on the socket inherited from the supervisor."""
+    with timeline.phase('create app'):
+        app, socketio = create_app()
+    # Built now so PIN changes made here are announced to the hardware process
+    get_coordinator(socketio)
+    threading.Thread(target=warm_up, name='warm-up', daemon=True).start()
+    listener = socket.socket(fileno=int(os.environ['LISTEN_FD']))
+    print(f"Web worker {os.getpid()} serving ({ASYNC_MODE})")
+    serve(app, listener)
+
+
+def main():
+    if ROLE == 'hardware':
+        run_hardware()
+    elif ROLE == 'web':
+        run_web()
+    elif Config.WEB_WORKERS > 0:
+        from app.cluster import Supervisor
+        Supervisor(os.path.abspath(__file__), Config.WEB_WORKERS, port=Config.WEB_PORT).run()
+    else:
+        run_single()
 
 
 if __name__ == "__main__":
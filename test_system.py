@@ -1,14 +1,20 @@
 """
 Test script for the Raspberry Pi hardware appliance.
 """
+import json
 import sys
 import os
+import tempfile
 import time
 import threading
 
 # Add the app directory to the Python path
 sys.path.append(os.path.join(os.path.dirname(__file__), 'app'))
 
+# Run against a throwaway database, never the appliance's app.db (read by
+# app.config on first import, so this has to come before any app import)
+os.environ.setdefault('DATABASE_PATH', os.path.join(tempfile.mkdtemp(prefix='appliance-test-'), 'test.db'))
+
 def test_database():
     """Test the database functionality."""
     print("Testing database functionality...")
@@ -25,6 +31,7 @@ def test_database():
     
     # Test logging an event
     db.log_event("123456789", True, "Test authentication")
+    db.flush_logs()
     print("Logged authentication event")
     
     # Test retrieving logs
@@ -35,6 +42,1170 @@ def test_database():
     conn.close()
     print(f"Total log entries: {count}")
 
+def test_connection_pool():
+    """Test that database connections are reused per thread."""
+    print("\nTesting connection pool...")
+    
+    import tempfile
+    from app.models.database import Database
+    
+    with tempfile.TemporaryDirectory() as tmp:
+        test_db = Database(os.path.join(tmp, 'test.db'))
+        
+        # Same thread gets the same connection back
+        assert test_db.get_connection() is test_db.get_connection()
+        
+        # Other threads get their own
+        seen = []
+        worker = threading.Thread(target=lambda: seen.append(test_db.get_connection()))
+        worker.start()
+        worker.join()
+        assert seen[0] is not test_db.get_connection()
+        
+        mode = test_db.get_connection().execute('PRAGMA journal_mode').fetchone()[0]
+        assert mode == 'wal'
+        
+        test_db.add_user("42", "1234")
+        stats = test_db.get_stats()
+        print(f"Open connections: {stats['open_connections']}, queries tracked: {len(stats['queries'])}")
+        assert stats['open_connections'] == 2
+        
+        test_db.close()
+        assert test_db.get_stats()['open_connections'] == 0
+
+def test_audit_writer():
+    """Test batched, asynchronous log writing."""
+    print("\nTesting audit log writer...")
+    
+    import tempfile
+    from app.models.database import Database
+    
+    with tempfile.TemporaryDirectory() as tmp:
+        test_db = Database(os.path.join(tmp, 'test.db'))
+        
+        for i in range(100):
+            test_db.log_event(str(i), i % 2 == 0, "Queued event")
+        assert test_db.log_event("durable", True, "Durable event", durable=True)
+        
+        count = test_db.get_connection().execute('SELECT COUNT(*) FROM logs').fetchone()[0]
+        audit = test_db.get_stats()['audit']
+        print(f"Committed {audit['committed']} events in {audit['batches']} batches")
+        assert count == 101
+        assert audit['batches'] < 101
+        
+        test_db.close()
+    
+    # drop_oldest never blocks and never discards a flush marker
+    from app.models.audit import AuditLogWriter
+    written = []
+    writing = threading.Event()
+    gate = threading.Event()
+    def write_batch(rows):
+        writing.set()
+        gate.wait(2)
+        written.extend(rows)
+    writer = AuditLogWriter(write_batch, flush_interval=0, queue_size=2, overflow_policy='drop_oldest')
+    writer.submit(('a',))
+    assert writing.wait(2)
+    # The marker is oldest in the queue while b, c and d arrive
+    flushed = []
+    flusher = threading.Thread(target=lambda: flushed.append(writer.flush(2)))
+    flusher.start()
+    time.sleep(0.05)
+    started = time.monotonic()
+    assert writer.submit(('b',)) and writer.submit(('c',)) and writer.submit(('d',))
+    assert time.monotonic() - started < 0.5
+    gate.set()
+    flusher.join()
+    # The flush waited for 'a', queued before it; 'b' made room for 'd'
+    assert flushed == [True] and written[0] == ('a',)
+    writer.stop(2)
+    assert written == [('a',), ('c',), ('d',)] and writer.stats()['dropped'] == 1
+
+def test_log_rollups():
+    """Test windowed log stats from the rollups across a retention purge."""
+    print("\nTesting log rollups and retention...")
+    
+    from app.models.database import Database
+    
+    def stamp(seconds_ago):
+        return time.strftime('%Y-%m-%d %H:%M:%S', time.gmtime(time.time() - seconds_ago))
+    
+    with tempfile.TemporaryDirectory() as tmp:
+        test_db = Database(os.path.join(tmp, 'test.db'))
+        old = stamp(40 * 86400)
+        recent = stamp(60)
+        test_db._write_log_batch([
+            ("old-card", False, "Invalid PIN", old),
+            ("old-card", False, "Invalid PIN", old),
+            ("old-card", False, "Invalid PIN", old),
+            ("new-card", False, "Invalid PIN", recent),
+            ("new-card", True, "Authentication successful", recent)
+        ])
+        
+        day = test_db.get_log_stats(hours=24)
+        assert (day['total'], day['failures']) == (2, 1)
+        # Cards failing only outside the window are not reported
+        assert [card['rfid_uid'] for card in day['top_failing_cards']] == ["new-card"]
+        assert day['top_failing_cards'][0]['total'] == 2
+        
+        season = test_db.get_log_stats(hours=24 * 60)
+        assert (season['total'], season['failures']) == (5, 4)
+        assert [card['rfid_uid'] for card in season['top_failing_cards']] == ["old-card", "new-card"]
+        
+        # Purging raw rows leaves the rollups, and so the stats, unchanged
+        assert test_db.prune_logs(30) == 3
+        count = test_db.get_connection().execute('SELECT COUNT(*) FROM logs').fetchone()[0]
+        assert count == 2
+        assert test_db.get_log_stats(hours=24) == day
+        assert test_db.get_log_stats(hours=24 * 60) == season
+        print(f"Purged 3 raw rows; {season['total']} events still counted")
+        
+        test_db.close()
+
+def test_log_queries():
+    """Test keyset pagination, filters and streaming export of /api/logs."""
+    print("\nTesting log pagination and export...")
+    
+    import csv
+    import io
+    from app import create_app
+    from app.api import routes
+    from app.models.database import Database
+    
+    app, socketio = create_app()
+    client = app.test_client()
+    with tempfile.TemporaryDirectory() as tmp:
+        test_db = Database(os.path.join(tmp, 'test.db'))
+        # Rows sharing a timestamp are ordered by id, so no page boundary
+        # can skip or repeat one
+        test_db._write_log_batch([
+            (f"card-{i % 3}", i % 2 == 0, "Authentication successful" if i % 2 == 0 else "Invalid PIN",
+             f"2024-05-01 12:00:{i // 2:02d}")
+            for i in range(11)
+        ])
+        saved, routes.db = routes.db, test_db
+        try:
+            newest_first = [row['id'] for row in test_db.get_logs(100)[0]]
+            seen = []
+            response = client.get('/api/logs?limit=3')
+            while True:
+                assert response.status_code == 200
+                seen.extend(row['id'] for row in response.get_json())
+                if 'X-Next-Cursor' not in response.headers:
+                    break
+                response = client.get('/api/logs', query_string={'limit': 3, 'cursor': response.headers['X-Next-Cursor']})
+            assert seen == newest_first and len(seen) == 11
+            
+            # Filters hold across pages
+            query = {'limit': 1, 'rfid_uid': 'card-0', 'success': 'false'}
+            response = client.get('/api/logs', query_string=query)
+            pages = [response.get_json()]
+            query['cursor'] = response.headers['X-Next-Cursor']
+            pages.append(client.get('/api/logs', query_string=query).get_json())
+            assert [row['id'] for page in pages for row in page] == [10, 4]
+            assert all(row['rfid_uid'] == 'card-0' and not row['success'] for page in pages for row in page)
+            window = client.get('/api/logs', query_string={'since': '2024-05-01T12:00:01Z', 'until': '2024-05-01T12:00:03'})
+            assert sorted(row['id'] for row in window.get_json()) == [3, 4, 5, 6]
+            
+            for bad in ({'cursor': 'not a cursor'}, {'cursor': 'bm9waXBl'}, {'success': 'maybe'}, {'since': 'yesterday'}, {'limit': 0}):
+                assert client.get('/api/logs', query_string=bad).status_code == 400, bad
+            
+            response = client.get('/api/logs/export', query_string={'success': 'true'})
+            assert response.mimetype == 'application/x-ndjson'
+            exported = [json.loads(line) for line in response.get_data(as_text=True).splitlines()]
+            assert [row['id'] for row in exported] == [i for i in newest_first if i % 2 == 1]
+            
+            response = client.get('/api/logs/export', query_string={'format': 'csv', 'rfid_uid': 'card-1'})
+            assert response.mimetype == 'text/csv'
+            assert response.headers['Content-Disposition'] == 'attachment; filename=logs.csv'
+            rows = list(csv.DictReader(io.StringIO(response.get_data(as_text=True))))
+            assert list(rows[0]) == routes.LOG_EXPORT_COLUMNS
+            assert [int(row['id']) for row in rows] == [11, 8, 5, 2]
+            assert client.get('/api/logs/export?format=xml').status_code == 400
+            print(f"Paged {len(seen)} events 3 at a time; exported {len(exported)} successes")
+        finally:
+            routes.db = saved
+            test_db.close()
+
+def test_credential_cache():
+    """Test that authentication is served from the credential cache."""
+    print("\nTesting credential cache...")
+    
+    import tempfile
+    from app.models.database import Database
+    
+    with tempfile.TemporaryDirectory() as tmp:
+        test_db = Database(os.path.join(tmp, 'test.db'))
+        test_db.add_user("card-a", "1234")
+        
+        assert test_db.authenticate_user("card-a", "1234")
+        assert not test_db.authenticate_user("card-a", "0000")
+        assert not test_db.authenticate_user("unknown", "1234")
+        
+        assert test_db.update_pin("card-a", "4321")
+        assert test_db.authenticate_user("card-a", "4321")
+        assert test_db.delete_user("card-a")
+        assert not test_db.authenticate_user("card-a", "4321")
+        
+        stats = test_db.get_stats()['credential_cache']
+        print(f"Cache hits: {stats['hits']}, misses: {stats['misses']}")
+        assert stats['misses'] == 0
+        
+        # Legacy unsalted SHA-256 rows are upgraded on login
+        import hashlib
+        conn = test_db.get_connection()
+        conn.execute('INSERT INTO users (rfid_uid, pin_hash) VALUES (?, ?)',
+                     ("legacy", hashlib.sha256(b"5555").hexdigest()))
+        conn.commit()
+        test_db.close()
+        
+        test_db = Database(os.path.join(tmp, 'test.db'))
+        assert test_db.authenticate_user("legacy", "5555")
+        conn = test_db.get_connection()
+        stored = conn.execute('SELECT pin_hash FROM users WHERE rfid_uid = ?', ("legacy",)).fetchone()[0]
+        assert stored.startswith('pbkdf2_sha256$')
+        assert test_db.authenticate_user("legacy", "5555")
+        
+        test_db.close()
+
+def test_print_spooler():
+    """Test that print jobs are persisted and retried."""
+    print("\nTesting print spooler...")
+    
+    import tempfile
+    from app.models.database import Database
+    from app.hardware.spooler import PrintSpooler
+    
+    with tempfile.TemporaryDirectory() as tmp:
+        test_db = Database(os.path.join(tmp, 'test.db'))
+        printed = []
+        failures = [1]
+        
+        def flaky_printer(job):
+            if failures[0]:
+                failures[0] -= 1
+                raise IOError("Paper out")
+            printed.append(job)
+        
+        spooler = PrintSpooler(test_db, {'auth': flaky_printer}, retry_base=0.01)
+        spooler.submit('auth', {'rfid_uid': '42'})
+        
+        deadline = time.time() + 5
+        while not printed and time.time() < deadline:
+            time.sleep(0.01)
+        spooler.stop()
+        
+        job = spooler.get_jobs()[0]
+        print(f"Job {job['id']}: {job['status']} after {job['attempts']} attempts")
+        assert printed == [{'rfid_uid': '42'}]
+        assert job['status'] == 'done' and job['attempts'] == 2
+        
+        # A full queue rejects instead of writing on the caller's thread
+        gate = threading.Event()
+        slow = PrintSpooler(test_db, {'auth': lambda job: gate.wait(5)}, queue_size=1, keep_done_days=0,
+                            prune_interval=0.05)
+        slow.submit('auth', {'rfid_uid': '1'})
+        deadline = time.time() + 5
+        while slow.counts()['printing'] == 0 and time.time() < deadline:
+            time.sleep(0.01)
+        assert slow.submit('auth', {'rfid_uid': '2'})
+        assert not slow.submit('auth', {'rfid_uid': '3'})
+        assert slow.counts()['rejected'] == 1
+        gate.set()
+        # Finished jobs are pruned while the spooler runs, not only at startup
+        while slow.counts()['done'] + slow.counts()['queued'] + slow.counts()['printing'] and time.time() < deadline:
+            time.sleep(0.01)
+        slow.stop()
+        assert slow.get_jobs() == []
+        
+        test_db.close()
+
+def test_receipt_templates():
+    """Test that each receipt is sent to the printer in a single write."""
+    print("\nTesting receipt templates...")
+    
+    import tempfile
+    from app.models.database import Database
+    from app.hardware.printer import Printer
+    from app.hardware.receipts import FileEndpoint, INIT, FEED_AND_CUT
+    
+    with tempfile.TemporaryDirectory() as tmp:
+        test_db = Database(os.path.join(tmp, 'test.db'))
+        endpoint = FileEndpoint(os.path.join(tmp, 'usb.bin'))
+        printer = Printer(test_db, endpoint)
+        
+        printer.print_receipt("123456789", True, "Access granted")
+        printer.print_transaction_receipt("1234", "Withdrawal", 20.0, 1230.75)
+        
+        deadline = time.time() + 5
+        while endpoint.writes < 2 and time.time() < deadline:
+            time.sleep(0.01)
+        printer.stop()
+        
+        with open(endpoint.path, 'rb') as f:
+            output = f.read()
+        print(f"Writes: {endpoint.writes}, sizes: {endpoint.write_sizes}")
+        assert endpoint.writes == 2
+        assert output.startswith(INIT) and output.endswith(FEED_AND_CUT)
+        assert b"Card ID: 123456789\n" in output
+        assert b"Balance: $1230.75\n" in output
+        
+        test_db.close()
+
+def test_sim_backend():
+    """Test that the keypad and RFID reader work against the simulated hardware."""
+    print("\nTesting simulated hardware backend...")
+    
+    from app.hardware.backends.sim import SimBackend, parse_trace, session_trace
+    from app.hardware.keypad import Keypad
+    from app.hardware.rfid_reader import RFIDReader
+    
+    class Recorder:
+        def __init__(self):
+            self.events = []
+        
+        def try_start_session(self, rfid_uid):
+            self.events.append(('tap', rfid_uid))
+            return True
+        
+        def handle_key_press(self, key):
+            self.events.append(('key', key))
+    
+    backend = SimBackend(clock_speed=10)
+    recorder = Recorder()
+    rfid_reader = RFIDReader(recorder, backend=backend)
+    keypad = Keypad(recorder, backend=backend)
+    rfid_reader.start()
+    keypad.start()
+    
+    backend.play(session_trace("769714493968", "1234"))
+    # Held card and a quick re-tap are suppressed; another card is not
+    backend.play(parse_trace([
+        "# comment",
+        "0.0 tap 769714493968",
+        "0.1 key *",
+        "0.3 key #",
+        "0.5 tap 1111",
+    ]))
+    deadline = time.time() + 2
+    while len(recorder.events) < 9 and time.time() < deadline:
+        time.sleep(0.01)
+    
+    rfid_reader.stop()
+    keypad.stop()
+    
+    stats = rfid_reader.stats()
+    print(f"Events: {recorder.events}")
+    print(f"RFID stats: {stats}")
+    assert recorder.events == ([('tap', '769714493968')] + [('key', k) for k in "12346*#"]
+                               + [('tap', '1111')])
+    assert stats['duplicates_suppressed'] > 0
+    assert stats['tap_to_request_pin']['count'] == 2
+    assert stats['backend'] == 'sim'
+    
+    # Falling back from auto is logged as a warning (no Pi libraries here)
+    import contextlib
+    import io
+    from app.hardware.backends import load_backend
+    output = io.StringIO()
+    with contextlib.redirect_stdout(output):
+        fallback = load_backend('auto')
+    if fallback.name == 'sim':
+        assert '[HARDWARE WARNING]' in output.getvalue()
+
+def test_keypad_debounce():
+    """Test that contact bounce gives one press and a held key never repeats."""
+    print("\nTesting keypad debouncing...")
+    
+    from app.config import Config
+    from app.hardware.backends.sim import SimBackend
+    from app.hardware.keypad import KeyDebouncer, Keypad
+    
+    window = Config.KEYPAD_DEBOUNCE_MS / 1000
+    step = window / 10
+    debouncer = KeyDebouncer(window)
+    
+    def feed(pattern, start):
+        """Sample closed/open levels one step apart; returns the presses and the next time."""
+        presses = 0
+        for index, closed in enumerate(pattern):
+            presses += debouncer.update(closed, start + index * step)
+        return presses, start + len(pattern) * step
+    
+    # Press bounce: no contact stays closed for the whole window until it settles
+    presses, now = feed([True, False, True, True, False, True, False] + [True] * 30, 0.0)
+    assert presses == 1 and debouncer.state == KeyDebouncer.DOWN
+    # Held for 100 windows: still one press
+    presses, now = feed([True] * 1000, now)
+    assert presses == 0
+    # Release bounce shorter than the window is not a new press
+    presses, now = feed([False, True, False, False, True, True, False] + [True] * 30, now)
+    assert presses == 0 and debouncer.state == KeyDebouncer.DOWN
+    presses, now = feed([False] * 12, now)
+    assert presses == 0 and debouncer.idle
+    # A closure shorter than the window is ignored
+    presses, now = feed([True] * 9 + [False], now)
+    assert presses == 0 and debouncer.idle
+    presses, now = feed([True] * 12, now)
+    assert presses == 1
+    
+    # The interrupt scan loop, woken by every bouncing edge, reports each key once
+    class Recorder:
+        def __init__(self):
+            self.keys = []
+        
+        def handle_key_press(self, key):
+            self.keys.append(key)
+    
+    backend = SimBackend()
+    recorder = Recorder()
+    keypad = Keypad(recorder, backend=backend)
+    assert keypad.mode == 'interrupt'
+    keypad.start()
+    try:
+        bounce = window * 0.75
+        backend.press_key('5', hold=0.1, bounce=bounce)
+        backend.clock.sleep(window * 3)
+        backend.press_key('5', hold=0.5, bounce=bounce)
+        backend.clock.sleep(window * 3)
+        backend.press_key('#', hold=0.1, bounce=bounce)
+        deadline = time.time() + 2
+        while len(recorder.keys) < 3 and time.time() < deadline:
+            time.sleep(0.01)
+        time.sleep(window * 3)
+    finally:
+        keypad.stop()
+    print(f"Keys: {recorder.keys} from {backend.GPIO.edges} column edges")
+    assert recorder.keys == ['5', '5', '#']
+    assert backend.GPIO.edges > len(recorder.keys)
+
+def test_auth_pipeline():
+    """Test that a full notify or record stage holds results back instead of dropping them."""
+    print("\nTesting auth pipeline backpressure...")
+    
+    from concurrent.futures import ThreadPoolExecutor
+    from app.hardware.pipeline import AuthPipeline
+    
+    # Results arrive on a KDF worker thread, which may wait for room
+    kdf = ThreadPoolExecutor(1)
+    def verify(rfid_uid, pin):
+        return kdf.submit(lambda: time.sleep(0.01) or pin == "1234")
+    
+    gate = threading.Event()
+    printer_gate = threading.Event()
+    notified, recorded = [], []
+    pipeline = AuthPipeline(
+        verify,
+        lambda result: (gate.wait(5), notified.append(result.rfid_uid)),
+        lambda result: recorded.append(result.rfid_uid),
+        lambda result: printer_gate.wait(5),
+        queue_size=1
+    )
+    submitter = threading.Thread(target=lambda: [pipeline.submit(str(i), "1234") for i in range(5)])
+    submitter.start()
+    time.sleep(0.2)
+    # The notify worker holds one result and its queue one more: the KDF worker waits
+    assert pipeline.notify_stage.blocked == 1 and not submitter.is_alive()
+    gate.set()
+    submitter.join(5)
+    deadline = time.time() + 5
+    while len(recorded) < 5 and time.time() < deadline:
+        time.sleep(0.01)
+    printer_gate.set()
+    pipeline.stop(5)
+    kdf.shutdown()
+    
+    stats = pipeline.stats()
+    print(f"Blocked: notify {stats['notify']['blocked']}, dropped: print {stats['print']['dropped']}")
+    assert notified == recorded == [str(i) for i in range(5)]
+    assert stats['notify']['blocked'] > 0 and stats['notify']['dropped'] == 0
+    assert stats['print']['dropped'] > 0
+    
+    # A full hasher fails fast on the keypad thread, which must not wait for a full notify stage
+    from app.models.pinhash import PinHasher
+    hasher = PinHasher(workers=1, max_pending=1)
+    hasher_gate = threading.Event()
+    hasher.submit(hasher_gate.wait, 5)
+    notify_gate = threading.Event()
+    messages = []
+    pipeline = AuthPipeline(
+        lambda rfid_uid, pin: hasher.submit(hasher.verify_unknown, pin),
+        lambda result: (notify_gate.wait(5), messages.append(result.message)),
+        lambda result: None,
+        lambda result: None,
+        queue_size=1
+    )
+    started = time.monotonic()
+    for i in range(5):
+        pipeline.submit(str(i), "1234")
+    assert time.monotonic() - started < 1
+    notify_gate.set()
+    hasher_gate.set()
+    pipeline.stop(5)
+    hasher.shutdown()
+    stats = pipeline.stats()
+    assert stats['notify']['dropped'] > 0 and stats['notify']['blocked'] == 0
+    assert set(messages) == {"System busy, please try again"}
+
+def test_auth_sessions():
+    """Test per-terminal sessions, card exclusivity and PIN-entry timeouts."""
+    print("\nTesting auth sessions...")
+    
+    from app.hardware.sessions import SessionTable, SUBMITTED, TIMED_OUT, SessionStateError
+    
+    timed_out = []
+    table = SessionTable(0.2, on_timeout=timed_out.append)
+    
+    first, _ = table.start("kiosk-1", "1111")
+    second, _ = table.start("kiosk-2", "2222")
+    assert first is not None and second is not None
+    # Busy terminal and a card already in a session are refused
+    assert table.start("kiosk-1", "3333")[0] is None
+    assert table.start("kiosk-3", "2222")[0] is None
+    
+    assert table.finish(first, SUBMITTED)
+    assert not table.finish(first, SUBMITTED)
+    try:
+        with first.lock:
+            first.transition(TIMED_OUT)
+        assert False, "submitted session must not time out"
+    except SessionStateError:
+        pass
+    
+    deadline = time.time() + 2
+    while not timed_out and time.time() < deadline:
+        time.sleep(0.01)
+    stats = table.stats()
+    table.stop()
+    
+    print(f"Session stats: {stats}")
+    assert timed_out == [second] and second.state == TIMED_OUT
+    assert stats['active'] == 0 and stats['submitted'] == 1 and stats['timed_out'] == 1
+    assert stats['rejected_busy'] == 2
+
+def test_session_notifications():
+    """Test that session events reach only the terminal's room and PIN updates are merged."""
+    print("\nTesting session notifications...")
+    
+    from app import create_app
+    from app.hardware.notifier import SessionNotifier
+    
+    app, socketio = create_app()
+    lobby = socketio.test_client(app)
+    kiosk = socketio.test_client(app, query_string='terminal=kiosk-2')
+    notifier = SessionNotifier(socketio, coalesce_window=0.1)
+    
+    notifier.request_pin("kiosk-2", "2222")
+    for length in range(1, 7):
+        notifier.pin_updated("kiosk-2", length)
+    time.sleep(0.3)
+    
+    received = kiosk.get_received()
+    updates = [message['args'][0] for message in received if message['name'] == 'pin_updated']
+    assert lobby.get_received() == []
+    assert [message['name'] for message in received][0] == 'request_pin'
+    # Leading update at once, one trailing update carrying the latest length
+    assert updates == [{'terminal_id': 'kiosk-2', 'pin_length': 1}, {'terminal_id': 'kiosk-2', 'pin_length': 6}]
+    
+    # Switching terminals moves the client to the new room only
+    lobby.emit('join_terminal', {'terminal_id': 'kiosk-2'})
+    assert lobby.get_received()[0]['args'][0] == {'terminal_id': 'kiosk-2'}
+    notifier.session_ended("kiosk-2", "2222", "cancelled")
+    notifier.auth_result("default", "1111", True, "ok")
+    assert [message['name'] for message in lobby.get_received()] == ['session_ended']
+    
+    stats = notifier.stats()
+    notifier.stop()
+    lobby.disconnect()
+    kiosk.disconnect()
+    
+    print(f"Notification stats: {stats}")
+    assert stats['pin_updates_coalesced'] == 4
+    assert stats['by_event']['pin_updated'] == 2 and stats['fanout_max'] == 2
+    assert stats['clients_per_terminal'].get('kiosk-2') == 2
+
+def test_emit_bridge():
+    """Test that emits from hardware threads reach eventlet clients via the hub."""
+    print("\nTesting emit bridge...")
+    
+    import eventlet
+    from app import create_app
+    from app.hardware.notifier import SessionNotifier
+    
+    app, socketio = create_app('eventlet')
+    client = socketio.test_client(app)
+    notifier = SessionNotifier(socketio, coalesce_window=0)
+    
+    # Hardware callbacks run on native threads; the bridge queues their emits
+    keypad = threading.Thread(target=lambda: [notifier.pin_updated("default", n) for n in range(1, 4)])
+    keypad.start()
+    keypad.join()
+    assert client.get_received() == []
+    
+    received = []
+    deadline = time.time() + 2
+    while len(received) < 3 and time.time() < deadline:
+        eventlet.sleep(0.01)
+        received += client.get_received()
+    bridge = notifier.bridge
+    wake_r = bridge._wake_r
+    notifier.stop()
+    client.disconnect()
+    
+    # Both ends of the wake-up pipe are closed once the sender has stopped
+    deadline = time.time() + 2
+    while time.time() < deadline:
+        try:
+            os.fstat(wake_r)
+        except OSError:
+            break
+        eventlet.sleep(0.01)
+    assert bridge._wake_w is None
+    notifier.pin_updated("default", 4)  # A late emit is dropped, not written to a closed pipe
+    
+    print(f"Bridged {bridge.queued} emits")
+    assert [message['args'][0]['pin_length'] for message in received] == [1, 2, 3]
+    try:
+        os.fstat(wake_r)
+        assert False, "wake-up pipe still open"
+    except OSError:
+        pass
+
+def test_split_deployment():
+    """Test the broker, web-to-hardware requests and cross-process cache refresh."""
+    print("\nTesting split deployment...")
+    
+    import tempfile
+    import socketio as python_socketio
+    from app import create_app
+    from app.broker import Broker, BrokerClient, UnixSocketManager
+    from app.hardware.events import EventRing
+    from app.hardware.remote import HardwareAgent, RemoteCoordinator
+    from app.models.database import Database
+    
+    class HardwareStub:
+        """Coordinator methods the agent serves, without hardware."""
+        def __init__(self):
+            self.wakes = []
+            self.printer = self
+            self.spooler = self
+            self.events = EventRing(16)
+            self.event_listeners = []
+        def record_event(self, event_type, data):
+            event = self.events.append(event_type, data)
+            for listener in self.event_listeners:
+                listener(event)
+            return event
+        def events_since(self, seq):
+            return self.events.since(seq)
+        def wake(self):
+            self.wakes.append(True)
+        def get_session_stats(self):
+            return {'active': 0}
+        get_stats = list_sessions = get_rfid_stats = get_notification_stats = get_session_stats
+        def cancel_session(self, terminal_id):
+            return terminal_id == 'kiosk-1'
+        def get_metrics(self):
+            return [{'name': 'appliance_sessions_open', 'type': 'gauge', 'help': 'Open PIN-entry sessions',
+                     'samples': [['', {}, 1]]}]
+    
+    def wait_for(condition, timeout=2):
+        deadline = time.time() + timeout
+        while not condition() and time.time() < deadline:
+            time.sleep(0.01)
+        return condition()
+    
+    with tempfile.TemporaryDirectory() as tmp:
+        broker = Broker(os.path.join(tmp, 'broker.sock'))
+        broker.start()
+        
+        # Emits from the hardware process reach every subscriber
+        received = []
+        watcher = BrokerClient(broker.path)
+        threading.Thread(target=lambda: [received.append(m) for m in watcher.listen()], daemon=True).start()
+        assert wait_for(lambda: broker.stats()['clients'] == 1)
+        emitter = python_socketio.Server(async_mode='threading', client_manager=UnixSocketManager(broker.path, write_only=True))
+        emitter.emit('pin_updated', {'pin_length': 2}, to='terminal:default')
+        assert wait_for(lambda: received)
+        assert received[0]['room'] == 'terminal:default' and received[0]['data'] == {'pin_length': 2}
+        
+        hardware = HardwareStub()
+        hardware_db = Database(os.path.join(tmp, 'split.db'))
+        hardware_db.ensure_ready()
+        agent = HardwareAgent(hardware, database=hardware_db, path=broker.path)
+        agent.start()
+        assert wait_for(lambda: broker.stats()['clients'] == 3)
+        
+        app, socketio = create_app(client_manager=UnixSocketManager(broker.path))
+        remote = RemoteCoordinator(socketio)
+        assert remote.get_session_stats() == {'active': 0}
+        assert remote.cancel_session('kiosk-1') is True
+        assert remote.get_metrics()[0]['samples'] == [['', {}, 1]]
+        remote._print_queued()
+        assert wait_for(lambda: hardware.wakes)
+        
+        # Workers mirror the hardware process's event ring and add their withdrawals to it
+        hardware.record_event('auth', {'rfid_uid': '1111', 'success': True})
+        assert wait_for(lambda: remote.events.last_seq == hardware.events.last_seq)
+        remote.record_transaction('1234', 5.0, {
+            'success': True, 'balance': 95.0, 'message': 'Withdrawal successful',
+            'error': None, 'replayed': False, 'transaction_id': 42})
+        assert wait_for(lambda: remote.events.last_seq == hardware.events.last_seq)
+        assert [event['type'] for event in remote.recent_events()] == ['transaction', 'auth']
+        assert remote.events_since(hardware.events.last_seq - 1)['events'][0]['transaction_id'] == 'TXN42'
+        
+        # A PIN added by a web worker is picked up by the hardware process's cache
+        assert hardware_db.credentials.lookup('777') == (True, None)
+        web_db = Database(hardware_db.db_path)
+        web_db.credential_listeners.append(remote._credentials_changed)
+        web_db.add_user('777', '2468')
+        assert wait_for(lambda: hardware_db.credentials.lookup('777')[1] is not None)
+        assert hardware_db.authenticate_user('777', '2468')
+        
+        stats = broker.stats()
+        remote.shutdown()
+        socketio.server.manager.client.close()
+        agent.stop()
+        watcher.close()
+        broker.stop()
+        web_db.close()
+        hardware_db.close()
+    
+    print(f"Broker stats: {stats}")
+
+def test_lazy_startup():
+    """Test that the database opens on first use and readiness reaches systemd."""
+    print("\nTesting lazy startup...")
+    
+    import socket
+    import tempfile
+    from app.models.database import Database
+    from app.startup import LazyInit, StartupTimeline, sd_notify
+    
+    with tempfile.TemporaryDirectory() as tmp:
+        path = os.path.join(tmp, 'lazy.db')
+        test_db = Database(path)
+        assert not os.path.exists(path)
+        assert test_db.seed_user("card-a", "1234")
+        assert not test_db.seed_user("card-a", "9999")
+        assert test_db.authenticate_user("card-a", "1234")
+        test_db.close()
+        
+        # Threads arriving while the initializer runs wait for it; it runs once
+        calls = []
+        init = LazyInit(lambda: (calls.append(1), time.sleep(0.05)), 'slow init')
+        workers = [threading.Thread(target=init) for _ in range(4)]
+        for worker in workers:
+            worker.start()
+        for worker in workers:
+            worker.join()
+        assert calls == [1] and init.done
+        
+        notify_path = os.path.join(tmp, 'notify.sock')
+        systemd = socket.socket(socket.AF_UNIX, socket.SOCK_DGRAM)
+        systemd.bind(notify_path)
+        systemd.settimeout(2)
+        os.environ['NOTIFY_SOCKET'] = notify_path
+        try:
+            timeline = StartupTimeline()
+            with timeline.phase('create app'):
+                time.sleep(0.01)
+            timeline.ready()
+            assert systemd.recv(1024).startswith(b'READY=1\n')
+        finally:
+            del os.environ['NOTIFY_SOCKET']
+            systemd.close()
+        assert not sd_notify('READY=1')
+    
+    startup = timeline.as_dict()
+    print(f"Ready after {startup['ready_after_ms']} ms")
+    assert [phase['name'] for phase in startup['phases']] == ['create app']
+    assert startup['phases'][0]['duration_ms'] >= 10
+    assert startup['ready_after_ms'] >= startup['phases'][0]['start_ms']
+
+def test_static_assets():
+    """Test precompressed variants, immutable caching and ETag revalidation."""
+    print("\nTesting static assets...")
+    
+    import gzip
+    import tempfile
+    from flask import Flask
+    from app.api.assets import StaticAssets, precompress
+    
+    root = tempfile.mkdtemp()
+    os.makedirs(os.path.join(root, 'static', 'js'))
+    bundle = os.path.join('static', 'js', 'main.0123abcd.js')
+    with open(os.path.join(root, bundle), 'w') as f:
+        f.write("console.log('appliance');\n" * 200)
+    with open(os.path.join(root, 'index.html'), 'w') as f:
+        f.write('<html></html>')
+    written = precompress(root)
+    assert [(os.path.relpath(path, root), encoding) for path, encoding, _, _ in written] == [(bundle, 'gzip')]
+    
+    assets = StaticAssets(root, cache_bytes=64 * 1024)
+    app = Flask(__name__, static_folder=None)
+    app.add_url_rule('/<path:path>', view_func=lambda path: assets.response(path) or ('', 404))
+    client = app.test_client()
+    
+    zipped = client.get('/static/js/main.0123abcd.js', headers={'Accept-Encoding': 'gzip, deflate'})
+    assert zipped.headers['Content-Encoding'] == 'gzip'
+    assert 'immutable' in zipped.headers['Cache-Control']
+    assert gzip.decompress(zipped.data) == open(os.path.join(root, bundle), 'rb').read()
+    
+    plain = client.get('/static/js/main.0123abcd.js')
+    assert 'Content-Encoding' not in plain.headers
+    assert plain.headers['ETag'] != zipped.headers['ETag']
+    
+    # Revalidation of the unhashed entry point
+    index = client.get('/index.html')
+    assert index.headers['Cache-Control'] == 'no-cache'
+    again = client.get('/index.html', headers={'If-None-Match': index.headers['ETag']})
+    assert again.status_code == 304 and again.data == b''
+    assert client.get('/../test_system.py').status_code == 404
+    
+    stats = assets.stats()
+    print(f"Asset stats: {stats}")
+    assert stats['not_modified'] == 1 and stats['gzip'] == 1 and stats['cache_hits'] == 0
+    
+    # The shipped build connects WebSocket only, as the split deployment requires
+    shipped = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'app', 'static')
+    with open(os.path.join(shipped, 'asset-manifest.json')) as f:
+        main_js = json.load(f)['files']['main.js'].lstrip('/')
+    assert os.path.exists(os.path.join(shipped, main_js + '.gz'))
+    with open(os.path.join(shipped, main_js)) as f:
+        assert 'transports:["websocket"]' in f.read()
+
+def test_metrics():
+    """Test histogram buckets, the text format and the /api/metrics endpoint."""
+    print("\nTesting metrics...")
+    
+    from app import create_app
+    from app.metrics import MetricsRegistry, render, with_labels
+    
+    metrics = MetricsRegistry()
+    prints = metrics.counter('prints_total', 'Receipts printed', labels=('kind',))
+    latency = metrics.histogram('tap_seconds', 'Tap latency', buckets=(0.01, 0.1))
+    open_sessions = metrics.gauge('sessions_open', 'Open sessions')
+    assert metrics.counter('prints_total', 'Receipts printed', labels=('kind',)) is prints
+    
+    prints.labels('auth').inc()
+    prints.labels('auth').inc(2)
+    for value in (0.005, 0.01, 0.05, 3.0):
+        latency.observe(value)
+    open_sessions.set_function(lambda: 2)
+    
+    text = metrics.render()
+    print(text)
+    assert 'prints_total{kind="auth"} 3' in text
+    # Buckets are cumulative and a value equal to a bound falls into it
+    assert 'tap_seconds_bucket{le="0.01"} 2' in text
+    assert 'tap_seconds_bucket{le="0.1"} 3' in text
+    assert 'tap_seconds_bucket{le="+Inf"} 4' in text
+    assert 'tap_seconds_count 4' in text and 'sessions_open 2' in text
+    
+    # Families from two processes are written once, told apart by label
+    families = metrics.collect()
+    merged = render(with_labels(families, process='hardware') + with_labels(families, process='web-1'))
+    assert merged.count('# TYPE prints_total counter') == 1
+    assert 'prints_total{process="web-1",kind="auth"} 3' in merged
+    
+    app, socketio = create_app()
+    client = socketio.test_client(app)
+    client.emit('join_terminal', {'terminal_id': 'kiosk-2'})
+    response = app.test_client().get('/api/metrics')
+    client.disconnect()
+    assert response.status_code == 200 and response.content_type.startswith('text/plain; version=0.0.4')
+    assert 'appliance_socketio_handler_seconds_count{event="join_terminal"} ' in response.get_data(as_text=True)
+
+def test_user_import():
+    """Test bulk user import with per-row errors and the export round trip."""
+    print("\nTesting bulk user import...")
+    
+    import io
+    import tempfile
+    from app.models.database import Database
+    from app.models.provisioning import parse_csv, parse_ndjson
+    
+    with tempfile.TemporaryDirectory() as tmp:
+        test_db = Database(os.path.join(tmp, 'test.db'))
+        test_db.add_user("existing", "1111")
+        
+        body = b"rfid_uid,pin\nA1,1234\nA2,12\nA1,9999\nexisting,2222\n,1234\nA3,5678\n"
+        report = test_db.import_users(parse_csv(io.BytesIO(body))).to_dict()
+        print(f"Imported {report['imported']}, {report['conflicts']} conflicts, {report['invalid']} invalid")
+        assert (report['imported'], report['conflicts'], report['invalid']) == (2, 2, 2)
+        assert [error['line'] for error in report['errors']] == [3, 4, 5, 6]
+        assert test_db.authenticate_user("A3", "5678")
+        assert test_db.authenticate_user("existing", "1111")
+        
+        body = b'{"rfid_uid": "existing", "pin": "2222"}\n{"rfid_uid": "A4", "pin": 4321}\n'
+        report = test_db.import_users(parse_ndjson(io.BytesIO(body)), on_conflict='update')
+        assert (report.imported, report.updated) == (1, 1)
+        assert test_db.authenticate_user("existing", "2222")
+        
+        # Exported hashes are imported elsewhere as they are
+        exported = list(test_db.iter_users(include_hashes=True))
+        assert [user['rfid_uid'] for user in exported] == ['existing', 'A1', 'A3', 'A4']
+        other_db = Database(os.path.join(tmp, 'other.db'))
+        lines = '\n'.join(json.dumps({'rfid_uid': user['rfid_uid'], 'pin_hash': user['pin_hash']}) for user in exported)
+        lines += '\n{"rfid_uid": "bad", "pin_hash": "not-a-hash"}\n'
+        report = other_db.import_users(parse_ndjson(io.BytesIO(lines.encode())))
+        assert report.imported == 4 and report.errors[0]['error'] == 'Unsupported pin_hash format'
+        assert other_db.authenticate_user("A1", "1234")
+        
+        # Under eventlet or gevent, waits for the KDF poll with the hub's sleep
+        naps = []
+        other_db.hasher.sleep = lambda seconds: (naps.append(seconds), time.sleep(seconds))
+        assert other_db.add_user("green", "1234") and naps
+        del naps[:]
+        report = other_db.import_users(parse_csv(io.BytesIO(b"rfid_uid,pin\ngreen-2,1234\n")))
+        assert report.imported == 1 and naps
+        other_db.hasher.sleep = None
+        assert other_db.authenticate_user("green-2", "1234")
+        
+        other_db.close()
+        test_db.close()
+    
+    # A full KDF pool is a 503 with Retry-After, not a 500
+    from app import create_app
+    from app.models import database
+    from app.models.pinhash import PinHasher
+    app, socketio = create_app()
+    busy = PinHasher(workers=1, max_pending=1)
+    gate = threading.Event()
+    busy.submit(gate.wait, 5)
+    saved, database.db.hasher = database.db.hasher, busy
+    try:
+        response = app.test_client().post('/api/users', json={'rfid_uid': 'busy-card', 'pin': '1234'})
+    finally:
+        database.db.hasher = saved
+        gate.set()
+        busy.shutdown()
+    assert response.status_code == 503 and response.headers['Retry-After'] == '1'
+
+def test_transactions():
+    """Test transaction IDs, group-committed withdrawals and idempotency keys."""
+    print("\nTesting ledger transactions...")
+    
+    import tempfile
+    from app import create_app
+    from app.models.database import Database
+    from app.models.ids import IdGenerator
+    from app.models.ledger import Ledger
+    
+    # IDs keep increasing when the clock steps back, and slots never collide
+    clock = [1800000000.0]
+    ids = IdGenerator(slot=3, clock=lambda: clock[0])
+    first = ids.next_id()
+    clock[0] -= 5
+    assert ids.next_id() > first
+    other = IdGenerator(slot=4, clock=lambda: clock[0])
+    assert not {ids.next_id() for _ in range(1000)} & {other.next_id() for _ in range(1000)}
+    restarted = IdGenerator(slot=3, clock=lambda: clock[0] - 60)
+    restarted.advance_past(first)
+    assert restarted.next_id() > first
+    
+    with tempfile.TemporaryDirectory() as tmp:
+        test_db = Database(os.path.join(tmp, 'test.db'))
+        test_ledger = Ledger(test_db)
+        
+        # 8 threads x 25 withdrawals of 1.00 from 1250.75
+        threads = [
+            threading.Thread(target=lambda: [test_ledger.withdraw('1234', 1) for _ in range(25)])
+            for _ in range(8)
+        ]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+        rows = test_db.get_connection().execute('SELECT id FROM transactions').fetchall()
+        assert len({row['id'] for row in rows}) == 200
+        assert test_ledger.get_balance('1234') == 1050.75
+        
+        first = test_ledger.withdraw('1234', 10, idempotency_key='retry-1')
+        again = test_ledger.withdraw('1234', 10, idempotency_key='retry-1')
+        assert first['success'] and again['replayed']
+        assert again['transaction_id'] == first['transaction_id']
+        assert test_ledger.get_balance('1234') == 1040.75
+        assert test_ledger.withdraw('1234', 99, idempotency_key='retry-1')['error'] == 'idempotency_mismatch'
+        
+        # A process without the cached result finds it in the database
+        fresh = Ledger(test_db)
+        assert fresh.withdraw('1234', 10, idempotency_key='retry-1')['replayed']
+        
+        results = test_ledger.withdraw_many([('1234', 1, None), ('nope', 1, None), ('1234', 5000, None)])
+        assert [result['error'] for result in results] == [None, 'not_found', 'insufficient_funds']
+        
+        # Each write lock holder commits up to batch_size pending debits at once
+        batches = []
+        write_batch = test_ledger._write_batch
+        test_ledger._write_batch = lambda batch: batches.append(len(batch)) or write_batch(batch)
+        batch_size, test_ledger.batch_size = test_ledger.batch_size, 2
+        results = test_ledger.withdraw_many([('1234', 1, None)] * 5)
+        del test_ledger._write_batch
+        test_ledger.batch_size = batch_size
+        assert batches == [2, 2, 1]
+        assert [result['balance'] for result in results] == [1038.75, 1037.75, 1036.75, 1035.75, 1034.75]
+        
+        # The projection serves the balance the database holds
+        stored = test_db.get_connection().execute("SELECT balance_cents FROM accounts WHERE id = '1234'").fetchone()
+        assert test_ledger._accounts['1234']['balance_cents'] == stored['balance_cents'] == 103475
+        
+        # Concurrent debits never overdraw; in shared mode an account added
+        # after loading is found in the database, not the projection
+        shared = Ledger(test_db, shared=True)
+        shared.ensure_ready()
+        conn = test_db.get_connection()
+        conn.execute("INSERT INTO accounts (id, name, account_number, balance_cents) VALUES ('low', 'Low', '0001', 1000)")
+        conn.commit()
+        conn.close()
+        outcomes = []
+        threads = [
+            threading.Thread(target=lambda: outcomes.extend(shared.withdraw('low', 1)['success'] for _ in range(5)))
+            for _ in range(8)
+        ]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+        assert outcomes.count(True) == 10 and outcomes.count(False) == 30
+        assert shared.get_balance('low') == 0
+        assert 'low' not in shared._accounts
+        
+        # Split deployment: a worker reads balances another worker debited
+        import subprocess
+        reader = Ledger(test_db, shared=True)
+        before = reader.get_balance('1234')
+        worker = subprocess.run(
+            [sys.executable, '-c', "from app.models.ledger import ledger; print(ledger.withdraw('1234', 5)['balance'])"],
+            cwd=os.path.dirname(os.path.abspath(__file__)), capture_output=True, text=True, timeout=60,
+            env=dict(os.environ, PROCESS_ROLE='web', DATABASE_PATH=test_db.db_path)
+        )
+        assert worker.returncode == 0, worker.stderr
+        assert float(worker.stdout.split()[-1]) == before - 5
+        assert reader.get_balance('1234') == reader.get_account('1234')['balance'] == before - 5
+        test_db.close()
+    
+    app, socketio = create_app()
+    client = app.test_client()
+    headers = {'Idempotency-Key': 'test-transactions-1'}
+    response = client.post('/api/transaction', json={'account_id': '1234', 'amount': 1}, headers=headers)
+    replay = client.post('/api/transaction', json={'account_id': '1234', 'amount': 1}, headers=headers)
+    assert response.status_code == 200 and replay.status_code == 200
+    assert replay.headers['Idempotent-Replayed'] == 'true'
+    assert replay.get_json()['transaction_id'] == response.get_json()['transaction_id']
+    
+    batch = {'transactions': [{'account_id': '1234', 'amount': 1}, {'account_id': '1234'}, {'account_id': '1234', 'amount': 1}]}
+    response = client.post('/api/transactions/batch', json=batch, headers={'Idempotency-Key': 'test-batch-1'})
+    body = response.get_json()
+    print(f"Batch: {body['succeeded']} succeeded, {body['failed']} failed")
+    assert [result['code'] for result in body['results']] == [200, 400, 200]
+    retried = client.post('/api/transactions/batch', json=batch, headers={'Idempotency-Key': 'test-batch-1'}).get_json()
+    assert retried['results'][2]['replayed'] and retried['results'][2]['transaction_id'] == body['results'][2]['transaction_id']
+    
+    # The Socket.IO withdraw rejects what the REST route rejects, with a reply
+    sio_client = socketio.test_client(app)
+    for payload in ({'amount': 'nan'}, {'amount': 'inf'}, {'amount': 'twenty'}, {'amount': [1]},
+                    {'amount': 1, 'idempotency_key': 'k' * 300}, {'amount': 1, 'idempotency_key': ''}):
+        sio_client.emit('withdraw', dict(payload, account_id='1234'))
+        reply = [msg for msg in sio_client.get_received() if msg['name'] == 'transaction_result']
+        assert len(reply) == 1 and not reply[0]['args'][0]['success'], payload
+    
+    # An unavailable ledger has no balance to put on a receipt
+    from app.hardware.coordinator import get_coordinator
+    from app.models import ledger as ledger_module
+    printer = get_coordinator(socketio).printer
+    receipts = []
+    printer.print_transaction_receipt = lambda *args: receipts.append(args)
+    ledger_module.ledger.withdraw = lambda *args: ledger_module._failure('unavailable', 'Ledger unavailable')
+    try:
+        sio_client.emit('withdraw', {'account_id': '1234', 'amount': 1})
+        reply = [msg for msg in sio_client.get_received() if msg['name'] == 'transaction_result']
+    finally:
+        del ledger_module.ledger.withdraw
+        del printer.print_transaction_receipt
+    assert reply[0]['args'][0]['message'] == 'Ledger unavailable' and receipts == []
+    sio_client.disconnect()
+
+def test_event_ring():
+    """Test the recent-events ring, resuming by sequence number and the live tail."""
+    print("\nTesting event ring...")
+    
+    from types import SimpleNamespace
+    from app import create_app
+    from app.hardware import coordinator as coordinator_module
+    from app.hardware.events import EventRing
+    
+    ring = EventRing(3)
+    first = ring.append('auth', {'rfid_uid': '1111', 'success': True})
+    for uid in ('2222', '3333', '4444', '5555'):
+        ring.append('auth', {'rfid_uid': uid, 'success': False})
+    assert [event['rfid_uid'] for event in ring.recent(2)] == ['5555', '4444']
+    resumed = ring.since(ring.last_seq - 1)
+    assert [event['rfid_uid'] for event in resumed['events']] == ['5555'] and not resumed['missed']
+    # The events after first were dropped, and a number from the future is not trusted
+    assert ring.since(first['seq'])['missed'] and len(ring.since(first['seq'])['events']) == 3
+    assert ring.since(ring.last_seq + 10)['missed']
+    assert not ring.wait(ring.last_seq, timeout=0.05)
+    threading.Timer(0.05, ring.append, ('transaction', {'account_id': '1234'})).start()
+    assert ring.wait(ring.last_seq, timeout=2, sleep=time.sleep, poll_interval=0.01)
+    
+    # A mirror merges a backfill with events that arrived live
+    mirror = EventRing(3, start=0)
+    mirror.extend(ring.recent(1))
+    mirror.extend(ring.since(0)['events'])
+    assert [event['seq'] for event in mirror.recent(10)] == [event['seq'] for event in ring.recent(10)]
+    
+    app, socketio = create_app()
+    # Routes use the process-wide coordinator; bind a fresh one to this app
+    if coordinator_module._auth_coordinator is not None:
+        coordinator_module._auth_coordinator.shutdown()
+    coordinator_module._auth_coordinator = None
+    coordinator = coordinator_module.get_coordinator(socketio)
+    try:
+        tail = socketio.test_client(app)
+        tail.emit('log_tail', {'limit': 5})
+        assert tail.get_received()[-1]['name'] == 'log_tail_backlog'
+        
+        coordinator._notify_result(SimpleNamespace(
+            terminal_id='kiosk-1', rfid_uid='1234567890', success=False,
+            message='Invalid PIN', submitted_at=time.perf_counter()))
+        client = app.test_client()
+        client.post('/api/transaction', json={'account_id': '1234', 'amount': 1})
+        client.post('/api/transaction', json={'account_id': 'missing', 'amount': 1})
+        
+        deadline = time.time() + 2
+        live = []
+        while len(live) < 4 and time.time() < deadline:
+            live += [message['args'][0] for message in tail.get_received() if message['name'] == 'log_event']
+            time.sleep(0.01)
+        assert [event['type'] for event in live] == ['auth', 'transaction']
+        
+        recent = client.get('/api/logs/recent?type=transaction&limit=1').get_json()
+        assert recent['events'][0]['seq'] == live[1]['seq'] and recent['events'][0]['account_id'] == '1234'
+        
+        # A reconnecting client gets only what it missed
+        again = socketio.test_client(app)
+        again.emit('log_tail', {'since': live[0]['seq']})
+        backlog = again.get_received()[-1]['args'][0]
+        assert [event['seq'] for event in backlog['events']] == [live[1]['seq']] and not backlog['missed']
+        
+        stream = client.get('/api/logs/tail', headers={'Last-Event-ID': str(live[0]['seq'])}, buffered=False)
+        assert stream.content_type.startswith('text/event-stream')
+        message = next(iter(stream.response))
+        stream.close()
+        message = message.decode() if isinstance(message, bytes) else message
+        assert message.startswith(f"id: {live[1]['seq']}\nevent: transaction\n")
+        
+        tail.disconnect()
+        again.disconnect()
+    finally:
+        coordinator.shutdown()
+        coordinator_module._auth_coordinator = None
+    
+    print(f"Ring stats: {coordinator.events.stats()}")
+
 def test_hardware_modules():
     """Test the hardware modules."""
     print("\nTesting hardware modules...")
@@ -72,6 +1243,26 @@ def main():
     print("=" * 50)
     
     test_database()
+    test_connection_pool()
+    test_audit_writer()
+    test_log_rollups()
+    test_log_queries()
+    test_credential_cache()
+    test_print_spooler()
+    test_receipt_templates()
+    test_sim_backend()
+    test_keypad_debounce()
+    test_auth_pipeline()
+    test_auth_sessions()
+    test_session_notifications()
+    test_emit_bridge()
+    test_split_deployment()
+    test_static_assets()
+    test_lazy_startup()
+    test_metrics()
+    test_transactions()
+    test_user_import()
+    test_event_ring()
     test_hardware_modules()
     test_api_endpoints()
     
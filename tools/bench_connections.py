@@ -0,0 +1,323 @@
+"""
+Socket.IO connection scaling benchmark
+
+Usage:
+  python tools/bench_connections.py [--modes threading eventlet gevent] [--clients 10 100 1000]
+
+Starts the web app (no hardware) in a child process for each async mode and
+connects growing numbers of WebSocket clients to the default terminal room.
+At each step it reports the server's resident memory and thread count per
+connected client, the echo round-trip time of every client, and the time for
+a room-wide emit to reach the clients (median and last client).
+
+Clients are raw Engine.IO v4 WebSocket connections driven from one thread in
+this process, so the broadcast times include parsing on the client side.
+Modes whose package is not installed are skipped.
+"""
+import argparse
+import base64
+import json
+import os
+import selectors
+import socket
+import struct
+import subprocess
+import sys
+import tempfile
+import time
+
+# allow running from repo root
+sys.path.append(os.path.dirname(os.path.dirname(__file__)))
+
+
+# =========================
+# SERVER (child process)
+# =========================
+def serve(mode, port):
+    if mode == 'eventlet':
+        import eventlet
+        eventlet.monkey_patch(thread=False)
+    elif mode == 'gevent':
+        from gevent import monkey
+        monkey.patch_all(thread=False)
+
+    import logging
+    from flask import request
+    from flask_socketio import emit
+    from app import create_app
+    from app.hardware.coordinator import DEFAULT_TERMINAL
+    from app.hardware.notifier import terminal_room
+
+    logging.getLogger('werkzeug').setLevel(logging.ERROR)
+    app, socketio = create_app(mode)
+
+    @socketio.on('bench_echo')
+    def handle_echo(data):
+        emit('bench_echo', data, room=request.sid)
+
+    @socketio.on('bench_broadcast')
+    def handle_broadcast(data):
+        socketio.emit('bench_tick', data, to=terminal_room(DEFAULT_TERMINAL))
+
+    socketio.run(app, host='127.0.0.1', port=port, debug=False, use_reloader=False,
+                 log_output=False, allow_unsafe_werkzeug=True)
+
+
+def process_status(pid):
+    """(resident memory in bytes, thread count) of a process."""
+    rss = threads = 0
+    with open(f'/proc/{pid}/status') as status:
+        for line in status:
+            if line.startswith('VmRSS:'):
+                rss = int(line.split()[1]) * 1024
+            elif line.startswith('Threads:'):
+                threads = int(line.split()[1])
+    return rss, threads
+
+
+# =========================
+# CLIENT
+# =========================
+class SocketIOClient:
+    """Minimal Socket.IO client over a raw WebSocket (text frames only)."""
+
+    def __init__(self, port):
+        self.sock = socket.create_connection(('127.0.0.1', port), timeout=10)
+        key = base64.b64encode(os.urandom(16)).decode()
+        self.sock.sendall((
+            'GET /socket.io/?EIO=4&transport=websocket HTTP/1.1\r\n'
+            f'Host: 127.0.0.1:{port}\r\n'
+            'Upgrade: websocket\r\nConnection: Upgrade\r\n'
+            f'Sec-WebSocket-Key: {key}\r\nSec-WebSocket-Version: 13\r\n\r\n'
+        ).encode())
+        self.buffer = b''
+        while b'\r\n\r\n' not in self.buffer:
+            chunk = self.sock.recv(4096)
+            if not chunk:
+                raise ConnectionError('server closed during handshake')
+            self.buffer += chunk
+        head, self.buffer = self.buffer.split(b'\r\n\r\n', 1)
+        if b' 101 ' not in head.split(b'\r\n', 1)[0]:
+            raise ConnectionError(head.split(b'\r\n', 1)[0].decode())
+        self.wait_for(lambda packet: packet.startswith('0'))
+        self.send('40')
+        self.wait_for(lambda packet: packet.startswith('40'))
+
+    def send(self, text):
+        payload = text.encode()
+        mask = os.urandom(4)
+        length = len(payload)
+        if length < 126:
+            header = struct.pack('!BB', 0x81, 0x80 | length)
+        elif length < 65536:
+            header = struct.pack('!BBH', 0x81, 0x80 | 126, length)
+        else:
+            header = struct.pack('!BBQ', 0x81, 0x80 | 127, length)
+        masked = bytes(b ^ mask[i % 4] for i, b in enumerate(payload))
+        self.sock.sendall(header + mask + masked)
+
+    def emit(self, event, data):
+        self.send('42' + json.dumps([event, data]))
+
+    def feed(self, data):
+        """Add received bytes; returns complete Engine.IO packets."""
+        self.buffer += data
+        packets = []
+        while len(self.buffer) >= 2:
+            opcode = self.buffer[0] & 0x0F
+            length = self.buffer[1] & 0x7F
+            offset = 2
+            if length == 126:
+                if len(self.buffer) < 4:
+                    break
+                length = struct.unpack('!H', self.buffer[2:4])[0]
+                offset = 4
+            elif length == 127:
+                if len(self.buffer) < 10:
+                    break
+                length = struct.unpack('!Q', self.buffer[2:10])[0]
+                offset = 10
+            if len(self.buffer) < offset + length:
+                break
+            payload = self.buffer[offset:offset + length]
+            self.buffer = self.buffer[offset + length:]
+            if opcode != 1:
+                continue
+            packet = payload.decode()
+            if packet == '2':  # Engine.IO ping
+                self.send('3')
+                continue
+            packets.append(packet)
+        return packets
+
+    def wait_for(self, predicate, timeout=10):
+        deadline = time.monotonic() + timeout
+        pending = self.feed(b'')
+        while True:
+            for packet in pending:
+                if predicate(packet):
+                    return packet
+            self.sock.settimeout(max(0.001, deadline - time.monotonic()))
+            chunk = self.sock.recv(65536)
+            if not chunk:
+                raise ConnectionError('server closed the connection')
+            pending = self.feed(chunk)
+
+    def close(self):
+        self.sock.close()
+
+
+def event_of(packet):
+    if not packet.startswith('42'):
+        return None, None
+    name, data = json.loads(packet[2:])
+    return name, data
+
+
+def percentile(values, fraction):
+    values = sorted(values)
+    return values[min(len(values) - 1, int(len(values) * fraction))]
+
+
+def measure_echo(clients):
+    latencies = []
+    for i, client in enumerate(clients):
+        started = time.perf_counter()
+        client.emit('bench_echo', {'seq': i})
+        client.wait_for(lambda packet: event_of(packet)[0] == 'bench_echo')
+        latencies.append(time.perf_counter() - started)
+    return latencies
+
+
+def measure_broadcast(clients, rounds):
+    """Seconds from the trigger until each client received the room emit."""
+    selector = selectors.DefaultSelector()
+    for client in clients:
+        client.sock.setblocking(False)
+        selector.register(client.sock, selectors.EVENT_READ, client)
+
+    arrivals = []
+    try:
+        for round_no in range(rounds):
+            waiting = set(clients)
+            started = time.perf_counter()
+            clients[0].sock.setblocking(True)
+            clients[0].emit('bench_broadcast', {'round': round_no})
+            clients[0].sock.setblocking(False)
+            deadline = time.monotonic() + 30
+            while waiting and time.monotonic() < deadline:
+                for key, _ in selector.select(timeout=1):
+                    client = key.data
+                    try:
+                        chunk = client.sock.recv(65536)
+                    except BlockingIOError:
+                        continue
+                    for packet in client.feed(chunk):
+                        name, data = event_of(packet)
+                        if name == 'bench_tick' and data['round'] == round_no and client in waiting:
+                            waiting.discard(client)
+                            arrivals.append(time.perf_counter() - started)
+            if waiting:
+                print(f"  {len(waiting)} clients missed broadcast {round_no}")
+    finally:
+        for client in clients:
+            selector.unregister(client.sock)
+            client.sock.setblocking(True)
+    return arrivals
+
+
+def run_mode(mode, steps, rounds):
+    port = free_port()
+    env = dict(os.environ)
+    env['DATABASE_PATH'] = os.path.join(tempfile.mkdtemp(), 'bench.db')
+    server = subprocess.Popen(
+        [sys.executable, __file__, '--serve', mode, '--port', str(port)],
+        env=env, stdout=subprocess.DEVNULL, stderr=subprocess.PIPE
+    )
+    clients = []
+    try:
+        wait_for_port(port, server)
+        time.sleep(0.5)
+        base_rss, base_threads = process_status(server.pid)
+        print(f"\n{mode}: idle server {base_rss / 2**20:.1f} MiB, {base_threads} threads")
+        print(f"  {'clients':>7} {'MiB':>7} {'KiB/client':>10} {'threads':>7} "
+              f"{'echo p50':>9} {'echo p99':>9} {'emit p50':>9} {'emit last':>9}")
+
+        for target in steps:
+            started = time.perf_counter()
+            while len(clients) < target:
+                clients.append(SocketIOClient(port))
+            connect_time = time.perf_counter() - started
+            time.sleep(0.5)
+            rss, threads = process_status(server.pid)
+            echo = measure_echo(clients)
+            arrivals = measure_broadcast(clients, rounds)
+            per_client = (rss - base_rss) / len(clients) / 1024
+            print(f"  {len(clients):>7} {rss / 2**20:>7.1f} {per_client:>10.1f} {threads:>7} "
+                  f"{percentile(echo, 0.5) * 1000:>7.2f}ms {percentile(echo, 0.99) * 1000:>7.2f}ms "
+                  f"{percentile(arrivals, 0.5) * 1000:>7.2f}ms {max(arrivals) * 1000:>7.2f}ms"
+                  f"  (connected in {connect_time:.2f}s)")
+    finally:
+        for client in clients:
+            client.close()
+        server.terminate()
+        try:
+            _, stderr = server.communicate(timeout=10)
+        except subprocess.TimeoutExpired:
+            server.kill()
+            _, stderr = server.communicate()
+        if server.returncode not in (0, -15) and stderr:
+            print(stderr.decode(errors='replace')[-2000:])
+
+
+def free_port():
+    with socket.socket() as sock:
+        sock.bind(('127.0.0.1', 0))
+        return sock.getsockname()[1]
+
+
+def wait_for_port(port, server, timeout=30):
+    deadline = time.monotonic() + timeout
+    while time.monotonic() < deadline:
+        if server.poll() is not None:
+            raise RuntimeError(server.stderr.read().decode(errors='replace'))
+        try:
+            socket.create_connection(('127.0.0.1', port), timeout=1).close()
+            return
+        except OSError:
+            time.sleep(0.1)
+    raise RuntimeError(f'server did not listen on port {port}')
+
+
+def installed(mode):
+    if mode == 'threading':
+        return True
+    try:
+        __import__(mode)
+        return True
+    except ImportError:
+        return False
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('--modes', nargs='+', default=['threading', 'eventlet', 'gevent'])
+    parser.add_argument('--clients', nargs='+', type=int, default=[10, 100, 1000], help='client counts, ascending')
+    parser.add_argument('--rounds', type=int, default=5, help='room-wide emits per step')
+    parser.add_argument('--serve', help=argparse.SUPPRESS)
+    parser.add_argument('--port', type=int, help=argparse.SUPPRESS)
+    args = parser.parse_args()
+
+    if args.serve:
+        serve(args.serve, args.port)
+        return
+
+    for mode in args.modes:
+        if not installed(mode):
+            print(f"\n{mode}: not installed, skipped")
+            continue
+        run_mode(mode, sorted(args.clients), args.rounds)
+
+
+if __name__ == '__main__':
+    main()
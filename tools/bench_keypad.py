@@ -0,0 +1,100 @@
+"""
+Keypad scanning benchmark
+
+Usage:
+  python tools/bench_keypad.py [--presses 20] [--idle 2.0] [--bounce-ms 3]
+
+Runs the real Keypad class against the simulated GPIO matrix of the sim
+hardware backend (row drive, column pull-downs, rising-edge callbacks and
+contact bounce) in both KEYPAD_SCAN_MODE settings. Reports CPU used while
+idle, press-to-callback latency and whether every press was reported
+exactly once. Runs on any machine; no GPIO hardware needed.
+"""
+import argparse
+import os
+import random
+import statistics
+import sys
+import threading
+import time
+
+# allow running from repo root
+sys.path.append(os.path.dirname(os.path.dirname(__file__)))
+
+
+class Recorder:
+    """Stands in for the AuthCoordinator and timestamps every key."""
+
+    def __init__(self):
+        self.keys = []
+        self.event = threading.Event()
+
+    def handle_key_press(self, key):
+        self.keys.append((key, time.perf_counter()))
+        self.event.set()
+
+
+def run_mode(mode, args):
+    from app.config import Config
+    from app.hardware.backends.sim import SimBackend
+    from app.hardware.keypad import Keypad
+
+    Config.KEYPAD_SCAN_MODE = mode
+    backend = SimBackend()
+    recorder = Recorder()
+    keypad = Keypad(recorder, backend=backend)
+    keypad._handle_key_press = recorder.handle_key_press  # keep prints out of the timing
+    keypad.start()
+
+    # Idle CPU: nothing pressed
+    time.sleep(0.2)
+    cpu_start, wall_start = time.process_time(), time.perf_counter()
+    time.sleep(args.idle)
+    idle_cpu = (time.process_time() - cpu_start) / (time.perf_counter() - wall_start)
+
+    rng = random.Random(1)
+    latencies = []
+    expected = []
+    for _ in range(args.presses):
+        key = rng.choice([key for row in keypad.key_map for key in row])
+        expected.append(key)
+        recorder.event.clear()
+        count = len(recorder.keys)
+        started = time.perf_counter()
+        backend.press_key(key, hold=args.hold_ms / 1000, bounce=args.bounce_ms / 1000)
+        recorder.event.wait(1.0)
+        # Let the release debounce before the next press
+        time.sleep(0.05)
+        if len(recorder.keys) > count:
+            latencies.append((recorder.keys[count][1] - started) * 1000)
+
+    keypad.stop()
+    keys = [key for key, _ in recorder.keys]
+    return {
+        'mode': keypad.mode,
+        'idle_cpu_pct': idle_cpu * 100,
+        'latency_ms': latencies,
+        'correct': keys == expected
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('--presses', type=int, default=20, help='key presses per mode')
+    parser.add_argument('--idle', type=float, default=2.0, help='seconds of idle time to measure CPU over')
+    parser.add_argument('--bounce-ms', type=float, default=3.0, help='contact bounce on each edge')
+    parser.add_argument('--hold-ms', type=float, default=80.0, help='how long each key is held')
+    args = parser.parse_args()
+
+    print(f"{'mode':<10} {'idle CPU':>9} {'p50 ms':>8} {'max ms':>8}  presses")
+    for mode in ('poll', 'interrupt'):
+        result = run_mode(mode, args)
+        latencies = result['latency_ms'] or [float('nan')]
+        status = 'ok' if result['correct'] else 'MISMATCH'
+        print(f"{result['mode']:<10} {result['idle_cpu_pct']:>8.2f}% "
+              f"{statistics.median(latencies):>8.1f} {max(latencies):>8.1f}  "
+              f"{len(result['latency_ms'])}/{args.presses} {status}")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,100 @@
+"""
+Ledger withdrawal benchmark
+
+Usage:
+  python tools/bench_ledger.py [--clients 8] [--withdrawals 200] [--batch 50]
+
+Connects several Socket.IO test clients to the real app and has each one
+send `withdraw` events concurrently against the same account. With
+--batch N the clients instead POST /api/transactions/batch requests of N
+withdrawals each, which the ledger commits in one transaction. Reports
+withdrawals per second and checks that the final balance matches the
+number of successful debits. Runs against a throwaway database.
+"""
+import argparse
+import contextlib
+import io
+import os
+import sys
+import tempfile
+import threading
+import time
+
+# allow running from repo root
+sys.path.append(os.path.dirname(os.path.dirname(__file__)))
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('--clients', type=int, default=8, help='concurrent Socket.IO clients')
+    parser.add_argument('--withdrawals', type=int, default=200, help='withdrawals per client')
+    parser.add_argument('--amount', type=float, default=0.01, help='amount per withdrawal')
+    parser.add_argument('--batch', type=int, default=0,
+                        help='withdrawals per /api/transactions/batch request (0 sends Socket.IO events)')
+    args = parser.parse_args()
+
+    tmp = tempfile.mkdtemp()
+    os.environ['DATABASE_PATH'] = os.path.join(tmp, 'bench.db')
+
+    from app import create_app
+    from app.models.ledger import ledger
+
+    app, socketio = create_app()
+    account_id = '1234'
+    start_balance = ledger.get_balance(account_id)
+    clients = [socketio.test_client(app) for _ in range(args.clients)]
+    successes = [0] * args.clients
+    barrier = threading.Barrier(args.clients + 1)
+
+    def run_batches(index):
+        client = app.test_client()
+        barrier.wait()
+        remaining = args.withdrawals
+        while remaining > 0:
+            size = min(args.batch, remaining)
+            items = [{'account_id': account_id, 'amount': args.amount}] * size
+            response = client.post('/api/transactions/batch', json={'transactions': items})
+            successes[index] += response.get_json()['succeeded']
+            remaining -= size
+
+    def run(index):
+        if args.batch > 0:
+            return run_batches(index)
+        client = clients[index]
+        barrier.wait()
+        for _ in range(args.withdrawals):
+            client.emit('withdraw', {'account_id': account_id, 'amount': args.amount})
+            for message in client.get_received():
+                if message['name'] == 'transaction_result' and message['args'][0]['success']:
+                    successes[index] += 1
+
+    threads = [threading.Thread(target=run, args=(i,)) for i in range(args.clients)]
+    for thread in threads:
+        thread.start()
+
+    # Receipts are printed to the console; keep them out of the report
+    with contextlib.redirect_stdout(io.StringIO()):
+        barrier.wait()
+        start = time.perf_counter()
+        for thread in threads:
+            thread.join()
+        elapsed = time.perf_counter() - start
+
+    total = args.clients * args.withdrawals
+    debited = sum(successes)
+    expected = round(start_balance - debited * args.amount, 2)
+    final = ledger.get_balance(account_id)
+
+    print(f"Clients:            {args.clients}")
+    print(f"Withdrawals:        {total} ({debited} succeeded)")
+    print(f"Elapsed:            {elapsed:.3f} s")
+    print(f"Withdrawals/second: {total / elapsed:.1f}")
+    print(f"Final balance:      {final:.2f} (expected {expected:.2f})")
+
+    if abs(final - expected) > 0.005:
+        print("ERROR: balance does not match successful withdrawals")
+        sys.exit(1)
+
+
+if __name__ == '__main__':
+    main()
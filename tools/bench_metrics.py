@@ -0,0 +1,90 @@
+"""
+Metrics overhead benchmark
+
+Usage:
+  python tools/bench_metrics.py [--ops 200000] [--threads 1,4] [--series 50]
+
+Measures what recording a metric costs the thread doing it: nanoseconds
+per Counter.inc, Histogram.observe, labelled observe (child kept and
+looked up per call) and Histogram.time(), each minus the cost of an empty
+loop. With several threads the same child is hit concurrently, which is
+the worst case for its lock. Also times rendering /api/metrics with
+--series histogram series, the cost paid per scrape.
+"""
+import argparse
+import os
+import sys
+import threading
+import time
+
+# allow running from repo root
+sys.path.append(os.path.dirname(os.path.dirname(__file__)))
+
+from app.metrics import MetricsRegistry
+
+
+def per_op_ns(operation, ops, threads):
+    """Wall time per call of operation() with `threads` threads sharing the work."""
+    share = ops // threads
+    barrier = threading.Barrier(threads + 1)
+
+    def work():
+        barrier.wait()
+        for _ in range(share):
+            operation()
+
+    workers = [threading.Thread(target=work) for _ in range(threads)]
+    for worker in workers:
+        worker.start()
+    barrier.wait()
+    started = time.perf_counter()
+    for worker in workers:
+        worker.join()
+    return (time.perf_counter() - started) * 1e9 / (share * threads)
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('--ops', type=int, default=200000, help='calls per measurement')
+    parser.add_argument('--threads', default='1,4', help='comma-separated thread counts')
+    parser.add_argument('--series', type=int, default=50, help='histogram series for the render timing')
+    args = parser.parse_args()
+
+    metrics = MetricsRegistry()
+    counter = metrics.counter('bench_total', 'Benchmark counter')
+    histogram = metrics.histogram('bench_seconds', 'Benchmark histogram')
+    labelled = metrics.histogram('bench_labelled_seconds', 'Benchmark histogram', labels=('event',))
+    child = labelled.labels('withdraw')
+
+    def timed():
+        with histogram.time():
+            pass
+
+    operations = [
+        ('Counter.inc()', counter.inc),
+        ('Histogram.observe()', lambda: histogram.observe(0.003)),
+        ('labelled child .observe()', lambda: child.observe(0.003)),
+        ('.labels(event).observe()', lambda: labelled.labels('withdraw').observe(0.003)),
+        ('Histogram.time() block', timed)
+    ]
+    for threads in [int(count) for count in args.threads.split(',')]:
+        print(f"\n{threads} thread(s), {args.ops} calls each measurement")
+        empty = per_op_ns(lambda: None, args.ops, threads)
+        print(f"  {'empty call (subtracted)':28} {empty:8.1f} ns")
+        for name, operation in operations:
+            cost = per_op_ns(operation, args.ops, threads) - empty
+            print(f"  {name:28} {cost:8.1f} ns")
+
+    for index in range(args.series):
+        labelled.labels(f'event-{index}').observe(index / 1000)
+    started = time.perf_counter()
+    rounds = 20
+    for _ in range(rounds):
+        text = metrics.render()
+    elapsed = (time.perf_counter() - started) / rounds
+    print(f"\nRender: {elapsed * 1000:.2f} ms for {args.series + 2} series "
+          f"({len(text.splitlines())} lines, {len(text)} bytes)")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,109 @@
+"""
+Bulk user import benchmark
+
+Usage:
+  python tools/bench_provisioning.py [--cards 100000] [--workers 1,3]
+                                     [--kdf-iterations 1000] [--single 500] [--api]
+
+Imports --cards generated cards (streamed CSV) into a throwaway database
+once per hash worker count with Database.import_users, the code behind
+POST /api/users/import, and reports cards per second. The same file is
+then imported again (every row a conflict) and exported, and --single
+cards are added one at a time with Database.add_user, the path
+POST /api/users takes. --api also sends the file through the endpoint.
+
+The KDF runs with --kdf-iterations so the database side shows. At
+production cost hashing dominates: one hash is timed at
+PIN_KDF_ITERATIONS and the import time is estimated from it.
+"""
+import argparse
+import io
+import os
+import sys
+import tempfile
+import time
+
+# allow running from repo root
+sys.path.append(os.path.dirname(os.path.dirname(__file__)))
+
+
+def generate_csv(cards, prefix='card'):
+    lines = ['rfid_uid,pin']
+    lines.extend(f'{prefix}{index},{index % 10000:04d}' for index in range(cards))
+    return ('\n'.join(lines) + '\n').encode()
+
+
+def timed(function):
+    started = time.perf_counter()
+    result = function()
+    return result, time.perf_counter() - started
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('--cards', type=int, default=100000, help='cards per import')
+    parser.add_argument('--workers', default='1,3', help='comma-separated hash worker counts')
+    parser.add_argument('--kdf-iterations', type=int, default=1000, help='PBKDF2 iterations during the benchmark')
+    parser.add_argument('--chunk-size', type=int, default=500, help='rows per insert transaction')
+    parser.add_argument('--single', type=int, default=500, help='cards added one by one for comparison (0 skips)')
+    parser.add_argument('--api', action='store_true', help='also import through POST /api/users/import')
+    args = parser.parse_args()
+
+    tmp = tempfile.mkdtemp()
+    os.environ['DATABASE_PATH'] = os.path.join(tmp, 'api.db')
+    production_iterations = int(os.environ.get('PIN_KDF_ITERATIONS', 100000))
+    os.environ['PIN_KDF_ITERATIONS'] = str(args.kdf_iterations)
+
+    from app.models.database import Database
+    from app.models.pinhash import PinHasher
+    from app.models.provisioning import UserProvisioning, parse_csv
+
+    body = generate_csv(args.cards)
+    print(f"{args.cards} cards, {len(body) / 1e6:.1f} MB of CSV, PBKDF2 at {args.kdf_iterations} iterations, "
+          f"{os.cpu_count()} CPU(s)\n")
+
+    best = None
+    for workers in [int(count) for count in args.workers.split(',')]:
+        database = Database(os.path.join(tmp, f'import-{workers}.db'))
+        database.ensure_ready()
+        database.provisioning = UserProvisioning(database, hash_workers=workers, chunk_size=args.chunk_size)
+
+        report, elapsed = timed(lambda: database.import_users(parse_csv(io.BytesIO(body))))
+        assert report.imported == args.cards, report.to_dict()
+        print(f"  import, {workers} hash worker(s):  {elapsed:7.2f} s  {args.cards / elapsed:9.0f} cards/s")
+        best = elapsed if best is None else min(best, elapsed)
+
+        report, elapsed = timed(lambda: database.import_users(parse_csv(io.BytesIO(body))))
+        assert report.conflicts == args.cards
+        print(f"  re-import (all conflicts):     {elapsed:7.2f} s  {args.cards / elapsed:9.0f} rows/s")
+
+        exported, elapsed = timed(lambda: sum(1 for _ in database.iter_users(include_hashes=True)))
+        assert exported == args.cards
+        print(f"  export with hashes:            {elapsed:7.2f} s  {exported / elapsed:9.0f} cards/s")
+        database.close()
+
+    if args.single:
+        database = Database(os.path.join(tmp, 'single.db'))
+        database.ensure_ready()
+        _, elapsed = timed(lambda: [database.add_user(f'single{index}', '1234') for index in range(args.single)])
+        print(f"\n  add_user one by one ({args.single}):     {elapsed:7.2f} s  {args.single / elapsed:9.0f} cards/s")
+        database.close()
+
+    if args.api:
+        from app import create_app
+        app, _ = create_app()
+        response, elapsed = timed(lambda: app.test_client().post(
+            '/api/users/import', data=io.BytesIO(body), content_type='text/csv'))
+        print(f"\n  POST /api/users/import:        {elapsed:7.2f} s  {args.cards / elapsed:9.0f} cards/s "
+              f"({response.get_json()['imported']} imported)")
+
+    hasher = PinHasher(iterations=production_iterations)
+    _, per_hash = timed(lambda: hasher.hash('1234'))
+    cores = min(os.cpu_count() or 1, max(int(count) for count in args.workers.split(',')))
+    estimate = best + args.cards * per_hash / cores
+    print(f"\nAt {production_iterations} iterations one hash takes {per_hash * 1000:.1f} ms; "
+          f"importing {args.cards} cards on {cores} core(s) would take about {estimate / 60:.1f} min")
+
+
+if __name__ == '__main__':
+    main()
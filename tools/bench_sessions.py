@@ -0,0 +1,127 @@
+"""
+Concurrent auth session benchmark
+
+Usage:
+  python tools/bench_sessions.py [--terminals 1000] [--threads 8] [--abandon 0.2]
+
+Opens one PIN-entry session per terminal on a single AuthCoordinator, types
+the PINs from several threads at once and submits them, while a share of
+the sessions is abandoned and left to time out. Reports session start and
+key press rates, the peak number of concurrent sessions, how late the
+timeouts fired and memory per open session. Runs against a throwaway
+database with a cheap KDF so verification does not dominate.
+"""
+import argparse
+import contextlib
+import io
+import os
+import sys
+import tempfile
+import threading
+import time
+import tracemalloc
+
+# allow running from repo root
+sys.path.append(os.path.dirname(os.path.dirname(__file__)))
+
+
+class CountingSocketIO:
+    """Stands in for Flask-SocketIO and counts coordinator events."""
+
+    def __init__(self):
+        self.lock = threading.Lock()
+        self.counts = {}
+        self.opened_at = {}
+        self.timeout_lags = []
+
+    def emit(self, event, data=None, **kwargs):
+        with self.lock:
+            self.counts[event] = self.counts.get(event, 0) + 1
+            if event == 'session_ended':
+                self.timeout_lags.append(time.monotonic() - self.opened_at[data['terminal_id']])
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('--terminals', type=int, default=1000, help='concurrent sessions (one per terminal)')
+    parser.add_argument('--threads', type=int, default=8, help='threads typing PINs')
+    parser.add_argument('--abandon', type=float, default=0.2, help='share of sessions left to time out')
+    parser.add_argument('--timeout', type=float, default=5.0, help='PIN-entry timeout in seconds')
+    args = parser.parse_args()
+
+    tmp = tempfile.mkdtemp()
+    os.environ['DATABASE_PATH'] = os.path.join(tmp, 'bench.db')
+    os.environ['PIN_KDF_ITERATIONS'] = '1000'
+    os.environ['PIN_KDF_MAX_PENDING'] = str(args.terminals)
+    os.environ['PIN_ENTRY_TIMEOUT'] = str(args.timeout)
+    os.environ['PRINTER_BACKEND'] = 'file'
+    os.environ['PRINTER_OUTPUT_PATH'] = os.path.join(tmp, 'receipts.bin')
+
+    from app.hardware.coordinator import AuthCoordinator
+    from app.models.database import db
+
+    cards = [(f"card-{i}", f"{i % 10000:04d}".replace('6', '7')) for i in range(args.terminals)]
+    for rfid_uid, pin in cards[:100]:
+        db.add_user(rfid_uid, pin)
+
+    socketio = CountingSocketIO()
+    coordinator = AuthCoordinator(socketio)
+    abandoned = set(range(0, args.terminals, int(1 / args.abandon))) if args.abandon else set()
+
+    with contextlib.redirect_stdout(io.StringIO()):
+        # Open every session
+        tracemalloc.start()
+        before = tracemalloc.get_traced_memory()[0]
+        started = time.perf_counter()
+        for i, (rfid_uid, _) in enumerate(cards):
+            socketio.opened_at[f"kiosk-{i}"] = time.monotonic()
+            coordinator.try_start_session(rfid_uid, terminal_id=f"kiosk-{i}")
+        start_elapsed = time.perf_counter() - started
+        per_session = (tracemalloc.get_traced_memory()[0] - before) / args.terminals
+        tracemalloc.stop()
+        peak = coordinator.get_session_stats()['active']
+
+        # Type and submit the PINs concurrently
+        def type_pins(indexes):
+            for i in indexes:
+                if i in abandoned:
+                    continue
+                terminal_id = f"kiosk-{i}"
+                for key in cards[i][1]:
+                    coordinator.handle_key_press(key, terminal_id)
+                coordinator.handle_key_press("6", terminal_id)
+
+        threads = [
+            threading.Thread(target=type_pins, args=(range(t, args.terminals, args.threads),))
+            for t in range(args.threads)
+        ]
+        started = time.perf_counter()
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+        key_elapsed = time.perf_counter() - started
+        keys = sum(len(cards[i][1]) + 1 for i in range(args.terminals) if i not in abandoned)
+
+        # Wait for the abandoned sessions to expire
+        deadline = time.monotonic() + args.timeout + 10
+        while len(socketio.timeout_lags) < len(abandoned) and time.monotonic() < deadline:
+            time.sleep(0.01)
+        stats = coordinator.get_session_stats()
+        coordinator.shutdown()
+        db.close()
+
+    # Abandoned sessions got no key press, so each expired `timeout` after it opened
+    lags = sorted(lag - args.timeout for lag in socketio.timeout_lags) or [0.0]
+    print(f"Sessions opened: {args.terminals} in {start_elapsed * 1000:.1f} ms "
+          f"({args.terminals / start_elapsed:.0f}/s), peak concurrent {peak}")
+    print(f"Memory per open session: {per_session:.0f} bytes")
+    print(f"Key presses: {keys} from {args.threads} threads in {key_elapsed * 1000:.1f} ms "
+          f"({keys / key_elapsed:.0f}/s)")
+    print(f"Timed out: {stats['timed_out']}/{len(abandoned)}, "
+          f"fired up to {max(lags) * 1000:.1f} ms after the deadline")
+    print(f"Session counters: {stats}")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,378 @@
+"""
+Benchmark suite with regression baselines
+
+Usage:
+  python tools/bench_suite.py run [--groups database,coordinator,api,socketio] [--save results.json]
+  python tools/bench_suite.py run --rows 1000,10000,100000,1000000 --save baseline.json
+  python tools/bench_suite.py run --baseline baseline.json [--threshold 0.15]
+  python tools/bench_suite.py compare baseline.json results.json [--threshold 0.15]
+
+Runs on the sim hardware backend against throwaway databases:
+
+  database     add_user, authenticate_user, log_event (until committed)
+               and a filtered get_logs page, with the users and logs
+               tables prefilled to each --rows size
+  coordinator  complete sessions (tap, PIN, submit, verify, notify,
+               record, print) per second through the AuthCoordinator, and
+               tap to auth_result latency
+  api          requests per second for REST endpoints through the Flask
+               test client
+  socketio     balance_request and withdraw round trips through the
+               Socket.IO test client
+
+Every result is the best of --repeat runs and carries its unit and whether
+higher is better. `compare`, or `run --baseline`, lists each result
+against the baseline and exits with status 1 when one got worse by more
+than --threshold. Baselines are only comparable on the same machine with
+the same settings; the saved file records them, and compare warns when
+they differ. The KDF runs with --kdf-iterations (default 1000) so the
+suite measures this code rather than PBKDF2.
+"""
+import argparse
+import contextlib
+import gc
+import io
+import json
+import os
+import platform
+import random
+import statistics
+import subprocess
+import sys
+import tempfile
+import time
+
+# allow running from repo root
+sys.path.append(os.path.dirname(os.path.dirname(__file__)))
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+GROUPS = ('database', 'coordinator', 'api', 'socketio')
+
+
+class Results:
+    def __init__(self):
+        self.values = {}
+
+    def add(self, name, value, unit, higher_is_better=True):
+        self.values[name] = {'value': round(value, 3), 'unit': unit, 'higher_is_better': higher_is_better}
+        print(f"  {name:44} {value:12.1f} {unit}", file=sys.__stdout__, flush=True)
+
+
+def best_rate(operation, count, repeat):
+    """Calls per second of operation(), best of `repeat` runs of `count` calls."""
+    best = None
+    for _ in range(repeat):
+        # Garbage left by the previous run should not be collected during this one
+        gc.collect()
+        started = time.perf_counter()
+        for _ in range(count):
+            operation()
+        elapsed = time.perf_counter() - started
+        best = elapsed if best is None else min(best, elapsed)
+    return count / best
+
+
+def percentile(values, fraction):
+    ordered = sorted(values)
+    return ordered[min(len(ordered) - 1, int(len(ordered) * fraction))]
+
+
+# =========================
+# GROUPS
+# =========================
+def bench_database(results, args, tmp):
+    from app.models.database import Database
+
+    database = Database(os.path.join(tmp, 'rows.db'))
+    database.ensure_ready()
+    # Prefilled cards share one hash; each was hashed the same way add_user does
+    pin_hash = database.hasher.hash('1234')
+    rng = random.Random(1)
+    added = iter(range(10 ** 9))
+    filled = 0
+
+    for rows in args.rows:
+        prefill(database, filled, rows, pin_hash)
+        filled = rows
+        size = f'{rows}'
+
+        results.add(f'database.add_user@{size}', best_rate(
+            lambda: database.add_user(f'new-{next(added)}', '1234'), args.ops, args.repeat), 'ops/s')
+        results.add(f'database.authenticate_user@{size}', best_rate(
+            lambda: database.authenticate_user(f'card-{rng.randrange(rows)}', '1234'), args.ops, args.repeat),
+            'ops/s')
+
+        def log_batch():
+            for i in range(args.ops):
+                database.log_event(f'card-{i}', True, 'Access granted')
+            database.flush_logs()
+        results.add(f'database.log_event@{size}', best_rate(log_batch, 1, args.repeat) * args.ops, 'events/s')
+        results.add(f'database.get_logs_by_card@{size}', best_rate(
+            lambda: database.get_logs(limit=50, rfid_uid=f'card-{rng.randrange(1000)}'), args.ops, args.repeat),
+            'pages/s')
+    database.close()
+
+
+def prefill(database, start, stop, pin_hash):
+    """Grow the users and logs tables to `stop` rows with bulk inserts."""
+    now = time.time()
+    conn = database.get_connection()
+    try:
+        with conn:
+            cursor = conn.cursor()
+            cursor.executemany(
+                'INSERT INTO users (rfid_uid, pin_hash) VALUES (?, ?)',
+                ((f'card-{i}', pin_hash) for i in range(start, stop))
+            )
+            # One event per second going back from now, over 1000 cards
+            cursor.executemany(
+                'INSERT INTO logs (rfid_uid, success, message, created_at) VALUES (?, ?, ?, ?)',
+                ((f'card-{i % 1000}', i % 10 != 0, 'Access granted' if i % 10 else 'Invalid PIN',
+                  time.strftime('%Y-%m-%d %H:%M:%S', time.gmtime(now - (stop - i))))
+                 for i in range(start, stop))
+            )
+    finally:
+        conn.close()
+
+
+def bench_coordinator(results, args, tmp):
+    from sim_sessions import RecordingSocketIO, build_sessions, run_events
+    from app.hardware.coordinator import AuthCoordinator
+    from app.models.database import db
+
+    cards = [(str(100000000000 + i), f'{i % 10000:04d}'.replace('6', '7')) for i in range(50)]
+    for rfid_uid, pin in cards:
+        db.seed_user(rfid_uid, pin)
+
+    rates = []
+    latencies = []
+    for _ in range(args.repeat):
+        socketio = RecordingSocketIO()
+        coordinator = AuthCoordinator(socketio)
+        coordinator.printer.start()
+        sessions = build_sessions(args.sessions, cards)
+        started = time.perf_counter()
+        run_events(coordinator, sessions)
+        deadline = time.monotonic() + 60
+        with socketio.done:
+            while (socketio.completed() + coordinator.pipeline.notify_stage.dropped < len(sessions)
+                   and time.monotonic() < deadline):
+                socketio.done.wait(0.1)
+        rates.append(socketio.completed() / (time.perf_counter() - started))
+        latencies.extend(socketio.latencies)
+        coordinator.shutdown()
+
+    results.add('coordinator.sessions', max(rates), 'sessions/s')
+    results.add('coordinator.tap_to_auth_result_p50', statistics.median(latencies) * 1000, 'ms', False)
+    results.add('coordinator.tap_to_auth_result_p95', percentile(latencies, 0.95) * 1000, 'ms', False)
+
+
+def bench_api(results, args, tmp):
+    from app import create_app
+    from app.models.database import db
+
+    app, _ = create_app()
+    client = app.test_client()
+    db.seed_user('123456789', '1234')
+    for i in range(200):
+        db.log_event('123456789', i % 5 != 0, 'Access granted')
+    db.flush_logs()
+
+    endpoints = [
+        ('status', 'GET', '/api/status', None),
+        ('logs', 'GET', '/api/logs?limit=50', None),
+        ('logs_stats', 'GET', '/api/logs/stats', None),
+        ('account', 'GET', '/api/account/1234', None),
+        ('transaction', 'POST', '/api/transaction', {'account_id': '1234', 'amount': 0.01}),
+        ('metrics', 'GET', '/api/metrics', None),
+        ('index', 'GET', '/', None)
+    ]
+    for name, method, path, body in endpoints:
+        def call():
+            response = client.open(path, method=method, json=body)
+            if response.status_code >= 400:
+                raise RuntimeError(f"{method} {path} returned {response.status_code}")
+        results.add(f'api.{name}', best_rate(call, args.ops, args.repeat), 'req/s')
+
+
+def bench_socketio(results, args, tmp):
+    from app import create_app
+
+    app, socketio = create_app()
+    client = socketio.test_client(app)
+    client.get_received()
+
+    events = [
+        ('balance_request', {'account_id': '1234'}, 'balance_response'),
+        ('withdraw', {'account_id': '1234', 'amount': 0.01}, 'transaction_result')
+    ]
+    for event, data, reply in events:
+        round_trips = []
+
+        def round_trip():
+            started = time.perf_counter()
+            client.emit(event, data)
+            received = client.get_received()
+            round_trips.append(time.perf_counter() - started)
+            if not any(message['name'] == reply for message in received):
+                raise RuntimeError(f"no {reply} for {event}")
+        results.add(f'socketio.{event}', best_rate(round_trip, args.ops, args.repeat), 'round trips/s')
+        results.add(f'socketio.{event}_p95', percentile(round_trips, 0.95) * 1000, 'ms', False)
+    client.disconnect()
+
+
+BENCHMARKS = {
+    'database': bench_database,
+    'coordinator': bench_coordinator,
+    'api': bench_api,
+    'socketio': bench_socketio
+}
+
+
+# =========================
+# BASELINES
+# =========================
+def environment(args):
+    try:
+        commit = subprocess.run(['git', 'rev-parse', '--short', 'HEAD'], cwd=ROOT,
+                                capture_output=True, text=True).stdout.strip()
+    except OSError:
+        commit = ''
+    return {
+        'commit': commit,
+        'created_at': time.strftime('%Y-%m-%dT%H:%M:%SZ', time.gmtime()),
+        'host': platform.node(),
+        'machine': platform.machine(),
+        'python': platform.python_version(),
+        'cpus': os.cpu_count(),
+        'settings': {
+            'kdf_iterations': args.kdf_iterations,
+            'ops': args.ops,
+            'sessions': args.sessions,
+            'repeat': args.repeat
+        }
+    }
+
+
+def compare(baseline, current, threshold):
+    """
+    Print every result against the baseline.
+
+    Returns:
+        list: names of results that got worse by more than threshold
+    """
+    if baseline.get('environment', {}).get('settings') != current.get('environment', {}).get('settings'):
+        print("WARNING: baseline was recorded with different settings; results may not be comparable")
+    for key in ('host', 'python'):
+        if baseline.get('environment', {}).get(key) != current.get('environment', {}).get(key):
+            print(f"WARNING: baseline {key} differs ({baseline['environment'].get(key)} vs "
+                  f"{current['environment'].get(key)})")
+
+    regressions = []
+    print(f"{'benchmark':44} {'baseline':>12} {'current':>12} {'change':>8}")
+    for name, result in current['results'].items():
+        known = baseline['results'].get(name)
+        if known is None or not known['value']:
+            print(f"{name:44} {'-':>12} {result['value']:12.1f} {'new':>8}")
+            continue
+        change = (result['value'] - known['value']) / known['value']
+        # Positive when the result got worse
+        worse = -change if result['higher_is_better'] else change
+        flag = ''
+        if worse > threshold:
+            flag = '  REGRESSION'
+            regressions.append(name)
+        elif worse < -threshold:
+            flag = '  improved'
+        print(f"{name:44} {known['value']:12.1f} {result['value']:12.1f} {change:+8.1%}{flag}")
+    for name in baseline['results']:
+        if name not in current['results']:
+            print(f"{name:44} {baseline['results'][name]['value']:12.1f} {'-':>12} {'missing':>8}")
+    return regressions
+
+
+def report(regressions, threshold):
+    if regressions:
+        print(f"\n{len(regressions)} regression(s) beyond {threshold:.0%}: {', '.join(regressions)}")
+        return 1
+    print(f"\nNo regressions beyond {threshold:.0%}")
+    return 0
+
+
+def load(path):
+    with open(path) as f:
+        return json.load(f)
+
+
+def run(args):
+    tmp = tempfile.mkdtemp(prefix='bench-suite-')
+    os.environ['DATABASE_PATH'] = os.path.join(tmp, 'bench.db')
+    os.environ['HARDWARE_BACKEND'] = 'sim'
+    os.environ['PRINTER_BACKEND'] = 'file'
+    os.environ['PRINTER_OUTPUT_PATH'] = os.path.join(tmp, 'receipts.bin')
+    os.environ['PIN_KDF_ITERATIONS'] = str(args.kdf_iterations)
+    os.environ['PIN_KDF_MAX_PENDING'] = str(max(args.sessions, 16))
+
+    groups = [group.strip() for group in args.groups.split(',') if group.strip()]
+    unknown = set(groups) - set(GROUPS)
+    if unknown:
+        print(f"Unknown groups: {', '.join(sorted(unknown))} (choose from {', '.join(GROUPS)})")
+        return 2
+
+    results = Results()
+    for group in groups:
+        print(f"[{group}]", flush=True)
+        # Receipts, key presses and connection messages would drown the report
+        with contextlib.redirect_stdout(io.StringIO()):
+            BENCHMARKS[group](results, args, tmp)
+
+    from app.hardware.coordinator import get_coordinator
+    from app.models.database import db
+    if 'api' in groups or 'socketio' in groups:
+        # The app's coordinator spools receipts; stop it before the database closes
+        get_coordinator(None).shutdown()
+    db.close()
+
+    current = {'environment': environment(args), 'results': results.values}
+    if args.save:
+        with open(args.save, 'w') as f:
+            json.dump(current, f, indent=2)
+        print(f"\nSaved {len(results.values)} results to {args.save}")
+    if args.baseline:
+        print()
+        return report(compare(load(args.baseline), current, args.threshold), args.threshold)
+    return 0
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    commands = parser.add_subparsers(dest='command', required=True)
+
+    run_parser = commands.add_parser('run', help='run the benchmarks')
+    run_parser.add_argument('--groups', default=','.join(GROUPS), help='comma-separated benchmark groups')
+    run_parser.add_argument('--rows', default='1000,10000,100000',
+                            help='table sizes for the database group (up to 1000000)')
+    run_parser.add_argument('--ops', type=int, default=200, help='calls per measurement')
+    run_parser.add_argument('--sessions', type=int, default=500, help='sessions per coordinator run')
+    run_parser.add_argument('--repeat', type=int, default=5, help='runs per measurement; the best is kept')
+    run_parser.add_argument('--kdf-iterations', type=int, default=1000, help='PBKDF2 iterations')
+    run_parser.add_argument('--save', help='write the results to this JSON file')
+    run_parser.add_argument('--baseline', help='compare the results with this JSON file')
+    run_parser.add_argument('--threshold', type=float, default=0.15, help='allowed slowdown (0.15 = 15%%)')
+
+    compare_parser = commands.add_parser('compare', help='compare two saved result files')
+    compare_parser.add_argument('baseline')
+    compare_parser.add_argument('current')
+    compare_parser.add_argument('--threshold', type=float, default=0.15, help='allowed slowdown (0.15 = 15%%)')
+
+    args = parser.parse_args()
+    if args.command == 'compare':
+        regressions = compare(load(args.baseline), load(args.current), args.threshold)
+        return report(regressions, args.threshold)
+
+    args.rows = [int(rows) for rows in args.rows.split(',')]
+    return run(args)
+
+
+if __name__ == '__main__':
+    sys.exit(main())
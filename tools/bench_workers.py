@@ -0,0 +1,141 @@
+"""
+Web worker scaling benchmark for the split deployment
+
+Usage:
+  python tools/bench_workers.py [--workers 1 2 4] [--clients 8] [--duration 5] [--path /api/account/1234]
+
+Starts run.py with WEB_WORKERS set to each value in turn (simulated
+hardware, throwaway database) and drives it with HTTP keep-alive clients,
+one process each, for a fixed time. Reports requests per second, latency
+percentiles and the speed-up over the first worker count. Requests that
+need the hardware process (e.g. /api/auth/sessions) also measure the
+broker round trip.
+"""
+import argparse
+import http.client
+import multiprocessing
+import os
+import signal
+import socket
+import subprocess
+import sys
+import tempfile
+import time
+
+# allow running from repo root
+sys.path.append(os.path.dirname(os.path.dirname(__file__)))
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+
+def client(port, path, duration, results):
+    conn = http.client.HTTPConnection('127.0.0.1', port, timeout=10)
+    latencies = []
+    errors = 0
+    deadline = time.perf_counter() + duration
+    while time.perf_counter() < deadline:
+        started = time.perf_counter()
+        try:
+            conn.request('GET', path)
+            response = conn.getresponse()
+            response.read()
+            if response.status != 200:
+                errors += 1
+        except (OSError, http.client.HTTPException):
+            errors += 1
+            conn.close()
+            conn = http.client.HTTPConnection('127.0.0.1', port, timeout=10)
+            continue
+        latencies.append(time.perf_counter() - started)
+    results.put((latencies, errors))
+
+
+def wait_until_serving(port, path, timeout=60):
+    deadline = time.monotonic() + timeout
+    while time.monotonic() < deadline:
+        try:
+            conn = http.client.HTTPConnection('127.0.0.1', port, timeout=2)
+            conn.request('GET', path)
+            if conn.getresponse().status == 200:
+                return
+        except (OSError, http.client.HTTPException):
+            pass
+        time.sleep(0.2)
+    raise RuntimeError('cluster did not start')
+
+
+def free_port():
+    with socket.socket() as sock:
+        sock.bind(('127.0.0.1', 0))
+        return sock.getsockname()[1]
+
+
+def run(workers, args):
+    tmp = tempfile.mkdtemp()
+    port = free_port()
+    env = dict(
+        os.environ,
+        WEB_WORKERS=str(workers),
+        WEB_PORT=str(port),
+        SOCKETIO_ASYNC_MODE=args.mode,
+        BROKER_SOCKET=os.path.join(tmp, 'broker.sock'),
+        DATABASE_PATH=os.path.join(tmp, 'bench.db'),
+        HARDWARE_BACKEND='sim',
+        PRINTER_BACKEND='file',
+        PRINTER_OUTPUT_PATH=os.path.join(tmp, 'receipts.bin')
+    )
+    cluster = subprocess.Popen(
+        [sys.executable, os.path.join(ROOT, 'run.py')],
+        env=env, stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL
+    )
+    try:
+        wait_until_serving(port, args.path)
+        results = multiprocessing.Queue()
+        clients = [
+            multiprocessing.Process(target=client, args=(port, args.path, args.duration, results))
+            for _ in range(args.clients)
+        ]
+        for process in clients:
+            process.start()
+        latencies, errors = [], 0
+        for _ in clients:
+            client_latencies, client_errors = results.get()
+            latencies += client_latencies
+            errors += client_errors
+        for process in clients:
+            process.join()
+    finally:
+        cluster.send_signal(signal.SIGTERM)
+        try:
+            cluster.wait(20)
+        except subprocess.TimeoutExpired:
+            cluster.kill()
+
+    latencies.sort()
+    latencies = latencies or [float('nan')]
+    rate = len(latencies) / args.duration
+    p50 = latencies[len(latencies) // 2] * 1000
+    p99 = latencies[min(len(latencies) - 1, int(len(latencies) * 0.99))] * 1000
+    return rate, p50, p99, errors
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('--workers', nargs='+', type=int, default=[1, 2, 4], help='web worker counts to compare')
+    parser.add_argument('--clients', type=int, default=8, help='concurrent HTTP clients')
+    parser.add_argument('--duration', type=float, default=5.0, help='seconds per run')
+    parser.add_argument('--path', default='/api/account/1234', help='endpoint to request')
+    parser.add_argument('--mode', default='eventlet', help='SOCKETIO_ASYNC_MODE of the web workers')
+    args = parser.parse_args()
+
+    print(f"{os.cpu_count()} CPUs, {args.clients} clients, GET {args.path}, {args.mode} workers")
+    baseline = None
+    for workers in args.workers:
+        rate, p50, p99, errors = run(workers, args)
+        baseline = baseline or rate
+        print(f"  {workers} workers: {rate:8.0f} req/s  p50 {p50:6.2f} ms  p99 {p99:6.2f} ms  "
+              f"errors {errors}  x{rate / baseline:.2f}")
+
+
+if __name__ == '__main__':
+    main()
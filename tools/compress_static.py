@@ -0,0 +1,40 @@
+"""
+Precompress the React build
+
+Usage:
+  python tools/compress_static.py [--root app/static] [--min-size 1024]
+
+Writes a .gz variant (and a .br variant when the brotli package is
+installed) next to every compressible file of the build, so the server can
+send compressed bytes without compressing per request. Run by
+frontend/build.sh after the build is copied; unchanged files are skipped.
+"""
+import argparse
+import os
+import sys
+
+# allow running from repo root
+sys.path.append(os.path.dirname(os.path.dirname(__file__)))
+
+from app.api.assets import brotli, precompress
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('--root', default=os.path.join(ROOT, 'app', 'static'), help='build directory')
+    parser.add_argument('--min-size', type=int, default=1024, help='smaller files are left uncompressed')
+    args = parser.parse_args()
+
+    if brotli is None:
+        print("brotli not installed, writing gzip variants only")
+    written = precompress(args.root, args.min_size)
+    for path, encoding, size, compressed in written:
+        print(f"  {os.path.relpath(path, args.root)} {encoding}: {size} -> {compressed} bytes "
+              f"({compressed / size:.0%})")
+    print(f"{len(written)} variants written")
+
+
+if __name__ == '__main__':
+    main()
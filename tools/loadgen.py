@@ -0,0 +1,355 @@
+"""
+Socket.IO and REST load generator
+
+Usage:
+  python tools/loadgen.py [--url http://127.0.0.1:5000] [--clients 20] [--rate 2] [--duration 30]
+  python tools/loadgen.py --ramp --slo-p95-ms 250 [--start 5] [--step 5] [--max-clients 200] [--step-duration 15]
+
+Opens --clients concurrent Socket.IO clients against a running appliance
+(python run.py, any async mode or WEB_WORKERS setting). Each client sends
+--rate operations per second, cycling through --mix:
+
+  balance   balance_request, answered by balance_response
+  withdraw  withdraw, answered by transaction_result
+  account   GET /api/account/<id>
+  transfer  POST /api/transaction
+
+Sends follow a fixed schedule. A client that falls behind sends at once
+and its latency is counted from the scheduled time, so a slow server
+cannot hide its queueing delay. Each client waits for one reply before
+its next send. Every --interval seconds a line shows throughput, p50, p95
+and p99 latency and the error rate. At the end a summary per operation is
+printed. Withdrawals refused for lack of funds count as declined, not as
+errors.
+
+With --ramp, clients are added --step at a time. After each step,
+measured over --step-duration seconds, the run checks p95 against
+--slo-p95-ms and errors against --max-error-rate. It stops at the first
+step that misses either and reports the last passing step as the
+capacity.
+
+Needs the Socket.IO client transports: pip install requests websocket-client
+"""
+import argparse
+import http.client
+import itertools
+import json
+import os
+import random
+import sys
+import threading
+import time
+from urllib.parse import urlparse
+
+# allow running from repo root
+sys.path.append(os.path.dirname(os.path.dirname(__file__)))
+
+try:
+    import requests
+    import socketio
+except ImportError:
+    requests = None
+
+OPERATIONS = ('balance', 'withdraw', 'account', 'transfer')
+FAILURES = ('error', 'timeout')
+
+
+class Recorder:
+    """Samples from every client: (finished at, operation, latency, outcome)."""
+
+    def __init__(self):
+        self.lock = threading.Lock()
+        self.samples = []
+
+    def record(self, operation, latency, outcome):
+        with self.lock:
+            self.samples.append((time.monotonic(), operation, latency, outcome))
+
+    def between(self, start, end=None):
+        with self.lock:
+            samples = list(self.samples)
+        return [sample for sample in samples if sample[0] >= start and (end is None or sample[0] < end)]
+
+
+def percentile(ordered, fraction):
+    if not ordered:
+        return float('nan')
+    return ordered[min(len(ordered) - 1, int(len(ordered) * fraction))]
+
+
+def summarize(samples, seconds):
+    latencies = sorted(sample[2] for sample in samples)
+    failed = sum(1 for sample in samples if sample[3] in FAILURES)
+    return {
+        'count': len(samples),
+        'throughput': len(samples) / seconds if seconds else 0.0,
+        'p50_ms': percentile(latencies, 0.50) * 1000,
+        'p95_ms': percentile(latencies, 0.95) * 1000,
+        'p99_ms': percentile(latencies, 0.99) * 1000,
+        'error_rate': failed / len(samples) if samples else 0.0,
+        'declined': sum(1 for sample in samples if sample[3] == 'declined')
+    }
+
+
+class LoadClient(threading.Thread):
+    def __init__(self, index, args, recorder):
+        super().__init__(name=f'loadgen-{index}', daemon=True)
+        self.args = args
+        self.recorder = recorder
+        self.running = True
+        self.connected = threading.Event()
+        self.failed = None
+        url = urlparse(args.url)
+        self.host, self.port = url.hostname, url.port or 80
+        # Clients start at different points of the mix and of the first interval
+        self.mix = itertools.islice(itertools.cycle(args.mix), index % len(args.mix), None)
+        self.offset = random.Random(index).random() / args.rate
+        self.replies = {'balance_response': [threading.Event(), None],
+                        'transaction_result': [threading.Event(), None]}
+        self.sio = socketio.Client(reconnection=False)
+        for event in self.replies:
+            self.sio.on(event, self._reply_handler(event))
+        self.http = None
+
+    def _reply_handler(self, event):
+        def handler(data):
+            waiter = self.replies[event]
+            waiter[1] = data
+            waiter[0].set()
+        return handler
+
+    def stop(self):
+        self.running = False
+
+    def run(self):
+        try:
+            self.sio.connect(self.args.url, transports=self.args.transports, wait_timeout=self.args.timeout)
+        except Exception as e:
+            self.failed = str(e)
+            self.connected.set()
+            return
+        self.connected.set()
+
+        interval = 1 / self.args.rate
+        next_at = time.monotonic() + self.offset
+        while self.running:
+            delay = next_at - time.monotonic()
+            if delay > 0:
+                time.sleep(delay)
+            if not self.running:
+                break
+            operation = next(self.mix)
+            outcome = self._perform(operation)
+            # Measured from the scheduled send, not from when we got round to it
+            self.recorder.record(operation, time.monotonic() - next_at, outcome)
+            next_at += interval
+
+        self.sio.disconnect()
+        if self.http is not None:
+            self.http.close()
+
+    def _perform(self, operation):
+        try:
+            if operation == 'balance':
+                return self._emit('balance_request', {'account_id': self.args.account}, 'balance_response')
+            if operation == 'withdraw':
+                return self._emit('withdraw', {'account_id': self.args.account, 'amount': self.args.amount},
+                                  'transaction_result')
+            if operation == 'account':
+                return self._request('GET', f'/api/account/{self.args.account}')
+            return self._request('POST', '/api/transaction',
+                                 {'account_id': self.args.account, 'amount': self.args.amount})
+        except Exception:
+            return 'error'
+
+    def _emit(self, event, data, reply):
+        waiter = self.replies[reply]
+        waiter[0].clear()
+        self.sio.emit(event, data)
+        if not waiter[0].wait(self.args.timeout):
+            return 'timeout'
+        payload = waiter[1] or {}
+        if payload.get('error'):
+            return 'error'
+        if payload.get('success') is False:
+            return 'declined' if payload.get('message') == 'Insufficient funds' else 'error'
+        return 'ok'
+
+    def _request(self, method, path, body=None):
+        if self.http is None:
+            self.http = http.client.HTTPConnection(self.host, self.port, timeout=self.args.timeout)
+        headers = {}
+        data = None
+        if body is not None:
+            data = json.dumps(body)
+            headers['Content-Type'] = 'application/json'
+        try:
+            self.http.request(method, path, body=data, headers=headers)
+            response = self.http.getresponse()
+            response.read()
+        except TimeoutError:
+            self.http.close()
+            self.http = None
+            return 'timeout'
+        except (OSError, http.client.HTTPException):
+            # Reconnect on the next request
+            self.http.close()
+            self.http = None
+            return 'error'
+        if response.status == 409:
+            return 'declined'
+        return 'ok' if response.status < 400 else 'error'
+
+
+class LoadGenerator:
+    def __init__(self, args):
+        self.args = args
+        self.recorder = Recorder()
+        self.clients = []
+        self.connect_failures = 0
+
+    def add_clients(self, count):
+        started = []
+        for _ in range(count):
+            client = LoadClient(len(self.clients) + len(started), self.args, self.recorder)
+            client.start()
+            started.append(client)
+        for client in started:
+            client.connected.wait(self.args.timeout + 5)
+            if client.failed is not None:
+                self.connect_failures += 1
+                print(f"  client {client.name} failed to connect: {client.failed}")
+            else:
+                self.clients.append(client)
+
+    def stop(self):
+        for client in self.clients:
+            client.stop()
+        for client in self.clients:
+            client.join(self.args.timeout + 1)
+
+    def run_for(self, seconds):
+        """Run the current clients for `seconds`, printing a line per --interval; returns the start time."""
+        start = time.monotonic()
+        end = start + seconds
+        window_start = start
+        while True:
+            now = time.monotonic()
+            if now >= end:
+                break
+            time.sleep(min(self.args.interval, end - now))
+            now = time.monotonic()
+            stats = summarize(self.recorder.between(window_start, now), now - window_start)
+            print(f"  {now - start:6.1f}s {len(self.clients):5d} clients {stats['throughput']:8.1f} ops/s "
+                  f"p50 {stats['p50_ms']:7.1f} p95 {stats['p95_ms']:7.1f} p99 {stats['p99_ms']:7.1f} ms "
+                  f"errors {stats['error_rate']:6.1%}", flush=True)
+            window_start = now
+        return start
+
+
+def print_summary(recorder, start, end):
+    seconds = end - start
+    samples = recorder.between(start, end)
+    print(f"\n{'operation':10} {'count':>7} {'ops/s':>8} {'p50 ms':>8} {'p95 ms':>8} {'p99 ms':>8} "
+          f"{'errors':>7} {'declined':>8}")
+    for operation in OPERATIONS + ('total',):
+        selected = samples if operation == 'total' else [s for s in samples if s[1] == operation]
+        if not selected:
+            continue
+        stats = summarize(selected, seconds)
+        print(f"{operation:10} {stats['count']:7d} {stats['throughput']:8.1f} {stats['p50_ms']:8.1f} "
+              f"{stats['p95_ms']:8.1f} {stats['p99_ms']:8.1f} {stats['error_rate']:7.1%} {stats['declined']:8d}")
+
+
+def run_fixed(generator, args):
+    print(f"Connecting {args.clients} clients to {args.url}")
+    generator.add_clients(args.clients)
+    if not generator.clients:
+        return 1
+    print(f"Running {args.duration:g}s at {args.rate:g} ops/s per client ({', '.join(args.mix)})")
+    start = generator.run_for(args.duration)
+    end = time.monotonic()
+    generator.stop()
+    print_summary(generator.recorder, start, end)
+    return 0
+
+
+def run_ramp(generator, args):
+    print(f"Ramping from {args.start} clients by {args.step} until p95 > {args.slo_p95_ms:g} ms "
+          f"or errors > {args.max_error_rate:.1%} ({args.rate:g} ops/s per client)")
+    steps = []
+    target = args.start
+    while target <= args.max_clients:
+        generator.add_clients(target - len(generator.clients))
+        if not generator.clients:
+            return 1
+        print(f"Step: {len(generator.clients)} clients")
+        start = generator.run_for(args.step_duration)
+        end = time.monotonic()
+        stats = summarize(generator.recorder.between(start, end), end - start)
+        stats['clients'] = len(generator.clients)
+        stats['passed'] = (stats['p95_ms'] <= args.slo_p95_ms and stats['error_rate'] <= args.max_error_rate)
+        steps.append(stats)
+        if not stats['passed'] or generator.connect_failures:
+            break
+        target += args.step
+    generator.stop()
+
+    print(f"\n{'clients':>7} {'ops/s':>8} {'p50 ms':>8} {'p95 ms':>8} {'p99 ms':>8} {'errors':>7}  SLO")
+    for stats in steps:
+        print(f"{stats['clients']:7d} {stats['throughput']:8.1f} {stats['p50_ms']:8.1f} {stats['p95_ms']:8.1f} "
+              f"{stats['p99_ms']:8.1f} {stats['error_rate']:7.1%}  {'pass' if stats['passed'] else 'FAIL'}")
+    passed = [stats for stats in steps if stats['passed']]
+    if not passed:
+        print(f"\nCapacity: below {args.start} clients (the first step missed the SLO)")
+    elif passed[-1] is steps[-1]:
+        print(f"\nCapacity: at least {passed[-1]['clients']} clients, {passed[-1]['throughput']:.1f} ops/s "
+              f"(SLO still met at the last step)")
+    else:
+        print(f"\nCapacity: {passed[-1]['clients']} clients, {passed[-1]['throughput']:.1f} ops/s "
+              f"at p95 {passed[-1]['p95_ms']:.1f} ms (SLO {args.slo_p95_ms:g} ms)")
+    return 0
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('--url', default='http://127.0.0.1:5000', help='appliance base URL')
+    parser.add_argument('--clients', type=int, default=20, help='concurrent clients (fixed load)')
+    parser.add_argument('--rate', type=float, default=2.0, help='operations per second per client')
+    parser.add_argument('--duration', type=float, default=30.0, help='seconds to run (fixed load)')
+    parser.add_argument('--mix', default=','.join(OPERATIONS), help='comma-separated operations to cycle through')
+    parser.add_argument('--account', default='1234', help='account used by every operation')
+    parser.add_argument('--amount', type=float, default=0.01, help='amount per withdrawal')
+    parser.add_argument('--interval', type=float, default=5.0, help='seconds between progress lines')
+    parser.add_argument('--timeout', type=float, default=10.0, help='seconds to wait for a reply')
+    parser.add_argument('--transports', default='polling,websocket',
+                        help='Socket.IO transports (websocket only for WEB_WORKERS > 0)')
+    parser.add_argument('--ramp', action='store_true', help='add clients until the SLO is missed')
+    parser.add_argument('--start', type=int, default=5, help='clients in the first ramp step')
+    parser.add_argument('--step', type=int, default=5, help='clients added per ramp step')
+    parser.add_argument('--max-clients', type=int, default=200, help='stop ramping here')
+    parser.add_argument('--step-duration', type=float, default=15.0, help='seconds per ramp step')
+    parser.add_argument('--slo-p95-ms', type=float, default=250.0, help='p95 latency objective')
+    parser.add_argument('--max-error-rate', type=float, default=0.01, help='error rate objective')
+    args = parser.parse_args()
+
+    if requests is None:
+        print("The Socket.IO client needs: pip install requests websocket-client")
+        return 2
+    args.mix = [operation.strip() for operation in args.mix.split(',') if operation.strip()]
+    unknown = set(args.mix) - set(OPERATIONS)
+    if unknown or not args.mix:
+        print(f"Unknown operations: {', '.join(sorted(unknown))} (choose from {', '.join(OPERATIONS)})")
+        return 2
+    args.transports = [transport.strip() for transport in args.transports.split(',')]
+
+    generator = LoadGenerator(args)
+    try:
+        return run_ramp(generator, args) if args.ramp else run_fixed(generator, args)
+    except KeyboardInterrupt:
+        generator.stop()
+        return 130
+
+
+if __name__ == '__main__':
+    sys.exit(main())
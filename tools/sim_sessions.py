@@ -0,0 +1,197 @@
+"""
+Simulated auth session load test
+
+Usage:
+  python tools/sim_sessions.py [--sessions 2000] [--cards 50] [--via events]
+  python tools/sim_sessions.py --via hardware --sessions 20 --speed 5
+  python tools/sim_sessions.py --trace sessions.trace --via hardware
+
+Runs full authentication sessions (card tap, PIN digits, submit) through
+the real AuthCoordinator, auth pipeline, database and print spooler on
+the sim hardware backend, against a throwaway database.
+
+  --via hardware  plays the sessions as a trace on the simulated MFRC522
+                  and keypad matrix, read by the real RFIDReader and Keypad
+                  threads on the virtual clock (--speed accelerates it)
+  --via events    delivers the same taps and keys straight to the
+                  coordinator callbacks the reader threads would call, which
+                  is how thousands of sessions per second are reached
+
+Hardware mode compresses every poll, debounce and hold time by --speed,
+so at high speeds the host's sleep jitter (a 1 ms sleep occasionally
+taking 10+ ms) can make the keypad miss a simulated press.
+
+Every tenth session uses a wrong PIN. Reports sessions per second, tap to
+auth_result latency and how many receipts reached the simulated printer.
+"""
+import argparse
+import contextlib
+import io
+import os
+import statistics
+import sys
+import tempfile
+import threading
+import time
+
+# allow running from repo root
+sys.path.append(os.path.dirname(os.path.dirname(__file__)))
+
+
+class RecordingSocketIO:
+    """Stands in for Flask-SocketIO and timestamps coordinator events."""
+
+    def __init__(self):
+        self.lock = threading.Lock()
+        self.tapped_at = {}
+        self.latencies = []
+        self.results = {'granted': 0, 'denied': 0, 'busy': 0, 'error': 0}
+        self.done = threading.Condition(self.lock)
+
+    def emit(self, event, data=None, **kwargs):
+        if event == 'request_pin':
+            with self.lock:
+                self.tapped_at.setdefault(data['rfid_uid'], []).append(time.perf_counter())
+        elif event == 'auth_result':
+            with self.lock:
+                taps = self.tapped_at.get(data['rfid_uid'])
+                if taps:
+                    self.latencies.append(time.perf_counter() - taps.pop(0))
+                if data['success']:
+                    self.results['granted'] += 1
+                elif data['message'] == 'Invalid PIN':
+                    self.results['denied'] += 1
+                elif 'busy' in data['message']:
+                    self.results['busy'] += 1
+                else:
+                    self.results['error'] += 1
+                self.done.notify_all()
+
+    def completed(self):
+        return sum(self.results.values())
+
+
+def build_sessions(count, cards):
+    """(rfid_uid, pin) per session; every tenth PIN is wrong."""
+    sessions = []
+    for i in range(count):
+        rfid_uid, pin = cards[i % len(cards)]
+        if i % 10 == 9:
+            pin = '0000' if pin != '0000' else '1111'
+        sessions.append((rfid_uid, pin))
+    return sessions
+
+
+def run_events(coordinator, sessions):
+    for rfid_uid, pin in sessions:
+        coordinator.handle_rfid_detected(rfid_uid)
+        for key in pin:
+            coordinator.handle_key_press(key)
+        coordinator.handle_key_press('6')
+
+
+def run_hardware(backend, coordinator, trace):
+    from app.hardware.keypad import Keypad
+    from app.hardware.rfid_reader import RFIDReader
+
+    rfid_reader = RFIDReader(coordinator, backend=backend)
+    keypad = Keypad(coordinator, backend=backend)
+    coordinator.set_hardware_components(rfid_reader, keypad)
+    rfid_reader.start()
+    keypad.start()
+    try:
+        backend.play(trace)
+    finally:
+        rfid_reader.stop()
+        keypad.stop()
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('--sessions', type=int, default=2000, help='auth sessions to run')
+    parser.add_argument('--cards', type=int, default=50, help='distinct enrolled cards')
+    parser.add_argument('--via', choices=('events', 'hardware'), default='events')
+    parser.add_argument('--speed', type=float, default=5.0, help='virtual clock speed (hardware mode)')
+    parser.add_argument('--session-gap', type=float, default=2.5,
+                        help='virtual seconds between taps (hardware mode)')
+    parser.add_argument('--trace', help='play this trace file instead of generated sessions (hardware mode)')
+    parser.add_argument('--kdf-iterations', type=int, default=1000,
+                        help='PBKDF2 iterations; the production cost limits the run to tens of sessions per second')
+    parser.add_argument('--timeout', type=float, default=60.0, help='seconds to wait for results')
+    args = parser.parse_args()
+
+    tmp = tempfile.mkdtemp()
+    os.environ['DATABASE_PATH'] = os.path.join(tmp, 'sim.db')
+    os.environ['PIN_KDF_ITERATIONS'] = str(args.kdf_iterations)
+    os.environ['PIN_KDF_MAX_PENDING'] = str(max(args.sessions, 16))
+    os.environ['PRINTER_BACKEND'] = 'usb'
+
+    from app.hardware.backends import set_backend
+    from app.hardware.backends.sim import SimBackend, load_trace, session_trace
+
+    backend = set_backend(SimBackend(clock_speed=args.speed))
+
+    from app.hardware.coordinator import AuthCoordinator
+    from app.models.database import db
+
+    # '6' is the submit key, so it cannot appear in a PIN typed on the keypad
+    cards = [(str(100000000000 + i), f"{i % 10000:04d}".replace('6', '7')) for i in range(args.cards)]
+    for rfid_uid, pin in cards:
+        db.add_user(rfid_uid, pin)
+
+    socketio = RecordingSocketIO()
+    coordinator = AuthCoordinator(socketio, clock=backend.clock)
+    coordinator.printer.start()
+
+    if args.trace:
+        trace = load_trace(args.trace)
+        expected = sum(1 for _, action, argument in trace if action == 'key' and argument == '6')
+    else:
+        sessions = build_sessions(args.sessions, cards)
+        trace = []
+        for i, (rfid_uid, pin) in enumerate(sessions):
+            trace.extend(session_trace(rfid_uid, pin, start=i * args.session_gap))
+        expected = len(sessions)
+
+    # Per-key and per-receipt console output would dominate the timing
+    with contextlib.redirect_stdout(io.StringIO()):
+        started = time.perf_counter()
+        if args.via == 'events' and not args.trace:
+            run_events(coordinator, sessions)
+        else:
+            run_hardware(backend, coordinator, trace)
+
+        deadline = time.monotonic() + args.timeout
+        notify_stage = coordinator.pipeline.notify_stage
+        with socketio.done:
+            # A full notify queue drops results rather than blocking the keypad
+            while (socketio.completed() + notify_stage.dropped < expected
+                   and time.monotonic() < deadline):
+                socketio.done.wait(0.1)
+        elapsed = time.perf_counter() - started
+
+        # Receipts trail the results; give the spooler time to drain
+        while time.monotonic() < deadline:
+            if backend.printer and backend.printer.writes >= expected - coordinator.pipeline.print_stage.dropped:
+                break
+            time.sleep(0.05)
+        coordinator.shutdown()
+        db.close()
+
+    completed = socketio.completed()
+    latencies = sorted(socketio.latencies) or [float('nan')]
+    printed = backend.printer.writes if backend.printer else 0
+    print(f"Mode: {args.via} (clock x{backend.clock.speed:g}), KDF iterations {args.kdf_iterations}")
+    print(f"Sessions: {completed}/{expected} in {elapsed:.2f}s ({completed / elapsed:.0f}/s)")
+    print(f"Results: {socketio.results}")
+    p99 = latencies[min(len(latencies) - 1, int(len(latencies) * 0.99))]
+    print(f"Tap to auth_result: p50 {statistics.median(latencies) * 1000:.1f} ms, p99 {p99 * 1000:.1f} ms")
+    print(f"Receipts printed: {printed}")
+    dropped = {stage.name: stage.dropped for stage in coordinator.pipeline.stages if stage.dropped}
+    if dropped:
+        print(f"Dropped by full pipeline stages: {dropped}")
+    return 0 if completed == expected else 1
+
+
+if __name__ == '__main__':
+    sys.exit(main())